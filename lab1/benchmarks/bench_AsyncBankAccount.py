@@ -0,0 +1,34 @@
+import asyncio
+import statistics
+import time
+
+from src.BankAccount import AsyncBankAccount
+
+
+async def run(concurrency, operations=20):
+    account = AsyncBankAccount(0)
+    latencies = []
+
+    async def client():
+        for _ in range(operations):
+            start = time.perf_counter()
+            await account.deposit(1)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)]
+    print(f"{concurrency:>6} coroutines: {len(latencies) / elapsed:,.0f} op/s, "
+          f"p50 {statistics.median(latencies) * 1e6:.1f} us, p99 {p99 * 1e6:.1f} us, "
+          f"balance OK: {account.get_balance() == concurrency * operations}")
+
+
+def main():
+    for concurrency in (1, 10, 100, 1000, 10_000):
+        asyncio.run(run(concurrency))
+
+
+if __name__ == "__main__":
+    main()
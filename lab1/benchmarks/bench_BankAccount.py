@@ -0,0 +1,44 @@
+import threading
+import time
+
+from src.BankAccount import DEPOSIT, WITHDRAW, BankAccount
+
+
+def stress(threads, operations):
+    account = BankAccount(0)
+
+    def worker():
+        for _ in range(operations):
+            account.deposit(2)
+            account.withdraw(1)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    expected = threads * operations
+    status = "OK" if account.get_balance() == expected else "LOST UPDATES"
+    print(f"{threads:>2} threads: {2 * expected / elapsed:,.0f} op/s, balance {account.get_balance()} "
+          f"(expected {expected}) {status}")
+
+
+def batch(size=100_000):
+    account = BankAccount(0)
+    transactions = [(DEPOSIT, 2), (WITHDRAW, 1)] * (size // 2)
+    start = time.perf_counter()
+    account.apply_batch(transactions)
+    elapsed = time.perf_counter() - start
+    print(f"apply_batch {size}: {size / elapsed:,.0f} op/s")
+
+
+def main():
+    for threads in (1, 4, 16):
+        stress(threads, 50_000)
+    batch()
+
+
+if __name__ == "__main__":
+    main()
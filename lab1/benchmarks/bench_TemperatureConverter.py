@@ -0,0 +1,30 @@
+import random
+import timeit
+from array import array
+
+from src.TemperatureConverter import TemperatureConverter
+
+
+def main():
+    random.seed(0)
+    converter = TemperatureConverter()
+    readings = array("d", (random.uniform(-40, 120) for _ in range(1_000_000)))
+
+    t = timeit.timeit(lambda: [converter.celsius_to_kelvin(converter.fahrenheit_to_celsius(x))
+                               for x in readings], number=1)
+    print(f"scalar methods F->C->K:   {t:.3f}s")
+    t = timeit.timeit(lambda: converter.convert_array(readings, "F", "K"), number=1)
+    print(f"convert_array F->K:       {t:.3f}s")
+    t = timeit.timeit(lambda: converter.convert_array(readings, "F", "K", inplace=True), number=1)
+    print(f"convert_array in place:   {t:.3f}s")
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    values = np.frombuffer(readings, dtype=np.float64).copy()
+    t = timeit.timeit(lambda: converter.convert_array(values, "F", "K", inplace=True), number=1)
+    print(f"convert_array NumPy:      {t:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import random
+import timeit
+
+from src.calculator import MODES, Calculator
+
+
+def main():
+    random.seed(0)
+    calc = Calculator()
+    rows = [(random.uniform(1, 100), random.uniform(1, 100)) for _ in range(500_000)]
+    a = [x for x, _ in rows]
+    b = [y for _, y in rows]
+
+    t = timeit.timeit(lambda: [calc.divide(x, y) for x, y in rows], number=1)
+    print(f"divide loop:               {t:.3f}s")
+    t = timeit.timeit(lambda: calc.divide_many(a, b), number=1)
+    print(f"divide_many:               {t:.3f}s")
+    expr = calc.compile("(a + b) * 2 - a / b")
+    t = timeit.timeit(lambda: [calc.subtract(calc.multiply(calc.add(x, y), 2), calc.divide(x, y))
+                               for x, y in rows], number=1)
+    print(f"formula via method calls:  {t:.3f}s")
+    sample = rows[:10_000]
+    t = timeit.timeit(lambda: [calc.compile("(a + b) * 2 - a / b")(x, y) for x, y in sample], number=1)
+    print(f"formula parsed per row:    {t * len(rows) / len(sample):.3f}s (extrapolated)")
+    t = timeit.timeit(lambda: expr.evaluate_many(rows), number=1)
+    print(f"compiled formula:          {t:.3f}s")
+
+    prices = [round(random.uniform(0.01, 1000), 2) for _ in range(200_000)]
+    for mode in MODES:
+        calc = Calculator(mode=mode)
+        t = timeit.timeit(lambda: [calc.divide(calc.multiply(p, 1.23), 3) for p in prices], number=1)
+        print(f"{mode:>8} multiply+divide x{len(prices)}: {t:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
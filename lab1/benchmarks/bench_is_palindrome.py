@@ -0,0 +1,27 @@
+import random
+import string
+import timeit
+
+from src.is_palindrome import (are_palindromes, count_palindromic_substrings,
+                               is_palindrome, longest_palindromic_substring)
+
+
+def main():
+    random.seed(0)
+    handles = ["".join(random.choice(string.ascii_letters + "_.-")
+                       for _ in range(random.randint(4, 20)))
+               for _ in range(200_000)]
+    text = "".join(random.choice("ab") for _ in range(200_000))
+
+    t = timeit.timeit(lambda: [is_palindrome(h) for h in handles], number=3)
+    print(f"is_palindrome (re.sub):      {t:.3f}s")
+    t = timeit.timeit(lambda: list(are_palindromes(handles)), number=3)
+    print(f"are_palindromes (translate): {t:.3f}s")
+    t = timeit.timeit(lambda: longest_palindromic_substring(text), number=1)
+    print(f"longest_palindromic_substring n={len(text)}: {t:.3f}s")
+    t = timeit.timeit(lambda: count_palindromic_substrings(text), number=1)
+    print(f"count_palindromic_substrings n={len(text)}: {t:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
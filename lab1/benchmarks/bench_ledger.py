@@ -0,0 +1,33 @@
+import random
+import sys
+import time
+
+from src.ledger import Ledger
+
+
+def main(transactions=10 ** 7, accounts=1000):
+    random.seed(0)
+    ledger = Ledger()
+    for account_id in range(accounts):
+        ledger.open_account(account_id, 1_000_000, timestamp=0)
+
+    start = time.perf_counter()
+    for i in range(1, transactions + 1):
+        source = random.randrange(accounts)
+        if i % 3:
+            ledger.deposit(source, 10, timestamp=i)
+        else:
+            ledger.transfer(source, (source + 1) % accounts, 5, timestamp=i)
+    elapsed = time.perf_counter() - start
+    print(f"{transactions} transactions: {elapsed:.1f}s ({transactions / elapsed:,.0f} tx/s)")
+
+    queries = [(random.randrange(accounts), random.uniform(0, transactions)) for _ in range(100_000)]
+    start = time.perf_counter()
+    for account_id, timestamp in queries:
+        ledger.balance_at(account_id, timestamp)
+    elapsed = time.perf_counter() - start
+    print(f"{len(queries)} balance_at queries: {elapsed:.3f}s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
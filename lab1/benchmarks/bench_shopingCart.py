@@ -0,0 +1,76 @@
+import os
+import random
+import tempfile
+import timeit
+import tracemalloc
+
+from src.shopingCart import ShoppingCart
+
+OPERATIONS = 1_000_000
+
+
+def main():
+    random.seed(0)
+    names = [f"SKU-{i}" for i in range(50_000)]
+    prices = [round(random.uniform(0.5, 500), 2) for _ in names]
+    ops = [random.randrange(len(names)) for _ in range(OPERATIONS)]
+
+    def edits_with_total():
+        cart = ShoppingCart()
+        for i in ops:
+            if i % 3:
+                cart.add_item(names[i], prices[i])
+            else:
+                cart.remove_item(names[i])
+            cart.get_total()
+
+    t = timeit.timeit(edits_with_total, number=1)
+    print(f"{OPERATIONS} edits + get_total:  {t:.3f}s")
+
+    cart = ShoppingCart()
+    t = timeit.timeit(lambda: cart.add_items(zip(names, prices)), number=1)
+    print(f"add_items x{len(names)}:        {t:.3f}s")
+    t = timeit.timeit(lambda: sum(cart.items.values()), number=1000)
+    print(f"full re-sum x1000 (old):      {t:.3f}s")
+    t = timeit.timeit(lambda: cart.most_expensive(100), number=1000)
+    print(f"most_expensive(100) x1000:    {t:.3f}s")
+    t = timeit.timeit(lambda: cart.remove_items(names[::2]), number=1)
+    print(f"remove_items x{len(names) // 2}:     {t:.3f}s")
+
+    snapshot_benchmarks(cart)
+    import_benchmark()
+
+
+def snapshot_benchmarks(cart):
+    t = timeit.timeit(lambda: cart.snapshot(), number=1)
+    print(f"snapshot JSON:    {t:.3f}s, {len(cart.snapshot().encode())} B")
+    t = timeit.timeit(lambda: cart.snapshot(binary=True), number=1)
+    print(f"snapshot binary:  {t:.3f}s, {len(cart.snapshot(binary=True))} B")
+    copy = ShoppingCart.restore(cart.snapshot(binary=True))
+    for name in list(copy.items)[:100]:
+        copy.add_item(name, 1.0, quantity=3)
+    t = timeit.timeit(lambda: cart.diff(copy), number=1)
+    print(f"diff (100 changed lines): {t:.3f}s, {len(cart.diff(copy))} B")
+
+
+def import_benchmark(rows=1_000_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "prices.csv")
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            f.write("name,price\n")
+            f.writelines(f"SKU-{i},{random.randint(1, 99999) / 100}\n" for i in range(rows))
+        with open(path, newline="", encoding="utf-8") as f:
+            t = timeit.timeit(lambda: ShoppingCart().import_csv(f), number=1)
+        # Pomiar pamięci osobno - tracemalloc wielokrotnie spowalnia import.
+        tracemalloc.start()
+        cart = ShoppingCart()
+        with open(path, newline="", encoding="utf-8") as f:
+            cart.import_csv(f)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"import_csv {rows} rows: {t:.3f}s, peak {peak / 2 ** 20:.0f} MiB "
+              f"(file {os.path.getsize(path) / 2 ** 20:.0f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
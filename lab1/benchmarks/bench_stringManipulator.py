@@ -0,0 +1,34 @@
+import sys
+import time
+
+from src.stringManipulator import StringManipulator
+
+CHUNK = ("Litwo ojczyzno moja ty jesteś jak zdrowie\n" * 25_000)
+
+
+def _chunks(total_bytes):
+    for _ in range(total_bytes // len(CHUNK)):
+        yield CHUNK
+
+
+def _timed(label, func, total_bytes):
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label}: {elapsed:.2f}s ({total_bytes / elapsed / 2 ** 20:.0f} MiB/s)")
+    return result
+
+
+def main(total_bytes=2 * 2 ** 30):
+    stm = StringManipulator()
+    _timed("count_words_stream", lambda: stm.count_words_stream(_chunks(total_bytes)), total_bytes)
+    _timed("capitalize_stream ", lambda: sum(map(len, stm.capitalize_stream(_chunks(total_bytes)))),
+           total_bytes)
+    small = total_bytes // 16
+    _timed("reverse_stream    ", lambda: sum(map(len, stm.reverse_stream(_chunks(small)))), small)
+    texts = CHUNK.splitlines() * 20
+    _timed("count_words_many  ", lambda: stm.count_words_many(texts), sum(map(len, texts)))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,40 @@
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from src.stringManipulator import StringManipulator
+
+LINE = "Zażółć gęślą jaźń, café \U0001F44D\U0001F3FD i inne słowa\n"
+
+
+def _measure(label, func, size):
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    # Pamięć mierzona w osobnym przebiegu - tracemalloc mocno spowalnia kod.
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label}: {elapsed:.2f}s, peak {peak / 2 ** 20:.1f} MiB "
+          f"({100 * peak / size:.1f}% of file)")
+
+
+def main(size=512 * 2 ** 20):
+    stm = StringManipulator()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "big.txt")
+        block = (LINE * (2 ** 20 // len(LINE.encode()))).encode("utf-8")
+        with open(path, "wb") as f:
+            for _ in range(size // len(block)):
+                f.write(block)
+        size = os.path.getsize(path)
+        print(f"file: {size / 2 ** 20:.0f} MiB")
+        _measure("count_words_file", lambda: stm.count_words_file(path), size)
+        _measure("reverse_file    ", lambda: stm.reverse_file(path, path + ".rev"), size)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
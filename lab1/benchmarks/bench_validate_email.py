@@ -0,0 +1,34 @@
+import os
+import random
+import string
+import tempfile
+import timeit
+
+from src.validate_email import validate_email, validate_email_file
+
+
+def _random_email():
+    local = "".join(random.choice(string.ascii_lowercase + "._") for _ in range(8))
+    domain = random.choice(["gmail.com", "outlook.com", "example.org", "bad_domain", ""])
+    return local + random.choice("@@@@.") + domain
+
+
+def main():
+    random.seed(0)
+    emails = [_random_email() for _ in range(500_000)]
+    with tempfile.TemporaryDirectory() as tmp:
+        source = os.path.join(tmp, "emails.csv")
+        with open(source, "w", encoding="utf-8") as f:
+            f.writelines(email + "\n" for email in emails)
+
+        t = timeit.timeit(lambda: [validate_email(e) for e in emails], number=1)
+        print(f"validate_email loop:       {t:.3f}s")
+        for workers in (1, 4):
+            t = timeit.timeit(lambda: validate_email_file(
+                source, os.path.join(tmp, "valid.txt"), os.path.join(tmp, "invalid.csv"),
+                workers=workers), number=1)
+            print(f"validate_email_file w={workers}:  {t:.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,108 @@
+import asyncio
+import threading
+
+DEPOSIT = "deposit"
+WITHDRAW = "withdraw"
+
+
 class InsufficientFundsException(Exception):
     pass
 
 class BankAccount:
     def __init__(self, start_balance=0):
         self.balance = start_balance
+        # Dziennik operacji tylko do dopisywania: (rodzaj, kwota, saldo po operacji).
+        self.ledger = []
+        self._lock = threading.Lock()
 
     def deposit(self, amount):
-        if amount <= 0:
-            raise ValueError("Prosze podać poprawną wartość")
-        self.balance += amount
+        _check_amount(amount)
+        with self._lock:
+            self.balance += amount
+            self.ledger.append((DEPOSIT, amount, self.balance))
 
     def withdraw(self, amount):
-        if amount <= 0:
-            raise ValueError("Prosze podać poprawną wartość")
-        if amount > self.balance:
-            raise InsufficientFundsException("Brak wystarczających środków")
-        self.balance -= amount
+        _check_amount(amount)
+        with self._lock:
+            if amount > self.balance:
+                raise InsufficientFundsException("Brak wystarczających środków")
+            self.balance -= amount
+            self.ledger.append((WITHDRAW, amount, self.balance))
+
+    def apply_batch(self, transactions):
+        # Cała partia jest najpierw sprawdzana na kopii salda i dopiero potem
+        # zapisywana, więc błąd w dowolnej operacji nie zmienia konta.
+        transactions = _validate_batch(transactions)
+        with self._lock:
+            self.balance = _replay(self.balance, transactions, self.ledger)
+
+    def get_balance(self):
+        return self.balance
+
+
+class AsyncBankAccount:
+    def __init__(self, start_balance=0, batch_chunk=1000):
+        self.balance = start_balance
+        self.ledger = []
+        self.batch_chunk = batch_chunk
+        # asyncio.Lock wybudza oczekujące korutyny w kolejności FIFO.
+        self._lock = asyncio.Lock()
+
+    async def deposit(self, amount):
+        _check_amount(amount)
+        async with self._lock:
+            self.balance += amount
+            self.ledger.append((DEPOSIT, amount, self.balance))
+
+    async def withdraw(self, amount):
+        _check_amount(amount)
+        async with self._lock:
+            if amount > self.balance:
+                raise InsufficientFundsException("Brak wystarczających środków")
+            self.balance -= amount
+            self.ledger.append((WITHDRAW, amount, self.balance))
+
+    async def apply_batch(self, transactions):
+        transactions = _validate_batch(transactions)
+        async with self._lock:
+            # Duże partie liczone są kawałkami z oddaniem sterowania pętli zdarzeń
+            # między nimi; blokada gwarantuje, że nikt inny nie zmieni w tym czasie salda.
+            balance = self.balance
+            entries = []
+            for start in range(0, len(transactions), self.batch_chunk):
+                balance = _replay(balance, transactions[start:start + self.batch_chunk], entries)
+                await asyncio.sleep(0)
+            self.balance = balance
+            self.ledger.extend(entries)
 
     def get_balance(self):
-        return self.balance
\ No newline at end of file
+        return self.balance
+
+
+def _check_amount(amount):
+    if amount <= 0:
+        raise ValueError("Prosze podać poprawną wartość")
+
+
+def _validate_batch(transactions):
+    transactions = list(transactions)
+    for kind, amount in transactions:
+        if kind not in (DEPOSIT, WITHDRAW):
+            raise ValueError("Nieznany rodzaj operacji")
+        _check_amount(amount)
+    return transactions
+
+
+def _replay(balance, transactions, ledger):
+    # Wpisy trafiają do ledger dopiero, gdy cała partia przejdzie bez błędu.
+    entries = []
+    for kind, amount in transactions:
+        if kind == DEPOSIT:
+            balance += amount
+        else:
+            if amount > balance:
+                raise InsufficientFundsException("Brak wystarczających środków")
+            balance -= amount
+        entries.append((kind, amount, balance))
+    ledger.extend(entries)
+    return balance
@@ -1,3 +1,19 @@
+import csv
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Każda skala jest liniowa względem Celsjusza: x = a * celsius + b.
+_FROM_CELSIUS = {
+    "C": (1.0, 0.0),
+    "F": (9 / 5, 32.0),
+    "K": (1.0, 273.15),
+}
+
+
 class TemperatureConverter:
     def celsius_to_fahrenheit(self, celsius):
         return celsius * 9 / 5 + 32
@@ -9,4 +25,77 @@ class TemperatureConverter:
         return celsius + 273.15
 
     def kelvin_to_celsius(self, kelvin):
-        return kelvin - 273.15
\ No newline at end of file
+        return kelvin - 273.15
+
+    def linear_coefficients(self, from_unit, to_unit):
+        if from_unit not in _FROM_CELSIUS or to_unit not in _FROM_CELSIUS:
+            raise ValueError("Nieznana skala temperatury")
+        a1, b1 = _FROM_CELSIUS[from_unit]
+        a2, b2 = _FROM_CELSIUS[to_unit]
+        # Złożenie odwrotności pierwszej skali z drugą daje jedno przekształcenie
+        # x -> scale * x + offset, np. Fahrenheit -> Kelvin w jednym przebiegu.
+        scale = a2 / a1
+        return scale, b2 - scale * b1
+
+    def convert(self, value, from_unit, to_unit):
+        scale, offset = self.linear_coefficients(from_unit, to_unit)
+        return value * scale + offset
+
+    def convert_array(self, values, from_unit, to_unit, inplace=False):
+        scale, offset = self.linear_coefficients(from_unit, to_unit)
+        if inplace and not isinstance(values, list) and not _is_float_buffer(values):
+            raise ValueError("Konwersja w miejscu wymaga tablicy liczb zmiennoprzecinkowych")
+        if hasattr(values, "__array_ufunc__"):
+            # Tablice NumPy - operacje wykonywane są wektorowo, bez pętli w Pythonie.
+            if inplace:
+                values *= scale
+                values += offset
+                return values
+            return values * scale + offset
+        if np is not None and not isinstance(values, list):
+            # array.array i memoryview - widok NumPy na tym samym buforze, bez kopii
+            # i bez pętli w Pythonie; wynik zapisywany jest wprost do bufora docelowego.
+            view = np.asarray(values)
+            if inplace:
+                view *= scale
+                view += offset
+                return values
+            converted = array("d", bytes(8 * view.size))
+            out = np.frombuffer(converted, dtype=np.float64)
+            np.multiply(view, scale, out=out)
+            out += offset
+            return converted
+        converted = [x * scale + offset for x in values]
+        if not inplace:
+            return array("d", converted)
+        if isinstance(values, list):
+            values[:] = converted
+        else:
+            values[:] = array(_typecode(values), converted)
+        return values
+
+    def convert_csv(self, source, destination, column, from_unit, to_unit, has_header=True):
+        scale, offset = self.linear_coefficients(from_unit, to_unit)
+        reader = csv.reader(source)
+        writer = csv.writer(destination)
+        if has_header:
+            header = next(reader, None)
+            if header is not None:
+                writer.writerow(header)
+        for row in reader:
+            if len(row) > column and row[column]:
+                row[column] = repr(float(row[column]) * scale + offset)
+            writer.writerow(row)
+
+
+def _typecode(values):
+    return values.format if isinstance(values, memoryview) else getattr(values, "typecode", None)
+
+
+def _is_float_buffer(values):
+    # Wynik przeliczenia jest ułamkowy, więc w miejscu da się go zapisać tylko
+    # do tablicy float (NumPy: dtype float/complex, array i memoryview: "f"/"d").
+    dtype = getattr(values, "dtype", None)
+    if dtype is not None:
+        return dtype.kind in "fc"
+    return _typecode(values) in ("f", "d")
@@ -1,14 +1,220 @@
+import ast
+import decimal
+import operator
+from fractions import Fraction
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MODES = ("float", "decimal", "fraction")
+
+_ALLOWED_OPERATORS = (ast.Add, ast.Sub, ast.Mult, ast.Div, ast.UAdd, ast.USub)
+
+
 class Calculator:
+    def __init__(self, mode="float", context=None):
+        if mode not in MODES:
+            raise ValueError("Nieznany tryb obliczeń")
+        self.mode = mode
+        self.context = None
+        self._convert = None
+        self._add, self._sub, self._mul, self._div = operator.add, operator.sub, operator.mul, operator.truediv
+        if mode == "decimal":
+            # Kontekst tworzony jest raz na instancję i używany bezpośrednio przez
+            # jego metody, bez przełączania kontekstu wątku przy każdej operacji.
+            self.context = context if context is not None else decimal.Context()
+            self._convert = self._to_decimal
+            self._add, self._sub = self.context.add, self.context.subtract
+            self._mul, self._div = self.context.multiply, self.context.divide
+        elif mode == "fraction":
+            self._convert = _to_fraction
+
     def add(self, a, b):
-        return a + b
+        if self._convert:
+            a, b = self._convert(a), self._convert(b)
+        return self._add(a, b)
 
     def subtract(self, a, b):
-        return a - b
+        if self._convert:
+            a, b = self._convert(a), self._convert(b)
+        return self._sub(a, b)
 
     def multiply(self, a, b):
-        return a * b
+        if self._convert:
+            a, b = self._convert(a), self._convert(b)
+        return self._mul(a, b)
 
     def divide(self, a, b):
+        # Najpierw konwersja, żeby np. "0" w trybach dokładnych też było zerem.
+        if self._convert:
+            a, b = self._convert(a), self._convert(b)
         if b == 0:
             raise ValueError("Nie można dzielić przez 0")
-        return a / b
\ No newline at end of file
+        return self._div(a, b)
+
+    def add_many(self, a, b):
+        return self._elementwise(self.add if self._convert else operator.add, a, b)
+
+    def subtract_many(self, a, b):
+        return self._elementwise(self.subtract if self._convert else operator.sub, a, b)
+
+    def multiply_many(self, a, b):
+        return self._elementwise(self.multiply if self._convert else operator.mul, a, b)
+
+    def divide_many(self, a, b, masked=False):
+        # strict (domyślnie): ValueError jak w divide, jeśli którykolwiek dzielnik to 0;
+        # masked: pozycje z zerowym dzielnikiem są maskowane (None dla list).
+        if self._vectorized(a, b):
+            zero = np.asarray(b) == 0
+            if not masked:
+                if zero.any():
+                    raise ValueError("Nie można dzielić przez 0")
+                return np.true_divide(a, b)
+            result = np.true_divide(a, np.where(zero, 1, b))
+            return np.ma.masked_array(result, mask=np.broadcast_to(zero, result.shape))
+        a, b = _broadcast(a, b)
+        div = self._div
+        if self._convert:
+            convert = self._convert
+            a, b = [convert(x) for x in a], [convert(y) for y in b]
+        if not masked:
+            if any(y == 0 for y in b):
+                raise ValueError("Nie można dzielić przez 0")
+            return [div(x, y) for x, y in zip(a, b)]
+        return [None if y == 0 else div(x, y) for x, y in zip(a, b)]
+
+    def compile(self, formula, variables=None):
+        return Expression(self, formula, variables)
+
+    def _vectorized(self, a, b):
+        # Tryby dokładne liczą element po elemencie, bo NumPy działa na floatach.
+        return self._convert is None and (_is_array(a) or _is_array(b))
+
+    def _to_decimal(self, value):
+        if isinstance(value, float):
+            value = repr(value)
+        return self.context.create_decimal(value)
+
+    def _elementwise(self, op, a, b):
+        if self._vectorized(a, b):
+            return op(np.asarray(a), np.asarray(b))
+        a, b = _broadcast(a, b)
+        return [op(x, y) for x, y in zip(a, b)]
+
+
+class Expression:
+    def __init__(self, calculator, formula, variables=None):
+        try:
+            tree = ast.parse(formula, mode="eval")
+        except SyntaxError:
+            raise ValueError("Niepoprawne wyrażenie")
+        names = []
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Name):
+                if node.id.startswith("_"):
+                    raise ValueError("Niepoprawne wyrażenie")
+                if node.id not in names:
+                    names.append(node.id)
+            elif isinstance(node, ast.Constant):
+                if not isinstance(node.value, (int, float)) or isinstance(node.value, bool):
+                    raise ValueError("Niepoprawne wyrażenie")
+            elif not isinstance(node, (ast.Expression, ast.BinOp, ast.UnaryOp, ast.Load)
+                                + _ALLOWED_OPERATORS):
+                raise ValueError("Niepoprawne wyrażenie")
+        if variables is None:
+            variables = sorted(names)
+        elif set(names) - set(variables):
+            raise ValueError("Nieznane zmienne w wyrażeniu")
+
+        self.calculator = calculator
+        self.formula = formula
+        self.variables = tuple(variables)
+        # Wyrażenie parsowane jest raz i kompilowane do zwykłej funkcji Pythona.
+        # Dzielenie przechodzi przez kalkulator, żeby zachować obsługę dzielenia przez 0,
+        # a w trybach dokładnych również pozostałe działania (konwersja stałych i kontekst).
+        exact = calculator.mode != "float"
+        body = _OperatorsToCalls(exact).visit(tree.body)
+        func = ast.Expression(ast.Lambda(
+            args=ast.arguments(posonlyargs=[], args=[ast.arg(arg=name) for name in self.variables],
+                               kwonlyargs=[], kw_defaults=[], defaults=[]),
+            body=body))
+        code = compile(ast.fix_missing_locations(func), "<formula>", "eval")
+        self._func = eval(code, {"__builtins__": {}, "_add": calculator.add, "_subtract": calculator.subtract,
+                                 "_multiply": calculator.multiply, "_divide": calculator.divide})
+        self._array_func = eval(code, {"__builtins__": {}, "_divide": _array_divide})
+
+    def __call__(self, *args, **kwargs):
+        if self.calculator.mode == "float" and np is not None \
+                and any(map(_is_array, args + tuple(kwargs.values()))):
+            return self._array_func(*args, **kwargs)
+        return self._func(*args, **kwargs)
+
+    def evaluate_many(self, rows):
+        func = self._func
+        return [func(*row) for row in rows]
+
+    def __repr__(self):
+        return f"Expression({self.formula!r})"
+
+
+class _OperatorsToCalls(ast.NodeTransformer):
+    _NAMES = {ast.Add: "_add", ast.Sub: "_subtract", ast.Mult: "_multiply", ast.Div: "_divide"}
+
+    def __init__(self, all_operators):
+        self.all_operators = all_operators
+
+    def visit_BinOp(self, node):
+        self.generic_visit(node)
+        if self.all_operators or isinstance(node.op, ast.Div):
+            return _call(self._NAMES[type(node.op)], node.left, node.right)
+        return node
+
+    def visit_UnaryOp(self, node):
+        self.generic_visit(node)
+        if self.all_operators:
+            name = "_subtract" if isinstance(node.op, ast.USub) else "_add"
+            return _call(name, ast.Constant(value=0), node.operand)
+        return node
+
+
+def _call(name, left, right):
+    return ast.Call(func=ast.Name(id=name, ctx=ast.Load()), args=[left, right], keywords=[])
+
+
+def _to_fraction(value):
+    if isinstance(value, float):
+        value = repr(value)
+    return Fraction(value)
+
+
+def _array_divide(a, b):
+    # Dzielenie w wyrażeniach na tablicach: stałe podwyrażenia (np. 1/2) zostają
+    # liczbami, a nie listami z divide_many, więc kolejne operatory działają poprawnie.
+    if np.any(np.asarray(b) == 0):
+        raise ValueError("Nie można dzielić przez 0")
+    if _is_array(a) or _is_array(b):
+        return np.true_divide(a, b)
+    return a / b
+
+
+def _is_array(value):
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _broadcast(a, b):
+    a_scalar = not hasattr(a, "__iter__")
+    b_scalar = not hasattr(b, "__iter__")
+    if a_scalar and b_scalar:
+        return [a], [b]
+    if a_scalar:
+        b = list(b)
+        return [a] * len(b), b
+    if b_scalar:
+        a = list(a)
+        return a, [b] * len(a)
+    a, b = list(a), list(b)
+    if len(a) != len(b):
+        raise ValueError("Kolumny muszą mieć tę samą długość")
+    return a, b
@@ -1,5 +1,76 @@
 import re
+import string
+
+_KEEP = (string.ascii_letters + string.digits).encode("ascii")
+_DELETE = bytes(b for b in range(256) if b not in _KEEP)
+_LOWER = bytes.maketrans(string.ascii_uppercase.encode("ascii"),
+                         string.ascii_lowercase.encode("ascii"))
+
 
 def is_palindrome(s):
     cleaned = re.sub(r'[^a-zA-Z0-9]', '', s).lower()
-    return cleaned == cleaned[::-1]
\ No newline at end of file
+    return cleaned == cleaned[::-1]
+
+
+def _normalize(s):
+    # Znaki spoza ASCII i tak są usuwane przez wyrażenie [^a-zA-Z0-9],
+    # więc można je odrzucić już przy kodowaniu.
+    return s.encode("ascii", "ignore").translate(_LOWER, _DELETE)
+
+
+def _two_pointer(cleaned):
+    i = 0
+    j = len(cleaned) - 1
+    while i < j:
+        if cleaned[i] != cleaned[j]:
+            return False
+        i += 1
+        j -= 1
+    return True
+
+
+def is_palindrome_fast(s):
+    return _two_pointer(_normalize(s))
+
+
+def are_palindromes(strings):
+    normalize = _normalize
+    check = _two_pointer
+    for s in strings:
+        yield check(normalize(s))
+
+
+def _manacher(s):
+    # Przeplatamy tekst separatorem, aby palindromy parzystej i nieparzystej
+    # długości obsługiwać jednakowo. radius[i] to promień palindromu w t.
+    t = "\0" + "\0".join(s) + "\0" if s else "\0"
+    n = len(t)
+    radius = [0] * n
+    center = right = 0
+    for i in range(n):
+        if i < right:
+            r = min(right - i, radius[2 * center - i])
+        else:
+            r = 0
+        while i - r - 1 >= 0 and i + r + 1 < n and t[i - r - 1] == t[i + r + 1]:
+            r += 1
+        radius[i] = r
+        if i + r > right:
+            center = i
+            right = i + r
+    return radius
+
+
+def longest_palindromic_substring(s):
+    if not s:
+        return ""
+    radius = _manacher(s)
+    best = max(range(len(radius)), key=radius.__getitem__)
+    start = (best - radius[best]) // 2
+    return s[start:start + radius[best]]
+
+
+def count_palindromic_substrings(s):
+    # Promień r w tekście z separatorami odpowiada (r + 1) // 2 palindromom
+    # w oryginalnym tekście o tym samym środku.
+    return sum((r + 1) // 2 for r in _manacher(s))
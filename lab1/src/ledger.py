@@ -0,0 +1,133 @@
+import threading
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+from src.BankAccount import DEPOSIT, WITHDRAW, BankAccount
+
+
+class _History:
+    # Historia jednego konta w kolumnach: czas, kwota (ze znakiem), saldo po operacji.
+    # Saldo po każdej operacji działa jak punkt kontrolny, więc zapytanie
+    # o saldo w chwili T to jedno wyszukiwanie binarne po kolumnie czasu.
+    # Obiekt służy też jako dziennik (ledger) konta BankAccount, więc każda operacja
+    # zapisywana jest raz. Kwoty i salda trzymamy w array("q"), a dopiero wartość
+    # spoza int64 (Decimal, float, duży int) zamienia kolumnę na listę zachowującą typ.
+    __slots__ = ("times", "amounts", "balances", "time")
+
+    def __init__(self, timestamp, start_balance):
+        self.times = array("d")
+        self.amounts = array("q")
+        self.balances = array("q")
+        # Czas bieżącej operacji ustawiany przez Ledger pod blokadą konta.
+        self.time = timestamp
+        self.record(timestamp, start_balance, start_balance)
+
+    def record(self, timestamp, amount, balance):
+        self.times.append(timestamp)
+        self.amounts = _append(self.amounts, amount)
+        self.balances = _append(self.balances, balance)
+
+    def append(self, entry):
+        # Wpis (rodzaj, kwota, saldo) w formacie dziennika BankAccount.
+        kind, amount, balance = entry
+        self.record(self.time, -amount if kind == WITHDRAW else amount, balance)
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def __len__(self):
+        return len(self.times) - 1
+
+    def __iter__(self):
+        # Operacje bez salda otwarcia, tak jak w zwykłym dzienniku konta.
+        for amount, balance in zip(self.amounts[1:], self.balances[1:]):
+            yield (WITHDRAW, -amount, balance) if amount < 0 else (DEPOSIT, amount, balance)
+
+
+def _append(column, value):
+    try:
+        column.append(value)
+    except (TypeError, OverflowError):
+        column = list(column)
+        column.append(value)
+    return column
+
+
+class Ledger:
+    def __init__(self):
+        self.accounts = {}
+        self._history = {}
+        self._locks = {}
+        self._order = {}
+        self._registry_lock = threading.Lock()
+
+    def open_account(self, account_id, start_balance=0, timestamp=None):
+        with self._registry_lock:
+            if account_id in self.accounts:
+                raise ValueError("Konto o tym identyfikatorze już istnieje")
+            account = BankAccount(start_balance)
+            history = _History(_now(timestamp), start_balance)
+            account.ledger = history
+            self.accounts[account_id] = account
+            self._history[account_id] = history
+            self._locks[account_id] = threading.Lock()
+            self._order[account_id] = len(self._order)
+        return account
+
+    def deposit(self, account_id, amount, timestamp=None):
+        account = self._account(account_id)
+        with self._locks[account_id]:
+            self._history[account_id].time = self._check_time(account_id, timestamp)
+            account.deposit(amount)
+
+    def withdraw(self, account_id, amount, timestamp=None):
+        account = self._account(account_id)
+        with self._locks[account_id]:
+            self._history[account_id].time = self._check_time(account_id, timestamp)
+            account.withdraw(amount)
+
+    def transfer(self, source_id, target_id, amount, timestamp=None):
+        if source_id == target_id:
+            raise ValueError("Nie można przelać środków na to samo konto")
+        source = self._account(source_id)
+        target = self._account(target_id)
+        # Blokady zawsze w kolejności otwarcia kont - dwa przeciwne przelewy
+        # nie mogą się wzajemnie zakleszczyć.
+        first, second = sorted((source_id, target_id), key=self._order.__getitem__)
+        with self._locks[first], self._locks[second]:
+            timestamp = self._check_time(source_id, timestamp)
+            self._check_time(target_id, timestamp)
+            self._history[source_id].time = self._history[target_id].time = timestamp
+            source.withdraw(amount)
+            target.deposit(amount)
+
+    def balance_at(self, account_id, timestamp):
+        history = self._history[self._checked_id(account_id)]
+        i = bisect_right(history.times, timestamp)
+        return history.balances[i - 1] if i else 0
+
+    def statement(self, account_id, start=None, end=None):
+        history = self._history[self._checked_id(account_id)]
+        lo = 0 if start is None else bisect_left(history.times, start)
+        hi = len(history.times) if end is None else bisect_right(history.times, end)
+        return list(zip(history.times[lo:hi], history.amounts[lo:hi], history.balances[lo:hi]))
+
+    def _account(self, account_id):
+        return self.accounts[self._checked_id(account_id)]
+
+    def _checked_id(self, account_id):
+        if account_id not in self.accounts:
+            raise KeyError(f"Nieznane konto: {account_id}")
+        return account_id
+
+    def _check_time(self, account_id, timestamp):
+        timestamp = _now(timestamp)
+        if timestamp < self._history[account_id].times[-1]:
+            raise ValueError("Operacje muszą być zapisywane w kolejności czasu")
+        return timestamp
+
+
+def _now(timestamp):
+    return time.time() if timestamp is None else timestamp
@@ -1,16 +1,170 @@
+import csv
+import json
+import zlib
+from bisect import bisect_left, insort
+from decimal import Decimal
+from itertools import islice
+
+
+def _to_decimal(price):
+    # Ceny float zamieniamy przez repr, aby 0.1 oznaczało dokładnie 0.1.
+    return Decimal(repr(price)) if isinstance(price, float) else Decimal(price)
+
+
+_BATCH_THRESHOLD = 16
+
+
+def _dumps(data):
+    # Ceny Decimal zapisujemy jako tekst, float i int pozostają liczbami JSON.
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def _decode_line(line):
+    name, price, quantity = line
+    return name, Decimal(price) if isinstance(price, str) else price, quantity
+
+
 class ShoppingCart:
     def __init__(self):
         self.items = {}
+        self.quantities = {}
+        self._prices = {}
+        self._total = Decimal(0)
+        # Posortowana lista (cena, nazwa) do zapytań o najtańsze/najdroższe pozycje.
+        # Po dużych partiach sortowanie odkładane jest do pierwszego zapytania.
+        self._price_index = []
+        self._index_sorted = True
 
-    def add_item(self, item_name, price):
-        self.items[item_name] = price
+    def add_item(self, item_name, price, quantity=1):
+        self._set_item(item_name, price, quantity)
+        if self._index_sorted:
+            insort(self._price_index, (self._prices[item_name], item_name))
+        else:
+            self._price_index.append((self._prices[item_name], item_name))
 
     def remove_item(self, item_name):
         if item_name in self.items:
+            self._discard(item_name)
             del self.items[item_name]
+            del self.quantities[item_name]
+            del self._prices[item_name]
+
+    def add_items(self, items):
+        entries = {}
+        try:
+            for item in items:
+                self._set_item(*item)
+                entries[item[0]] = (self._prices[item[0]], item[0])
+        finally:
+            # Pozycje dodane przed błędną trafiają do indeksu, tak jak przy add_item.
+            self._index_entries(entries)
+
+    def _index_entries(self, entries):
+        if self._index_sorted and len(entries) < _BATCH_THRESHOLD:
+            for entry in entries.values():
+                insort(self._price_index, entry)
+        else:
+            self._price_index += entries.values()
+            self._index_sorted = False
+
+    def remove_items(self, item_names):
+        removed = {name for name in item_names if name in self.items}
+        for name in removed:
+            del self.items[name]
+            price = self._prices.pop(name)
+            self._total -= price * self.quantities.pop(name)
+            if len(removed) < _BATCH_THRESHOLD:
+                self._discard_index(price, name)
+        if len(removed) >= _BATCH_THRESHOLD:
+            self._price_index = [entry for entry in self._price_index if entry[1] not in removed]
 
     def get_total(self):
-        return sum(self.items.values())
+        return self._total
+
+    def get_quantity(self, item_name):
+        return self.quantities.get(item_name, 0)
+
+    def most_expensive(self, n):
+        return [(name, self.items[name]) for _, name in reversed(self._sorted_index()[-n:])] if n > 0 else []
+
+    def least_expensive(self, n):
+        return [(name, self.items[name]) for _, name in self._sorted_index()[:n]] if n > 0 else []
+
+    def snapshot(self, binary=False):
+        data = _dumps([[name, price, self.quantities[name]] for name, price in self.items.items()])
+        if binary:
+            return zlib.compress(data.encode("utf-8"))
+        return data
+
+    @classmethod
+    def restore(cls, snapshot):
+        if isinstance(snapshot, bytes):
+            snapshot = zlib.decompress(snapshot).decode("utf-8")
+        cart = cls()
+        cart.add_items(_decode_line(line) for line in json.loads(snapshot))
+        return cart
+
+    def diff(self, other):
+        # Łatka przekształcająca ten koszyk w other - zawiera tylko zmienione pozycje.
+        changed = [[name, price, other.quantities[name]] for name, price in other.items.items()
+                   if self.items.get(name) != price or self.quantities.get(name) != other.quantities[name]]
+        removed = [name for name in self.items if name not in other.items]
+        return _dumps({"set": changed, "remove": removed})
+
+    def apply_patch(self, patch):
+        patch = json.loads(patch)
+        self.remove_items(patch["remove"])
+        self.add_items(_decode_line(line) for line in patch["set"])
+
+    def import_csv(self, file, name_column="name", price_column="price",
+                   quantity_column=None, batch_size=10000):
+        rows = csv.DictReader(file)
+        while True:
+            batch = [(row[name_column], Decimal(row[price_column]),
+                      int(row[quantity_column]) if quantity_column else 1)
+                     for row in islice(rows, batch_size)]
+            if not batch:
+                return
+            self.add_items(batch)
+
+    def export_csv(self, file):
+        writer = csv.writer(file)
+        writer.writerow(["name", "price", "quantity"])
+        for name, price in self.items.items():
+            writer.writerow([name, price, self.quantities[name]])
 
     def clear(self):
-        self.items.clear()
\ No newline at end of file
+        self.items.clear()
+        self.quantities.clear()
+        self._prices.clear()
+        self._total = Decimal(0)
+        self._price_index.clear()
+        self._index_sorted = True
+
+    def _set_item(self, item_name, price, quantity=1):
+        if quantity <= 0:
+            raise ValueError("Ilość musi być dodatnia")
+        exact = _to_decimal(price)
+        if item_name in self.items:
+            self._discard(item_name)
+        self.items[item_name] = price
+        self.quantities[item_name] = quantity
+        self._prices[item_name] = exact
+        self._total += exact * quantity
+
+    def _discard(self, item_name):
+        price = self._prices[item_name]
+        self._total -= price * self.quantities[item_name]
+        self._discard_index(price, item_name)
+
+    def _discard_index(self, price, item_name):
+        index = self._sorted_index()
+        i = bisect_left(index, (price, item_name))
+        if i < len(index) and index[i] == (price, item_name):
+            del index[i]
+
+    def _sorted_index(self):
+        if not self._index_sorted:
+            self._price_index.sort()
+            self._index_sorted = True
+        return self._price_index
@@ -1,3 +1,16 @@
+import mmap
+import os
+import re
+import sys
+import unicodedata
+from collections import namedtuple
+from functools import lru_cache
+
+CHUNK_SIZE = 1 << 20
+
+_GraphemePatterns = namedtuple("_GraphemePatterns", "cluster runs join")
+
+
 class StringManipulator:
     def reverse_string(self, text):
 
@@ -5,8 +18,230 @@ class StringManipulator:
 
     def count_words(self, text):
 
-        return len(text.split())
+        # Liczymy w kawałkach, żeby nie budować listy wszystkich słów naraz.
+        return self.count_words_stream(text[i:i + CHUNK_SIZE] for i in range(0, len(text), CHUNK_SIZE))
 
     def capitalize_words(self, text):
 
-        return text.title()
\ No newline at end of file
+        return text.title()
+
+    def reverse_graphemes(self, text):
+
+        return _reverse_clusters(text)
+
+    def count_words_stream(self, source):
+
+        count = 0
+        previous_in_word = False
+        for chunk in _chunks(source):
+            if not chunk:
+                continue
+            count += len(chunk.split())
+            # Słowo przecięte granicą kawałków zostało policzone dwa razy.
+            if previous_in_word and not chunk[0].isspace():
+                count -= 1
+            previous_in_word = not chunk[-1].isspace()
+        return count
+
+    def capitalize_stream(self, source):
+
+        previous = ""
+        for chunk in _chunks(source):
+            if not chunk:
+                continue
+            # title() zależy tylko od tego, czy poprzedni znak ma wielkość liter, więc
+            # doklejamy jednoznakowy zastępnik ("a" lub " ") zamiast samego znaku, który
+            # po title() mógłby zmienić długość (np. "ß" -> "Ss").
+            yield (previous + chunk).title()[len(previous):]
+            last = chunk[-1]
+            previous = "a" if last.islower() or last.isupper() or last.istitle() else " "
+
+    def reverse_stream(self, source):
+
+        # Odwrócenie wymaga całego tekstu; kawałki przechowujemy bez sklejania,
+        # a ostatni klaster każdego kawałka przenosimy do następnego, żeby nie
+        # rozerwać znaku z jego znakami łączącymi.
+        pieces = []
+        carry = ""
+        clusters = _grapheme_patterns().cluster
+        for chunk in _chunks(source):
+            chunk = carry + chunk
+            tail = chunk[_regional_run_start(chunk, max(0, len(chunk) - 64)):]
+            carry = clusters.findall(tail)[-1] if chunk else ""
+            pieces.append(_reverse_clusters(chunk[:len(chunk) - len(carry)]))
+        if carry:
+            yield carry
+        for piece in reversed(pieces):
+            yield piece
+
+    def count_words_file(self, path, window=CHUNK_SIZE):
+
+        # Plik mapowany w pamięci jest dekodowany oknami, więc w pamięci
+        # procesu jest naraz tylko jedno okno, a nie cała zawartość.
+        with _mapped(path) as mapped:
+            return self.count_words_stream(_utf8_windows(mapped, window))
+
+    def reverse_file(self, source_path, destination_path, window=CHUNK_SIZE):
+
+        if window < 4:
+            raise ValueError("Okno musi mieścić najdłuższy znak UTF-8")
+        with _mapped(source_path) as mapped, open(destination_path, "wb") as destination:
+            end = len(mapped)
+            while end > 0:
+                start = _utf8_start(mapped, max(0, end - window))
+                # Początek okna przesuwamy tak, by nie rozdzielać klastra grafemu;
+                # klaster dłuższy niż całe okno zostanie jednak przecięty.
+                boundary = start
+                while 0 < boundary < end and _joins_previous(mapped, boundary):
+                    boundary = _utf8_start(mapped, boundary + 1)
+                if boundary < end:
+                    start = boundary
+                destination.write(_reverse_clusters(mapped[start:end].decode("utf-8")).encode("utf-8"))
+                end = start
+
+    def reverse_many(self, texts):
+
+        return [text[::-1] for text in texts]
+
+    def count_words_many(self, texts):
+
+        return [self.count_words(text) for text in texts]
+
+    def capitalize_many(self, texts):
+
+        return [text.title() for text in texts]
+
+
+def _chunks(source, size=CHUNK_SIZE):
+    if isinstance(source, str):
+        return (source,)
+    if hasattr(source, "read"):
+        return iter(lambda: source.read(size), "")
+    return source
+
+
+class _mapped:
+    # mmap nie obsługuje pustych plików - wtedy zwracamy puste bajty.
+    def __init__(self, path):
+        self.path = path
+
+    def __enter__(self):
+        self.file = open(self.path, "rb")
+        if os.fstat(self.file.fileno()).st_size == 0:
+            self.mapping = None
+            return b""
+        self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self.mapping
+
+    def __exit__(self, *exc):
+        if self.mapping is not None:
+            self.mapping.close()
+        self.file.close()
+
+
+def _utf8_windows(data, window):
+    if window < 4:
+        raise ValueError("Okno musi mieścić najdłuższy znak UTF-8")
+    start = 0
+    size = len(data)
+    while start < size:
+        end = min(start + window, size)
+        # Nie tniemy w środku znaku - cofamy się przed bajty kontynuacji.
+        while end < size and data[end] & 0xC0 == 0x80:
+            end -= 1
+        yield data[start:end].decode("utf-8")
+        start = end
+
+
+def _utf8_start(data, position):
+    # Przesuwa pozycję do przodu na początek znaku: bajty kontynuacji UTF-8 to 10xxxxxx.
+    while position < len(data) and data[position] & 0xC0 == 0x80:
+        position += 1
+    return position
+
+
+def _joins_previous(data, position):
+    previous = position - 1
+    while data[previous] & 0xC0 == 0x80:
+        previous -= 1
+    if _is_regional_indicator(data, previous) and _is_regional_indicator(data, position):
+        # Wskaźniki regionalne łączą się w flagi parami od początku ciągu, więc
+        # o granicy decyduje parzystość liczby wskaźników przed pozycją.
+        count = 1
+        while previous >= 4 and _is_regional_indicator(data, previous - 4):
+            previous -= 4
+            count += 1
+        return count % 2 == 1
+    pair = data[previous:_utf8_start(data, position + 1)].decode("utf-8")
+    return _grapheme_patterns().join.fullmatch(pair) is not None
+
+
+def _is_regional_indicator(data, position):
+    # U+1F1E6..U+1F1FF w UTF-8: F0 9F 87 A6..BF.
+    return data[position:position + 3] == b"\xf0\x9f\x87" and 0xA6 <= data[position + 3] <= 0xBF
+
+
+def _regional_run_start(text, position):
+    # Cofa pozycję na początek ciągu wskaźników regionalnych, żeby wzorzec klastrów
+    # łączył flagi w pary od właściwego miejsca.
+    while 0 < position < len(text) and "\U0001F1E6" <= text[position - 1] <= "\U0001F1FF" \
+            and "\U0001F1E6" <= text[position] <= "\U0001F1FF":
+        position -= 1
+    return position
+
+
+def _reverse_clusters(text):
+    # Tylko klastry wieloznakowe muszą zachować kolejność znaków; resztę tekstu
+    # odwracamy zwykłym wycinkiem, który działa w C. Wzorzec szuka samych znaków
+    # rozszerzających - znak bazowy to znak tuż przed dopasowaniem.
+    pieces = []
+    end = len(text)
+    for match in reversed(list(_grapheme_patterns().runs.finditer(text))):
+        start, stop = match.span()
+        if match.lastgroup == "extend" and start > 0:
+            start -= 1
+        if stop > end:
+            continue
+        pieces.append(text[stop:end][::-1])
+        pieces.append(text[start:stop])
+        end = start
+    pieces.append(text[:end][::-1])
+    return "".join(pieces)
+
+
+@lru_cache(maxsize=None)
+def _grapheme_patterns():
+    # Przybliżenie rozszerzonych klastrów grafemów (UAX #29) bez zewnętrznych
+    # bibliotek: znak bazowy wraz ze znakami łączącymi (Mn, Me, Mc), selektorami
+    # wariantów i modyfikatorami emoji, sekwencje emoji z ZWJ, pary flag i CRLF.
+    # Poza wzorcem klastra zawiera wzorzec ciągów znaków rozszerzających oraz
+    # wzorzec pary znaków należących do jednego klastra.
+    extend = [c for c in range(sys.maxunicode + 1)
+              if unicodedata.category(chr(c)) in ("Mn", "Me", "Mc")]
+    extend.append(0x200C)
+    extend.extend(range(0x1F3FB, 0x1F400))
+    extend.sort()
+    bmp_class = "[" + "".join(_ranges([c for c in extend if c <= 0xFFFF])) + "]"
+    astral_class = "[" + "".join(_ranges([c for c in extend if c > 0xFFFF])) + "]"
+    # Klasa z zakresami spoza BMP jest w re kilkukrotnie wolniejsza, więc
+    # sprawdzamy ją dopiero po szybkim teście pojedynczego zakresu.
+    extend_class = rf"(?:{bmp_class}|(?=[\U00010000-\U0010FFFF]){astral_class})"
+    flag = "[\U0001F1E6-\U0001F1FF]"
+    pictographic = "[\u2190-\u2bff\U0001F000-\U0001FAFF]"
+    tail = rf"(?:{extend_class}|\u200d(?:{pictographic})?)"
+    return _GraphemePatterns(
+        cluster=re.compile(rf"\r\n|{flag}{flag}|.{tail}*", re.S),
+        runs=re.compile(rf"\r\n|{flag}{flag}|(?P<extend>{tail}+)"),
+        join=re.compile(rf"\r\n|{flag}{flag}|.(?:{extend_class}|\u200d)|\u200d{pictographic}", re.S))
+
+
+def _ranges(codepoints):
+    # Zakresy zamiast tysięcy pojedynczych znaków - klasa znaków jest wtedy szybka.
+    start = previous = codepoints[0]
+    for c in codepoints[1:] + [None]:
+        if c is not None and c == previous + 1:
+            previous = c
+            continue
+        yield re.escape(chr(start)) if start == previous else f"{re.escape(chr(start))}-{re.escape(chr(previous))}"
+        if c is not None:
+            start = previous = c
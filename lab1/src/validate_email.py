@@ -1,5 +1,82 @@
+import csv
 import re
+from collections import Counter
+from itertools import islice
+from multiprocessing import Pool
+
+_PATTERN = re.compile(r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$')
+# Część lokalna z _PATTERN - pozwala ustalić przyczynę odrzucenia adresu.
+_LOCAL = re.compile(r'[a-zA-Z0-9_.+-]+')
+
+VALID = "ok"
+MISSING_AT = "brak znaku @"
+INVALID_LOCAL = "niepoprawna część lokalna"
+INVALID_DOMAIN = "niepoprawna domena"
+
 
 def validate_email(email):
-    pattern = r'^[a-zA-Z0-9_.+-]+@[a-zA-Z0-9-]+\.[a-zA-Z0-9-.]+$'
-    return bool(re.match(pattern, email))
\ No newline at end of file
+    return bool(_PATTERN.match(email))
+
+
+def email_verdict(email):
+    if _PATTERN.match(email):
+        return VALID
+    local, at, domain = email.partition("@")
+    if not at:
+        return MISSING_AT
+    if not _LOCAL.fullmatch(local):
+        return INVALID_LOCAL
+    return INVALID_DOMAIN
+
+
+def _verdict_chunk(emails):
+    return [(email, email_verdict(email)) for email in emails]
+
+
+def _read_unique(path, column, skip_header):
+    seen = set()
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        if skip_header:
+            next(reader, None)
+        for row in reader:
+            if len(row) <= column:
+                continue
+            email = row[column]
+            if email in seen:
+                continue
+            seen.add(email)
+            yield email
+
+
+def _chunks(iterable, size):
+    it = iter(iterable)
+    while True:
+        chunk = list(islice(it, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_email_file(path, valid_path, invalid_path, column=0,
+                        skip_header=False, workers=1, chunk_size=10000):
+    counts = Counter()
+    chunks = _chunks(_read_unique(path, column, skip_header), chunk_size)
+    pool = Pool(workers) if workers > 1 else None
+    try:
+        results = pool.imap(_verdict_chunk, chunks) if pool else map(_verdict_chunk, chunks)
+        with open(valid_path, "w", encoding="utf-8") as valid, \
+                open(invalid_path, "w", newline="", encoding="utf-8") as invalid:
+            invalid_writer = csv.writer(invalid)
+            for chunk in results:
+                for email, verdict in chunk:
+                    counts[verdict] += 1
+                    if verdict == VALID:
+                        valid.write(email + "\n")
+                    else:
+                        invalid_writer.writerow([email, verdict])
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+    return counts
@@ -1,4 +1,6 @@
+import io
 import unittest
+from decimal import Decimal
 from src.shopingCart import ShoppingCart
 
 
@@ -25,6 +27,102 @@ class TestShoppingCart(unittest.TestCase):
         self.cart.add_item("Jajka", 9.0)
         self.cart.clear()
         self.assertEqual(len(self.cart.items), 0)
+        self.assertEqual(self.cart.get_total(), 0)
+        self.assertEqual(self.cart.most_expensive(1), [])
+
+    def test_total_is_exact(self):
+        for i in range(10):
+            self.cart.add_item(f"Guma {i}", 0.1)
+        self.assertEqual(self.cart.get_total(), Decimal("1.0"))
+
+    def test_quantity(self):
+        self.cart.add_item("Piwo", 4.5, quantity=4)
+        self.assertEqual(self.cart.get_quantity("Piwo"), 4)
+        self.assertEqual(self.cart.get_total(), 18)
+        self.cart.add_item("Piwo", 5.0, quantity=2)
+        self.assertEqual(self.cart.get_total(), 10)
+        self.cart.remove_item("Piwo")
+        self.assertEqual(self.cart.get_total(), 0)
+        self.assertEqual(self.cart.get_quantity("Piwo"), 0)
+        with self.assertRaises(ValueError):
+            self.cart.add_item("Piwo", 4.5, quantity=0)
+
+    def test_remove_missing_item(self):
+        self.cart.add_item("Cola", 5.0)
+        self.cart.remove_item("Kawa")
+        self.assertEqual(self.cart.get_total(), 5)
+
+    def test_most_and_least_expensive(self):
+        self.cart.add_items([("Mleko", 3.0), ("Chleb", 4.0), ("Kawa", 25.0), ("Jajka", 9.0)])
+        self.assertEqual(self.cart.most_expensive(2), [("Kawa", 25.0), ("Jajka", 9.0)])
+        self.assertEqual(self.cart.least_expensive(1), [("Mleko", 3.0)])
+        self.cart.add_item("Kawa", 1.0)
+        self.assertEqual(self.cart.least_expensive(2), [("Kawa", 1.0), ("Mleko", 3.0)])
+        self.cart.remove_item("Jajka")
+        self.assertEqual(self.cart.most_expensive(1), [("Chleb", 4.0)])
+
+    def test_bulk_operations(self):
+        self.cart.add_items((f"Produkt {i}", i, 2) for i in range(1, 101))
+        self.assertEqual(self.cart.get_total(), 2 * 5050)
+        self.cart.add_items([("Produkt 1", 1000)])
+        self.assertEqual(self.cart.most_expensive(1), [("Produkt 1", 1000)])
+        self.cart.remove_items(f"Produkt {i}" for i in range(2, 101))
+        self.cart.remove_items(["Brak"])
+        self.assertEqual(self.cart.get_total(), 1000)
+        self.assertEqual(self.cart.least_expensive(5), [("Produkt 1", 1000)])
+
+    def test_bulk_duplicates(self):
+        self.cart.add_items([("Kawa", 10.0)] + [(f"P{i}", 1.0) for i in range(20)] + [("Kawa", 2.0)])
+        self.assertEqual(self.cart.most_expensive(1), [("Kawa", 2.0)])
+        self.assertEqual(len(self.cart.least_expensive(100)), 21)
+
+    def test_bulk_invalid_item(self):
+        with self.assertRaises(ValueError):
+            self.cart.add_items([("a", 1), ("b", 2, 0)])
+        self.assertEqual(self.cart.get_total(), 1)
+        self.assertEqual(self.cart.most_expensive(5), [("a", 1)])
+        with self.assertRaises(ValueError):
+            self.cart.add_items([(f"P{i}", i) for i in range(20)] + [("c", 5, -1)])
+        self.assertNotIn("c", self.cart.items)
+        self.assertEqual(len(self.cart.least_expensive(100)), len(self.cart.items))
+        source = io.StringIO("name,price,quantity\nMleko,3.10,2\nChleb,4.00,0\n")
+        with self.assertRaises(ValueError):
+            self.cart.import_csv(source, quantity_column="quantity")
+        self.assertIn(("Mleko", Decimal("3.10")), self.cart.least_expensive(100))
+
+    def test_snapshot_restore(self):
+        self.cart.add_item("Piwo", 4.5, quantity=6)
+        self.cart.add_item("Kawa", Decimal("19.99"))
+        for binary in (False, True):
+            restored = ShoppingCart.restore(self.cart.snapshot(binary=binary))
+            self.assertEqual(restored.items, self.cart.items)
+            self.assertEqual(restored.quantities, self.cart.quantities)
+            self.assertEqual(restored.get_total(), self.cart.get_total())
+        self.assertIsInstance(self.cart.snapshot(binary=True), bytes)
+
+    def test_diff_and_patch(self):
+        self.cart.add_items([("Mleko", 3.0), ("Chleb", 4.0), ("Kawa", 25.0)])
+        other = ShoppingCart()
+        other.add_items([("Mleko", 3.0), ("Chleb", 4.0, 2), ("Jajka", 9.0)])
+        patch = self.cart.diff(other)
+        self.assertNotIn("Mleko", patch)
+        self.cart.apply_patch(patch)
+        self.assertEqual(self.cart.items, other.items)
+        self.assertEqual(self.cart.quantities, other.quantities)
+        self.assertEqual(self.cart.get_total(), 20)
+        self.assertEqual(self.cart.most_expensive(1), [("Jajka", 9.0)])
+
+    def test_import_export_csv(self):
+        source = io.StringIO("name,price,quantity\nMleko,3.10,2\nChleb,4.00,1\nKawa,25,1\n")
+        self.cart.import_csv(source, quantity_column="quantity", batch_size=2)
+        self.assertEqual(self.cart.get_total(), Decimal("35.20"))
+        exported = io.StringIO()
+        self.cart.export_csv(exported)
+        exported.seek(0)
+        copy = ShoppingCart()
+        copy.import_csv(exported, quantity_column="quantity")
+        self.assertEqual(copy.items, self.cart.items)
+        self.assertEqual(copy.get_total(), self.cart.get_total())
 
 
 if __name__ == '__main__':
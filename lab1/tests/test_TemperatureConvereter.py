@@ -1,4 +1,6 @@
 from src.TemperatureConverter import *
+from array import array
+import io
 import unittest
 
 class TestTemperatureConverter(unittest.TestCase):
@@ -25,6 +27,62 @@ class TestTemperatureConverter(unittest.TestCase):
         self.assertAlmostEqual(self.converter.kelvin_to_celsius(0), -273.15)
         self.assertAlmostEqual(self.converter.kelvin_to_celsius(373.15), 100)
 
+    def test_convert_composed(self):
+        self.assertAlmostEqual(self.converter.convert(32, "F", "K"), 273.15)
+        self.assertAlmostEqual(self.converter.convert(212, "F", "K"), 373.15)
+        self.assertAlmostEqual(self.converter.convert(0, "K", "F"), -459.67)
+        with self.assertRaises(ValueError):
+            self.converter.convert(0, "C", "X")
+
+    def test_convert_array(self):
+        result = self.converter.convert_array(array("d", [0, 100, -273.15]), "C", "F")
+        for value, expected in zip(result, [32, 212, -459.67]):
+            self.assertAlmostEqual(value, expected)
+
+    def test_convert_array_inplace(self):
+        readings = array("d", [68, 14, 122])
+        result = self.converter.convert_array(readings, "F", "C", inplace=True)
+        self.assertIs(result, readings)
+        for value, expected in zip(readings, [20, -10, 50]):
+            self.assertAlmostEqual(value, expected)
+
+    def test_convert_array_buffers(self):
+        self.assertEqual(self.converter.convert_array(array("i", [0, 100]), "C", "F"), array("d", [32, 212]))
+        self.assertEqual(self.converter.convert_array(array("d"), "C", "F"), array("d"))
+        readings = array("f", [0, 100])
+        view = memoryview(readings)
+        self.assertIs(self.converter.convert_array(view, "C", "F", inplace=True), view)
+        self.assertEqual(list(readings), [32, 212])
+
+    def test_convert_memoryview_inplace(self):
+        buffer = bytearray(array("f", [0, 100]).tobytes())
+        self.converter.convert_array(memoryview(buffer).cast("f"), "C", "K", inplace=True)
+        for value, expected in zip(array("f", buffer), [273.15, 373.15]):
+            self.assertAlmostEqual(value, expected, places=4)
+
+    def test_convert_inplace_requires_floats(self):
+        readings = array("i", [32, 212])
+        with self.assertRaises(ValueError):
+            self.converter.convert_array(readings, "F", "C", inplace=True)
+        with self.assertRaises(ValueError):
+            self.converter.convert_array(memoryview(bytearray(8)).cast("i"), "C", "K", inplace=True)
+        self.assertEqual(list(readings), [32, 212])
+        try:
+            import numpy as np
+        except ImportError:
+            return
+        with self.assertRaises(ValueError):
+            self.converter.convert_array(np.array([32, 212]), "F", "C", inplace=True)
+        self.assertEqual(self.converter.convert_array(np.array([32, 212]), "F", "C").tolist(), [0, 100])
+
+    def test_convert_csv(self):
+        source = io.StringIO("czujnik,temp\nA,32\nB,\nC,212\n")
+        destination = io.StringIO()
+        self.converter.convert_csv(source, destination, 1, "F", "C")
+        rows = destination.getvalue().splitlines()
+        self.assertEqual(rows[:3], ["czujnik,temp", "A,0.0", "B,"])
+        self.assertAlmostEqual(float(rows[3].split(",")[1]), 100)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,3 +1,5 @@
+import asyncio
+import threading
 import unittest
 from src.BankAccount import *
 
@@ -29,6 +31,82 @@ class TestBankAccount(unittest.TestCase):
     def test_get_balance(self):
         self.assertEqual(self.account.get_balance(), 1000)
 
+    def test_ledger(self):
+        self.account.deposit(500)
+        self.account.withdraw(300)
+        self.assertEqual(self.account.ledger, [(DEPOSIT, 500, 1500), (WITHDRAW, 300, 1200)])
+
+    def test_failed_withdraw_not_in_ledger(self):
+        with self.assertRaises(InsufficientFundsException):
+            self.account.withdraw(2000)
+        self.assertEqual(self.account.ledger, [])
+
+    def test_apply_batch(self):
+        self.account.apply_batch([(WITHDRAW, 800), (DEPOSIT, 100), (WITHDRAW, 300)])
+        self.assertEqual(self.account.get_balance(), 0)
+        self.assertEqual(len(self.account.ledger), 3)
+
+    def test_apply_batch_is_atomic(self):
+        with self.assertRaises(InsufficientFundsException):
+            self.account.apply_batch([(WITHDRAW, 800), (WITHDRAW, 300), (DEPOSIT, 500)])
+        with self.assertRaises(ValueError):
+            self.account.apply_batch([(DEPOSIT, 100), (DEPOSIT, -1)])
+        with self.assertRaises(ValueError):
+            self.account.apply_batch([("transfer", 100)])
+        self.assertEqual(self.account.get_balance(), 1000)
+        self.assertEqual(self.account.ledger, [])
+
+    def test_concurrent_operations(self):
+        def worker():
+            for _ in range(1000):
+                self.account.deposit(2)
+                self.account.withdraw(1)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.account.get_balance(), 1000 + 8 * 1000)
+        self.assertEqual(len(self.account.ledger), 8 * 2000)
+
+
+class TestAsyncBankAccount(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.account = AsyncBankAccount(1000, batch_chunk=2)
+
+    async def test_deposit_withdraw(self):
+        await self.account.deposit(500)
+        await self.account.withdraw(300)
+        self.assertEqual(self.account.get_balance(), 1200)
+        self.assertEqual(self.account.ledger, [(DEPOSIT, 500, 1500), (WITHDRAW, 300, 1200)])
+
+    async def test_validation(self):
+        with self.assertRaises(ValueError):
+            await self.account.deposit(-150)
+        with self.assertRaises(ValueError):
+            await self.account.withdraw(0)
+        with self.assertRaises(InsufficientFundsException):
+            await self.account.withdraw(2000)
+        self.assertEqual(self.account.get_balance(), 1000)
+
+    async def test_apply_batch_is_atomic(self):
+        await self.account.apply_batch([(DEPOSIT, 100)] * 5)
+        self.assertEqual(self.account.get_balance(), 1500)
+        with self.assertRaises(InsufficientFundsException):
+            await self.account.apply_batch([(WITHDRAW, 1000), (DEPOSIT, 1), (WITHDRAW, 600)])
+        self.assertEqual(self.account.get_balance(), 1500)
+        self.assertEqual(len(self.account.ledger), 5)
+
+    async def test_many_coroutines(self):
+        async def worker():
+            await self.account.deposit(2)
+            await self.account.withdraw(1)
+
+        await asyncio.gather(*(worker() for _ in range(1000)),
+                             self.account.apply_batch([(DEPOSIT, 1)] * 10))
+        self.assertEqual(self.account.get_balance(), 2010)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,5 +1,7 @@
+import decimal
 import unittest
-from src.calculator import Calculator
+from fractions import Fraction
+from src.calculator import Calculator, np
 
 
 class TestCalculator(unittest.TestCase):
@@ -23,6 +25,88 @@ class TestCalculator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.calc.divide(5, 0)
 
+    def testMany(self):
+        self.assertEqual(self.calc.add_many([1, 2], [3, 4]), [4, 6])
+        self.assertEqual(self.calc.subtract_many([5, 6], 1), [4, 5])
+        self.assertEqual(self.calc.multiply_many(2, [3, 4]), [6, 8])
+        self.assertEqual(self.calc.divide_many([6, 8], [2, 4]), [3, 2])
+
+    def testDivideManyByZero(self):
+        with self.assertRaises(ValueError):
+            self.calc.divide_many([1, 2], [1, 0])
+        self.assertEqual(self.calc.divide_many([1, 2], [0, 4], masked=True), [None, 0.5])
+
+    def testManyLengthMismatch(self):
+        with self.assertRaises(ValueError):
+            self.calc.add_many([1, 2], [1])
+
+    def testCompile(self):
+        expr = self.calc.compile("(a + b) * 2 - a / b")
+        self.assertEqual(expr.variables, ("a", "b"))
+        self.assertEqual(expr(4, 2), 10)
+        self.assertEqual(expr(b=2, a=4), 10)
+        self.assertEqual(expr.evaluate_many([(1, 1), (3, 4)]), [3, 13.25])
+        self.assertEqual(self.calc.compile("-x + 1", variables=["x", "y"])(2, 5), -1)
+
+    def testCompileDivideByZero(self):
+        with self.assertRaises(ValueError):
+            self.calc.compile("a / (b - 1)")(1, 1)
+
+    @unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+    def testCompileArrays(self):
+        x = np.array([1., 2., 3.])
+        self.assertEqual(self.calc.compile("1/2*3 + x")(x).tolist(), [2.5, 3.5, 4.5])
+        self.assertEqual(self.calc.compile("-(1/2) + x")(x).tolist(), [0.5, 1.5, 2.5])
+        self.assertEqual(self.calc.compile("x / 2 + 1 / x")(x).tolist(), [1.5, 1.5, 1.5 + 1 / 3])
+        self.assertEqual(self.calc.compile("a / b")(x, 2.0).tolist(), [0.5, 1.0, 1.5])
+        with self.assertRaises(ValueError):
+            self.calc.compile("1 / (x - 2)")(x)
+        with self.assertRaises(ValueError):
+            self.calc.compile("x / (1 - 1)")(x)
+
+    def testCompileInvalid(self):
+        for formula in ["a +", "__import__('os')", "a ** 2", "f(a)", "'x'", "_divide"]:
+            with self.assertRaises(ValueError):
+                self.calc.compile(formula)
+        with self.assertRaises(ValueError):
+            self.calc.compile("a + b", variables=["a"])
+
+    def testUnknownMode(self):
+        with self.assertRaises(ValueError):
+            Calculator(mode="binary")
+
+    def testDecimalMode(self):
+        calc = Calculator(mode="decimal")
+        self.assertEqual(calc.add(0.1, 0.2), decimal.Decimal("0.3"))
+        self.assertEqual(calc.multiply("1.10", 3), decimal.Decimal("3.30"))
+        self.assertEqual(calc.divide(1, 4), decimal.Decimal("0.25"))
+        with self.assertRaises(ValueError):
+            calc.divide(1, 0)
+        with self.assertRaises(ValueError):
+            calc.divide(1, "0")
+
+    def testDecimalContextIsReused(self):
+        context = decimal.Context(prec=3)
+        calc = Calculator(mode="decimal", context=context)
+        self.assertIs(calc.context, context)
+        self.assertEqual(calc.divide(1, 3), decimal.Decimal("0.333"))
+        self.assertEqual(decimal.getcontext().prec, 28)
+
+    def testFractionMode(self):
+        calc = Calculator(mode="fraction")
+        self.assertEqual(calc.divide(1, 3), Fraction(1, 3))
+        self.assertEqual(calc.subtract(0.3, 0.1), Fraction(1, 5))
+        self.assertEqual(calc.multiply_many([Fraction(1, 3), 2], 3), [1, 6])
+        self.assertEqual(calc.divide_many([1, 2], [0, 3], masked=True), [None, Fraction(2, 3)])
+        with self.assertRaises(ValueError):
+            calc.divide(1, "0")
+
+    def testCompileExactMode(self):
+        expr = Calculator(mode="fraction").compile("-a / 3 + 0.1")
+        self.assertEqual(expr(1), Fraction(-7, 30))
+        expr = Calculator(mode="decimal", context=decimal.Context(prec=4)).compile("a / b")
+        self.assertEqual(expr(2, 3), decimal.Decimal("0.6667"))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -14,5 +14,25 @@ class TestIsPalindrome(unittest.TestCase):
     def testEmpty(self):
         self.assertTrue(is_palindrome(""))
 
+    def testFastMatchesRegex(self):
+        for s in ["kajak", "Kobyła ma mały bok", "A man, a plan, a canal: Panama",
+                  "karol ślimak", "Fakultet", "!@#$#@!", "ąbą", ""]:
+            self.assertEqual(is_palindrome_fast(s), is_palindrome(s))
+
+    def testBatch(self):
+        result = list(are_palindromes(["kajak", "Fakultet", "12321"]))
+        self.assertEqual(result, [True, False, True])
+
+    def testLongestPalindromicSubstring(self):
+        self.assertEqual(longest_palindromic_substring("babad"), "bab")
+        self.assertEqual(longest_palindromic_substring("cbbd"), "bb")
+        self.assertEqual(longest_palindromic_substring("xkajaky"), "kajak")
+        self.assertEqual(longest_palindromic_substring(""), "")
+
+    def testCountPalindromicSubstrings(self):
+        self.assertEqual(count_palindromic_substrings("abc"), 3)
+        self.assertEqual(count_palindromic_substrings("aaa"), 6)
+        self.assertEqual(count_palindromic_substrings(""), 0)
+
 if __name__ == "__main__":
     unittest.main()
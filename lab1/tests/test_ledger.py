@@ -0,0 +1,97 @@
+import threading
+import unittest
+from decimal import Decimal
+from src.BankAccount import InsufficientFundsException
+from src.ledger import Ledger
+
+
+class TestLedger(unittest.TestCase):
+    def setUp(self):
+        self.ledger = Ledger()
+        self.ledger.open_account("anna", 1000, timestamp=0)
+        self.ledger.open_account("jan", 100, timestamp=0)
+
+    def test_open_account_twice(self):
+        with self.assertRaises(ValueError):
+            self.ledger.open_account("anna")
+
+    def test_unknown_account(self):
+        with self.assertRaises(KeyError):
+            self.ledger.deposit("ewa", 10)
+
+    def test_balance_at(self):
+        self.ledger.deposit("anna", 500, timestamp=10)
+        self.ledger.withdraw("anna", 200, timestamp=20)
+        self.assertEqual(self.ledger.balance_at("anna", -1), 0)
+        self.assertEqual(self.ledger.balance_at("anna", 5), 1000)
+        self.assertEqual(self.ledger.balance_at("anna", 10), 1500)
+        self.assertEqual(self.ledger.balance_at("anna", 100), 1300)
+        self.assertEqual(self.ledger.accounts["anna"].get_balance(), 1300)
+
+    def test_exact_amounts(self):
+        self.ledger.open_account("ewa", Decimal("0.10"), timestamp=0)
+        self.ledger.deposit("ewa", Decimal("0.20"), timestamp=1)
+        self.assertEqual(self.ledger.balance_at("ewa", 1), Decimal("0.30"))
+        self.ledger.open_account("bank", 10 ** 20 + 1, timestamp=0)
+        self.ledger.withdraw("bank", 1, timestamp=1)
+        self.assertEqual(self.ledger.balance_at("bank", 0), 10 ** 20 + 1)
+        self.assertEqual(self.ledger.statement("bank", start=1), [(1, -1, 10 ** 20)])
+
+    def test_single_record_per_operation(self):
+        self.ledger.deposit("jan", 50, timestamp=10)
+        self.ledger.transfer("jan", "anna", 100, timestamp=20)
+        account = self.ledger.accounts["jan"]
+        self.assertEqual(list(account.ledger), [("deposit", 50, 150), ("withdraw", 100, 50)])
+        self.assertEqual(len(account.ledger), 2)
+        self.assertEqual(self.ledger.statement("jan", start=20), [(20, -100, 50)])
+        # Kwoty całkowite przechowywane są w tablicach typowanych, nie w listach.
+        self.assertNotIsInstance(account.ledger.amounts, list)
+        self.assertNotIsInstance(account.ledger.balances, list)
+
+    def test_transfer(self):
+        self.ledger.transfer("anna", "jan", 300, timestamp=5)
+        self.assertEqual(self.ledger.accounts["anna"].get_balance(), 700)
+        self.assertEqual(self.ledger.accounts["jan"].get_balance(), 400)
+        self.assertEqual(self.ledger.balance_at("jan", 4), 100)
+
+    def test_failed_transfer_changes_nothing(self):
+        with self.assertRaises(InsufficientFundsException):
+            self.ledger.transfer("jan", "anna", 500, timestamp=5)
+        with self.assertRaises(ValueError):
+            self.ledger.transfer("jan", "jan", 50, timestamp=5)
+        self.assertEqual(self.ledger.accounts["anna"].get_balance(), 1000)
+        self.assertEqual(self.ledger.accounts["jan"].get_balance(), 100)
+        self.assertEqual(len(self.ledger.statement("jan")), 1)
+
+    def test_out_of_order_timestamp(self):
+        self.ledger.deposit("anna", 10, timestamp=10)
+        with self.assertRaises(ValueError):
+            self.ledger.deposit("anna", 10, timestamp=5)
+
+    def test_statement(self):
+        self.ledger.deposit("jan", 50, timestamp=10)
+        self.ledger.transfer("jan", "anna", 100, timestamp=20)
+        self.ledger.withdraw("jan", 25, timestamp=30)
+        self.assertEqual(self.ledger.statement("jan", start=10, end=20), [(10, 50, 150), (20, -100, 50)])
+        self.assertEqual(len(self.ledger.statement("jan")), 4)
+
+    def test_concurrent_opposite_transfers(self):
+        def worker(source, target):
+            for _ in range(2000):
+                self.ledger.transfer(source, target, 1)
+
+        self.ledger.deposit("anna", 9000)
+        self.ledger.deposit("jan", 9900)
+        threads = [threading.Thread(target=worker, args=pair)
+                   for pair in [("anna", "jan"), ("jan", "anna")] * 4]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(self.ledger.accounts["anna"].get_balance(), 10000)
+        self.assertEqual(self.ledger.accounts["jan"].get_balance(), 10000)
+        self.assertEqual(len(self.ledger.statement("anna")), 2 + 8 * 2000)
+
+
+if __name__ == "__main__":
+    unittest.main()
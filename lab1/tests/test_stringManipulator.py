@@ -1,3 +1,6 @@
+import io
+import os
+import tempfile
 import unittest
 from src.stringManipulator import StringManipulator
 
@@ -5,6 +8,10 @@ class TestStringManipulator(unittest.TestCase):
 
     def setUp(self):
         self.stm = StringManipulator()
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
 
     def testReverse(self):
         self.assertEqual(self.stm.reverse_string("python"),"nohtyp")
@@ -22,5 +29,78 @@ class TestStringManipulator(unittest.TestCase):
         self.assertEqual(self.stm.capitalize_words(""), "")
         self.assertEqual(self.stm.capitalize_words("543"), "543")
 
+    def testReverseGraphemes(self):
+        self.assertEqual(self.stm.reverse_graphemes("python"), "nohtyp")
+        self.assertEqual(self.stm.reverse_graphemes("cafe\u0301!"), "!e\u0301fac")
+        self.assertEqual(self.stm.reverse_graphemes("a\U0001F44D\U0001F3FDb"), "b\U0001F44D\U0001F3FDa")
+        self.assertEqual(self.stm.reverse_graphemes("\U0001F1F5\U0001F1F1x"), "x\U0001F1F5\U0001F1F1")
+        self.assertEqual(self.stm.reverse_graphemes(""), "")
+
+    def testCountWordsStream(self):
+        text = "zemsta  Monitora\nna   Cynamonkach "
+        chunks = [text[i:i + 3] for i in range(0, len(text), 3)]
+        self.assertEqual(self.stm.count_words_stream(chunks), 4)
+        self.assertEqual(self.stm.count_words_stream(io.StringIO(text)), 4)
+        self.assertEqual(self.stm.count_words_stream([]), 0)
+
+    def testCapitalizeStream(self):
+        text = "ostatnia godzina, rage i 543abc"
+        chunks = [text[i:i + 4] for i in range(0, len(text), 4)]
+        self.assertEqual("".join(self.stm.capitalize_stream(chunks)), text.title())
+        # Znak zmieniający długość po title() na końcu kawałka.
+        self.assertEqual("".join(self.stm.capitalize_stream(["a ß", "x yz"])), "a ßx yz".title())
+        self.assertEqual("".join(self.stm.capitalize_stream(["x \ufb01", "ne day"])), "x \ufb01ne day".title())
+
+    def testReverseStream(self):
+        text = "cafe\u0301 de\u0301ja\u0300 vu"
+        for size in (1, 2, 5):
+            chunks = [text[i:i + size] for i in range(0, len(text), size)]
+            self.assertEqual("".join(self.stm.reverse_stream(chunks)), self.stm.reverse_graphemes(text))
+        self.assertEqual("".join(self.stm.reverse_stream(io.StringIO("python"))), "nohtyp")
+
+    def testMany(self):
+        self.assertEqual(self.stm.reverse_many(["abc", ""]), ["cba", ""])
+        self.assertEqual(self.stm.count_words_many(["a b", "", "c"]), [2, 0, 1])
+        self.assertEqual(self.stm.capitalize_many(["rage", "ostatnia godzina"]), ["Rage", "Ostatnia Godzina"])
+
+    def _write(self, text):
+        path = os.path.join(self.tmp.name, "tekst.txt")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        return path
+
+    def testFileModes(self):
+        text = "Zażółć gęślą jaźń\r\ncafe\u0301 \U0001F44D\U0001F3FD \U0001F469\u200d\U0001F467 koniec\n" * 20
+        path = self._write(text)
+        reversed_path = os.path.join(self.tmp.name, "odwrocony.txt")
+        for window in (24, 50, 1 << 20):
+            self.assertEqual(self.stm.count_words_file(path, window=window), len(text.split()))
+            self.stm.reverse_file(path, reversed_path, window=window)
+            with open(reversed_path, encoding="utf-8", newline="") as f:
+                self.assertEqual(f.read(), self.stm.reverse_graphemes(text))
+
+    def testRegionalIndicatorRuns(self):
+        # Granica okna lub kawałka wewnątrz ciągu flag nie może zmienić ich parowania.
+        text = "ab \U0001F1F5\U0001F1F1\U0001F1E9\U0001F1EA\U0001F1EB\U0001F1F7 cd"
+        expected = "dc \U0001F1EB\U0001F1F7\U0001F1E9\U0001F1EA\U0001F1F5\U0001F1F1 ba"
+        self.assertEqual(self.stm.reverse_graphemes(text), expected)
+        path = self._write(text)
+        reversed_path = os.path.join(self.tmp.name, "odwrocony.txt")
+        for window in range(8, 40):
+            self.stm.reverse_file(path, reversed_path, window=window)
+            with open(reversed_path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), expected, window)
+        for i in range(1, len(text)):
+            self.assertEqual("".join(self.stm.reverse_stream([text[:i], text[i:]])), expected, i)
+
+    def testFileModesEmpty(self):
+        path = self._write("")
+        self.assertEqual(self.stm.count_words_file(path), 0)
+        self.stm.reverse_file(path, path + ".out")
+        self.assertEqual(os.path.getsize(path + ".out"), 0)
+        with self.assertRaises(ValueError):
+            self.stm.reverse_file(path, path + ".out", window=3)
+
+
 if __name__ == '__main__':
     unittest.main()
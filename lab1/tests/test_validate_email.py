@@ -1,5 +1,7 @@
+import os
+import tempfile
 import unittest
-from src.validate_email import validate_email
+from src.validate_email import *
 
 class MyTestCase(unittest.TestCase):
 
@@ -13,6 +15,41 @@ class MyTestCase(unittest.TestCase):
         self.assertFalse(validate_email("wrongcom.com"))
         self.assertFalse(validate_email("kolejnymail@"))
 
+    def test_verdict_reasons(self):
+        self.assertEqual(email_verdict("123@example.com"), VALID)
+        self.assertEqual(email_verdict("wrongcom.com"), MISSING_AT)
+        self.assertEqual(email_verdict("zły@example.com"), INVALID_LOCAL)
+        self.assertEqual(email_verdict("kolejnymail@"), INVALID_DOMAIN)
+
+    def test_verdict_matches_regex(self):
+        for email in ["A@B.CO", "a@b.c\n", "a@@b.c", "a@b", "\u212a@b.c", ".@-.-", "a b@c.d"]:
+            self.assertEqual(email_verdict(email) == VALID, validate_email(email))
+
+    def _run_file(self, workers):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = os.path.join(tmp, "in.csv")
+            valid_path = os.path.join(tmp, "valid.txt")
+            invalid_path = os.path.join(tmp, "invalid.csv")
+            with open(source, "w", encoding="utf-8") as f:
+                f.write("id,email\n1,123@example.com\n2,wrongcom.com\n"
+                        "3,123@example.com\n4,kolejnymail@\n5,test@outlook.com\n")
+            counts = validate_email_file(source, valid_path, invalid_path, column=1,
+                                         skip_header=True, workers=workers, chunk_size=2)
+            with open(valid_path, encoding="utf-8") as f:
+                valid = f.read().split()
+            with open(invalid_path, encoding="utf-8") as f:
+                invalid = f.read().splitlines()
+        return counts, valid, invalid
+
+    def test_validate_file(self):
+        counts, valid, invalid = self._run_file(workers=1)
+        self.assertEqual(valid, ["123@example.com", "test@outlook.com"])
+        self.assertEqual(invalid, ["wrongcom.com," + MISSING_AT, "kolejnymail@," + INVALID_DOMAIN])
+        self.assertEqual(counts, {VALID: 2, MISSING_AT: 1, INVALID_DOMAIN: 1})
+
+    def test_validate_file_processes(self):
+        self.assertEqual(self._run_file(workers=2), self._run_file(workers=1))
+
 
 if __name__ == '__main__':
     unittest.main()
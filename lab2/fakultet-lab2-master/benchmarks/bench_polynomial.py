@@ -0,0 +1,47 @@
+import random
+import timeit
+
+from src.polynomial import Polynomial
+
+
+def _random_polynomial(degree):
+    return Polynomial([random.randint(-100, 100) for _ in range(degree + 1)])
+
+
+def main():
+    random.seed(0)
+    for degree in (10, 1000, 100_000):
+        p = _random_polynomial(degree)
+        q = _random_polynomial(degree)
+        number = max(1, 100_000 // degree)
+        t = timeit.timeit(lambda: p.evaluate(0.999), number=number) / number
+        print(f"deg {degree:>6}: evaluate {t * 1e3:.3f} ms", end="")
+        t = timeit.timeit(lambda: p + q, number=number) / number
+        print(f", add {t * 1e3:.3f} ms", end="")
+        t = timeit.timeit(lambda: p - q, number=number) / number
+        print(f", sub {t * 1e3:.3f} ms")
+
+    for degree in (10, 100, 1000, 3000, 100_000):
+        p = _random_polynomial(degree)
+        q = _random_polynomial(degree)
+        t = timeit.timeit(lambda: p * q, number=1)
+        print(f"deg {degree:>6}: multiply {t * 1e3:.3f} ms")
+
+    for degree, points in ((500, 500), (2000, 2000)):
+        p = _random_polynomial(degree)
+        xs = [random.randint(-2, 2) for _ in range(points)]
+        for method in ("horner", "tree"):
+            t = timeit.timeit(lambda: p.evaluate_many(xs, method=method), number=1)
+            print(f"deg {degree:>6}, {points} points: evaluate_many {method} {t:.3f} s")
+    try:
+        import numpy as np
+    except ImportError:
+        return
+    p = _random_polynomial(100)
+    xs = np.linspace(-1, 1, 1_000_000)
+    t = timeit.timeit(lambda: p.evaluate_many(xs), number=1)
+    print(f"deg 100, 10^6 NumPy points: evaluate_many {t:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
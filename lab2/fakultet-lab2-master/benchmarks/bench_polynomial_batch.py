@@ -0,0 +1,36 @@
+import random
+import timeit
+
+from src.polynomial import Polynomial, np
+from src.polynomial_batch import PolynomialBatch
+
+
+def _report(name, loop, batch, number):
+    t_loop = timeit.timeit(loop, number=number) / number
+    t_batch = timeit.timeit(batch, number=number) / number
+    print(f"  {name:>10}: loop {t_loop * 1e3:9.2f} ms, batch {t_batch * 1e3:8.2f} ms, "
+          f"speedup {t_loop / t_batch:6.1f}x")
+
+
+def main():
+    if np is None:
+        print("PolynomialBatch requires NumPy - skipping")
+        return
+    random.seed(0)
+    for count, degree in ((10_000, 10), (5_000, 50), (1_000, 200)):
+        print(f"{count} polynomials of degree {degree}")
+        for kind, draw in (("int", lambda: random.randint(-99, 99)), ("float", lambda: random.gauss(0, 1))):
+            ps = [Polynomial([draw() for _ in range(degree + 1)]) for _ in range(count)]
+            qs = [Polynomial([draw() for _ in range(degree + 1)]) for _ in range(count)]
+            a = PolynomialBatch.from_polynomials(ps)
+            b = PolynomialBatch.from_polynomials(qs)
+            _report(f"{kind} add", lambda: [p + q for p, q in zip(ps, qs)], lambda: a + b, 3)
+            _report(f"{kind} sub", lambda: [p - q for p, q in zip(ps, qs)], lambda: a - b, 3)
+            _report(f"{kind} mul", lambda: [p * q for p, q in zip(ps, qs)], lambda: a * b, 3)
+            _report(f"{kind} eval", lambda: [p.evaluate(1.5) for p in ps], lambda: a.evaluate(1.5), 3)
+        t_convert = timeit.timeit(lambda: PolynomialBatch.from_polynomials(ps).to_polynomials(), number=1)
+        print(f"  round trip list -> batch -> list: {t_convert * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+import random
+import timeit
+
+from src.polynomial import Polynomial, np
+
+
+def main():
+    random.seed(0)
+    for degree in (4, 20, 100, 1000):
+        p = Polynomial([random.uniform(-1, 1) for _ in range(degree + 1)])
+        # Nowa instancja za każdym razem, żeby mierzyć generowanie kodu, a nie pamięć podręczną.
+        t_compile = timeit.timeit(lambda: Polynomial(p.coeff).compile(), number=10) / 10
+        f = p.compile()
+        evaluate = p.evaluate
+        number = max(1_000, 1_000_000 // degree)
+        t_evaluate = timeit.timeit("evaluate(0.7)", globals=locals(), number=number) / number
+        t_compiled = timeit.timeit("f(0.7)", globals=locals(), number=number) / number
+        print(f"deg {degree:>5}: evaluate {t_evaluate * 1e6:.3f} us, compiled {t_compiled * 1e6:.3f} us "
+              f"({t_evaluate / t_compiled:.1f}x), compile {t_compile * 1e3:.2f} ms")
+    if np is not None:
+        p = Polynomial([random.uniform(-1, 1) for _ in range(11)])
+        f = p.compile()
+        xs = np.linspace(-1, 1, 1_000_000)
+        t_many = timeit.timeit(lambda: p.evaluate_many(xs), number=5) / 5
+        t_compiled = timeit.timeit(lambda: f(xs), number=5) / 5
+        print(f"deg 10, 10^6 NumPy points: evaluate_many {t_many * 1e3:.1f} ms, compiled {t_compiled * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
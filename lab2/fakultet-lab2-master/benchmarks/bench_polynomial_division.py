@@ -0,0 +1,47 @@
+import random
+import timeit
+from unittest import mock
+
+from src.polynomial import Polynomial
+
+PRIME = 998_244_353
+
+
+def _random_polynomial(degree):
+    return Polynomial([random.randrange(1, PRIME)] + [random.randrange(PRIME) for _ in range(degree)])
+
+
+def _time(func, **thresholds):
+    if not thresholds:
+        return timeit.timeit(func, number=1)
+    with mock.patch.multiple("src.polynomial", **thresholds):
+        return timeit.timeit(func, number=1)
+
+
+def main():
+    random.seed(0)
+    slow = 10 ** 9
+    print(f"GF({PRIME})")
+    for degree in (1000, 2000, 4000, 8000):
+        a = _random_polynomial(2 * degree)
+        b = _random_polynomial(degree)
+        fast = _time(lambda: a.divide(b, modulus=PRIME))
+        plain = _time(lambda: a.divide(b, modulus=PRIME), DIVISION_THRESHOLD=slow)
+        print(f"deg {2 * degree:>6} / {degree:>5}: divide newton {fast:.3f} s, schoolbook {plain:.3f} s")
+
+        c = _random_polynomial(degree)
+        d = _random_polynomial(degree - 1)
+        fast = _time(lambda: c.gcd(d, modulus=PRIME))
+        plain = _time(lambda: c.gcd(d, modulus=PRIME), HGCD_THRESHOLD=slow)
+        print(f"deg {degree:>6}: gcd half-gcd {fast:.3f} s, euclid {plain:.3f} s")
+
+    for degree in (256, 1024):
+        m = _random_polynomial(degree)
+        x = Polynomial([1, 0])
+        fast = _time(lambda: x.powmod(PRIME, m, modulus=PRIME))
+        plain = _time(lambda: x.powmod(PRIME, m, modulus=PRIME), DIVISION_THRESHOLD=slow)
+        print(f"deg {degree:>6}: powmod x^p newton {fast:.3f} s, schoolbook {plain:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
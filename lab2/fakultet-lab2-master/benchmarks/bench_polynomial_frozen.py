@@ -0,0 +1,54 @@
+import random
+import timeit
+from functools import lru_cache
+
+from src.polynomial import FrozenPolynomial, Polynomial
+
+
+@lru_cache(maxsize=None)
+def _product(a, b):
+    return a * b
+
+
+def _power(p, n):
+    """Potęgowanie przez podnoszenie do kwadratu; kwadraty p^(2^k) powtarzają się między wykładnikami."""
+    result = FrozenPolynomial([1])
+    while n:
+        if n & 1:
+            result = _product(result, p)
+        n >>= 1
+        if n:
+            p = _product(p, p)
+    return result
+
+
+def main():
+    random.seed(0)
+    # Iloczyny par z niewielkiej puli wielomianów o rozkładzie Zipfa - typowe powtórzenia.
+    pool = [Polynomial([random.randint(-9, 9) for _ in range(200)]).freeze(intern=True) for _ in range(50)]
+    weights = [1 / (i + 1) for i in range(len(pool))]
+    pairs = [tuple(random.choices(pool, weights, k=2)) for _ in range(5_000)]
+
+    plain = timeit.timeit(lambda: [a * b for a, b in pairs], number=1)
+    _product.cache_clear()
+    cached = timeit.timeit(lambda: [_product(a, b) for a, b in pairs], number=1)
+    info = _product.cache_info()
+    print(f"5000 products of 50 deg-200 polynomials: plain {plain:.3f} s, memoized {cached:.3f} s, "
+          f"hit rate {info.hits / (info.hits + info.misses):.1%}")
+
+    _product.cache_clear()
+    base = FrozenPolynomial([1, -1, 2])
+    plain = timeit.timeit(lambda: [base ** n for n in range(1, 301)], number=1)
+    cached = timeit.timeit(lambda: [_power(base, n) for n in range(1, 301)], number=1)
+    info = _product.cache_info()
+    print(f"powers p^1..p^300: plain {plain:.3f} s, memoized {cached:.3f} s, "
+          f"hit rate {info.hits / (info.hits + info.misses):.1%}")
+
+    p = pool[0]
+    t_str = timeit.timeit(lambda: str(p), number=1000) / 1000
+    t_plain = timeit.timeit(lambda: str(p.thaw()), number=1000) / 1000
+    print(f"str(deg 200): cached {t_str * 1e6:.2f} us, recomputed {t_plain * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+import random
+import timeit
+
+from src.polynomial import Polynomial
+
+PRIME = 998_244_353
+
+
+def main():
+    random.seed(0)
+    for n in (500, 1000, 2000):
+        xs = random.sample(range(PRIME), n)
+        ys = [random.randrange(PRIME) for _ in range(n)]
+        for method in ("newton", "lagrange", "fast"):
+            t = timeit.timeit(lambda: Polynomial.interpolate(xs, ys, method=method, modulus=PRIME), number=1)
+            print(f"{n:>6} points GF(p): interpolate {method} {t:.3f} s")
+    for n in (10_000, 100_000):
+        xs = random.sample(range(PRIME), n)
+        ys = [random.randrange(PRIME) for _ in range(n)]
+        t = timeit.timeit(lambda: Polynomial.interpolate(xs, ys, method="fast", modulus=PRIME), number=1)
+        print(f"{n:>6} points GF(p): interpolate fast {t:.3f} s")
+
+    xs = [i / 1000 for i in range(100_000)]
+    ys = [0.5 * x ** 3 - x + 2 + random.gauss(0, 0.1) for x in xs]
+    for degree in (3, 8):
+        t = timeit.timeit(lambda: Polynomial.fit(xs, ys, degree), number=1)
+        print(f"10^5 samples: fit degree {degree} {t:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
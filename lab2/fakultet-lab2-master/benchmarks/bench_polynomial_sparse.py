@@ -0,0 +1,45 @@
+import timeit
+import tracemalloc
+
+from src.polynomial import Polynomial
+
+
+def _memory(build):
+    tracemalloc.start()
+    value = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def main():
+    degree = 1_000_000
+    terms = {degree: 1, degree // 2: -3, 7: 2, 0: 1}
+    dense_coeff = [0] * (degree + 1)
+    for power, c in terms.items():
+        dense_coeff[degree - power] = c
+
+    sparse = Polynomial.from_terms(terms)
+    dense = Polynomial(dense_coeff)
+    print(f"deg {degree}, {len(terms)} terms: {type(sparse).__name__} vs dense Polynomial")
+    print(f"memory: sparse {_memory(lambda: Polynomial.from_terms(terms))} B, "
+          f"dense {_memory(lambda: Polynomial(dense_coeff))} B")
+    for name, operation in (
+        ("evaluate(1.0000001)", lambda p: p.evaluate(1.0000001)),
+        ("p + p", lambda p: p + p),
+        ("p - p", lambda p: p - p),
+        ("p == p", lambda p: p == p),
+    ):
+        t_sparse = timeit.timeit(lambda: operation(sparse), number=10) / 10
+        t_dense = timeit.timeit(lambda: operation(dense), number=1)
+        print(f"{name:>20}: sparse {t_sparse * 1e3:.3f} ms, dense {t_dense * 1e3:.3f} ms")
+    small = Polynomial.from_terms({degree // 10: 1, 0: -1})
+    t_sparse = timeit.timeit(lambda: small * small, number=10) / 10
+    small_dense = Polynomial(small.coeff)
+    t_dense = timeit.timeit(lambda: small_dense * small_dense, number=1)
+    print(f"{'p * p (deg 10^5)':>20}: sparse {t_sparse * 1e3:.3f} ms, dense {t_dense * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+import random
+import timeit
+
+from src.polynomial import Polynomial
+from src.roots import np, rational_roots, roots, roots_many
+
+
+def _random_polynomial(degree):
+    return Polynomial([random.gauss(0, 1) for _ in range(degree + 1)])
+
+
+def main():
+    random.seed(0)
+    methods = ("aberth", "companion") if np is not None else ("aberth",)
+    for degree in (20, 100, 300):
+        p = _random_polynomial(degree)
+        for method in methods:
+            t = timeit.timeit(lambda: roots(p, method=method), number=1)
+            print(f"deg {degree:>4}: roots {method} {t * 1e3:.1f} ms")
+
+    p = Polynomial([1])
+    for k in range(1, 16):
+        p = p * Polynomial([k, -(2 * k + 1)])
+    t = timeit.timeit(lambda: rational_roots(p), number=1)
+    print(f"deg {p.degree():>4}: rational_roots {t * 1e3:.1f} ms")
+
+    cubics = [_random_polynomial(3) for _ in range(10_000)]
+    for method in methods:
+        t = timeit.timeit(lambda: roots_many(cubics, method=method), number=1)
+        print(f"10^4 cubics: roots_many {method} {t:.3f} s")
+    if np is not None:
+        batch = np.random.default_rng(0).normal(size=(100_000, 4))
+        t = timeit.timeit(lambda: roots_many(batch), number=1)
+        print(f"10^5 cubics as NumPy array: roots_many {t:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import random
+import timeit
+from fractions import Fraction
+
+from src import polynomial
+from src.polynomial import _karatsuba, _kronecker, _schoolbook
+
+SIZES = (4, 8, 16, 24, 32, 48, 64, 96, 128, 192, 256)
+
+
+def _best(func, a, b):
+    number = max(1, 20_000 // (len(a) * len(b)))
+    return min(timeit.repeat(lambda: func(a, b), number=number, repeat=3)) / number
+
+
+def _crossover(fast, slow, make):
+    """Najmniejsza długość, od której szybsza metoda wygrywa dla wszystkich większych rozmiarów."""
+    wins = []
+    for n in SIZES:
+        a = [make() for _ in range(n)]
+        b = [make() for _ in range(n)]
+        wins.append((n, _best(fast, a, b) < _best(slow, a, b)))
+    threshold = SIZES[-1]
+    for n, won in reversed(wins):
+        if not won:
+            break
+        threshold = n
+    return threshold
+
+
+def main():
+    random.seed(0)
+
+    def integer():
+        return random.randint(-100, 100)
+
+    def fraction():
+        return Fraction(random.randint(-100, 100), random.randint(1, 100))
+
+    def karatsuba_one_level(a, b):
+        # Jeden podział Karatsuby, dalej metoda szkolna.
+        saved = polynomial.SCHOOLBOOK_THRESHOLD
+        polynomial.SCHOOLBOOK_THRESHOLD = len(a) - 1
+        try:
+            return _karatsuba(a, b)
+        finally:
+            polynomial.SCHOOLBOOK_THRESHOLD = saved
+
+    kronecker = _crossover(_kronecker, _schoolbook, integer)
+    schoolbook = _crossover(karatsuba_one_level, _schoolbook, fraction)
+    print(f"KRONECKER_THRESHOLD = {kronecker}  (obecnie {polynomial.KRONECKER_THRESHOLD})")
+    print(f"SCHOOLBOOK_THRESHOLD = {schoolbook}  (obecnie {polynomial.SCHOOLBOOK_THRESHOLD})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,34 @@
+import math
+import weakref
+from fractions import Fraction
+from math import gcd, lcm
+from numbers import Number
+from operator import add, sub
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Progi wyboru algorytmu mnożenia (długość krótszego czynnika); punkt wyjścia
+# wyznacza skrypt benchmarks/tune_multiplication.py.
+SCHOOLBOOK_THRESHOLD = 32
+KRONECKER_THRESHOLD = 16
+FFT_THRESHOLD = 256
+
+# Wyniki działań o stopniu co najmniej SPARSE_MIN_DEGREE, w których niezerowy jest
+# mniej niż co SPARSE_DENSITY-ty współczynnik, przechowywane są w postaci rzadkiej.
+SPARSE_MIN_DEGREE = 64
+SPARSE_DENSITY = 16
+
+# Od tych stopni dzielenie używa iteracji Newtona, a NWD algorytmu half-GCD.
+DIVISION_THRESHOLD = 64
+HGCD_THRESHOLD = 64
+
+INTERPOLATION_METHODS = ("auto", "newton", "lagrange", "fast")
+FAST_INTERPOLATION_THRESHOLD = 256
+
+
 class Polynomial:
     """
     Klasa reprezentująca wielomian.
@@ -8,6 +39,8 @@ class Polynomial:
     Przykład: 3x^2 + 2x + 1 będzie reprezentowane jako [3, 2, 1]
     """
 
+    __slots__ = ("coeff", "_compiled")
+
     def __init__(self, coefficients):
         """
         Inicjalizacja wielomianu z listy współczynników.
@@ -27,11 +60,16 @@ class Polynomial:
 
     def _remove_leading_zeros(self):
         """Usuwa zbędne zera z lewej strony (przy najwyższych potęgach)."""
-        pass
+        coeff = self.coeff
+        i = 0
+        while i < len(coeff) - 1 and coeff[i] == 0:
+            i += 1
+        if i:
+            del coeff[:i]
 
     def degree(self):
         """Zwraca stopień wielomianu."""
-        pass
+        return len(self.coeff) - 1
 
     def evaluate(self, x):
         """
@@ -43,15 +81,81 @@ class Polynomial:
         Returns:
             Wartość wielomianu w punkcie x
         """
-        pass
+        result = 0
+        for c in self.coeff:
+            result = result * x + c
+        return result
+
+    def compile(self):
+        """
+        Zwraca funkcję f(x) obliczającą wartość wielomianu rozwiniętym schematem Hornera.
+
+        Kod funkcji generowany jest ze współczynnikami wpisanymi jako stałe (bez pętli),
+        więc nie ma narzutu pętli evaluate. Kolejność działań jest ta sama co w evaluate
+        (także dla zerowych wyrazów), więc wyniki dla float są identyczne - pominięcie
+        zer przez x ** k zmieniałoby zaokrąglenia. Działa też
+        dla tablic NumPy (działania wykonują ufunc-i). Funkcja jest zapamiętywana
+        w instancji i generowana ponownie tylko po zmianie współczynników.
+
+        Returns:
+            Funkcja jednego argumentu
+        """
+        coeff = tuple(self.coeff)
+        last = len(coeff) - 1
+        # Typy w kluczu: 1 == 1.0, ale wygenerowany literał i typ wyniku są inne.
+        key = (coeff, tuple(map(type, coeff)))
+        return _compiled(self, key, lambda: [(last - i, c) for i, c in enumerate(coeff)])
+
+    def evaluate_many(self, xs, method="horner", modulus=None):
+        """
+        Oblicza wartości wielomianu w wielu punktach naraz.
+
+        Args:
+            xs: Punkty - lista, dowolny iterowalny obiekt lub tablica NumPy
+            method: "horner" (schemat Hornera dla każdego punktu)
+                albo "tree" (drzewo podiloczynów - reszty z dzielenia przez
+                iloczyny (x - x_i), dokładne dla liczb całkowitych i Fraction)
+            modulus: Liczba pierwsza p - wartości w GF(p) (zawsze jako lista)
+
+        Returns:
+            Lista wartości, a dla tablicy NumPy - tablica NumPy
+        """
+        if method not in ("horner", "tree"):
+            raise ValueError("Nieznana metoda obliczania wartości")
+        if modulus is not None:
+            xs = [x % modulus for x in (xs.tolist() if np is not None and isinstance(xs, np.ndarray) else xs)]
+            if method == "tree":
+                return _evaluate_tree(self.coeff, xs, modulus)
+            coeff = _reduce(self.coeff, modulus)
+            return [_horner_mod(coeff, x, modulus) for x in xs]
+        if np is not None and isinstance(xs, np.ndarray):
+            if method == "horner":
+                # Jeden przebieg Hornera po współczynnikach, wektorowo po wszystkich punktach.
+                xs = _exact_points(xs, self.coeff)
+                result = np.zeros(xs.shape, dtype=np.result_type(xs, np.asarray(self.coeff)))
+                for c in self.coeff:
+                    result *= xs
+                    result += c
+                return result
+            return np.array(self.evaluate_many(xs.tolist(), method="tree"))
+        if method == "tree":
+            return _evaluate_tree(self.coeff, list(xs))
+        evaluate = self.evaluate
+        return [evaluate(x) for x in xs]
 
     def __str__(self):
         """Zwraca czytelną reprezentację wielomianu jako string."""
-        pass
+        terms = []
+        power = len(self.coeff) - 1
+        for c in self.coeff:
+            if c != 0 or power == 0 and not terms:
+                terms.append((c, power))
+            power -= 1
+        return _format_terms(terms)
 
     def __repr__(self):
         """Zwraca reprezentację wielomianu do debugowania."""
-        pass
+        return f"Polynomial({self.coeff!r})"
 
     def __eq__(self, other):
         """
@@ -63,7 +167,13 @@ class Polynomial:
         Returns:
             True jeśli wielomiany są równe, False w przeciwnym przypadku
         """
-        pass
+        if isinstance(other, Polynomial):
+            a, b = self.coeff, other.coeff
+            # Postać niezmienna (FrozenPolynomial) trzyma współczynniki w krotce.
+            return a == b if type(a) is type(b) else list(a) == list(b)
+        if isinstance(other, Number):
+            return len(self.coeff) == 1 and self.coeff[0] == other
+        return NotImplemented
 
     def __add__(self, other):
         """
@@ -75,7 +185,11 @@ class Polynomial:
         Returns:
             Nowy wielomian będący sumą
         """
-        pass
+        if isinstance(other, Number):
+            return Polynomial._from_list([*self.coeff[:-1], self.coeff[-1] + other])
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return Polynomial._from_list(_combine(self.coeff, other.coeff, add))
 
     def __radd__(self, other):
         """
@@ -87,7 +201,7 @@ class Polynomial:
         Returns:
             Nowy wielomian będący sumą
         """
-        pass
+        return self.__add__(other)
 
     def __sub__(self, other):
         """
@@ -99,7 +213,11 @@ class Polynomial:
         Returns:
             Nowy wielomian będący różnicą
         """
-        pass
+        if isinstance(other, Number):
+            return Polynomial._from_list([*self.coeff[:-1], self.coeff[-1] - other])
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return Polynomial._from_list(_combine(self.coeff, other.coeff, sub))
 
     def __rsub__(self, other):
         """
@@ -111,7 +229,9 @@ class Polynomial:
         Returns:
             Nowy wielomian będący różnicą
         """
-        pass
+        if not isinstance(other, Number):
+            return NotImplemented
+        return (-self).__add__(other)
 
     def __mul__(self, other):
         """
@@ -123,7 +243,11 @@ class Polynomial:
         Returns:
             Nowy wielomian będący iloczynem
         """
-        pass
+        if isinstance(other, Number):
+            return Polynomial._from_list([c * other for c in self.coeff])
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        return Polynomial._from_list(_multiply(self.coeff, other.coeff))
 
     def __rmul__(self, other):
         """
@@ -135,4 +259,1120 @@ class Polynomial:
         Returns:
             Nowy wielomian będący iloczynem
         """
-        pass
\ No newline at end of file
+        return self.__mul__(other)
+
+    def __neg__(self):
+        """Zwraca wielomian przeciwny."""
+        return Polynomial._from_list([-c for c in self.coeff])
+
+    def derivative(self):
+        """Zwraca pochodną wielomianu."""
+        last = len(self.coeff) - 1
+        return Polynomial._from_list([c * (last - i) for i, c in enumerate(self.coeff[:-1])])
+
+    def divide(self, other, modulus=None):
+        """
+        Dzielenie z resztą.
+
+        Bez modułu współczynniki ilorazu są dokładne: liczby całkowite, gdy dzielenie
+        jest wykonalne w liczbach całkowitych, a w przeciwnym razie Fraction (liczby
+        zmiennoprzecinkowe dzielone są zwykle). W GF(p) dla wysokich stopni używana
+        jest iteracja Newtona, o koszcie rzędu mnożenia.
+
+        Args:
+            other: Dzielnik - wielomian lub liczba
+            modulus: Liczba pierwsza p - obliczenia w ciele GF(p)
+
+        Returns:
+            Para (iloraz, reszta)
+
+        Raises:
+            ZeroDivisionError: Gdy dzielnik jest zerowy
+        """
+        quotient, remainder = _divmod_lists(self.coeff, _coefficients(other), modulus)
+        return Polynomial._from_list(quotient), Polynomial._from_list(remainder)
+
+    def __divmod__(self, other):
+        """Dzielenie z resztą: divmod(p, q) == (p // q, p % q)."""
+        if not _is_operand(other):
+            return NotImplemented
+        return self.divide(other)
+
+    def __floordiv__(self, other):
+        """Iloraz z dzielenia wielomianów."""
+        if not _is_operand(other):
+            return NotImplemented
+        return self.divide(other)[0]
+
+    def __mod__(self, other):
+        """Reszta z dzielenia wielomianów."""
+        if not _is_operand(other):
+            return NotImplemented
+        return self.divide(other)[1]
+
+    def gcd(self, other, modulus=None):
+        """
+        Największy wspólny dzielnik (algorytm half-GCD dla wysokich stopni).
+
+        Dla współczynników całkowitych wynik jest prymitywnym NWD w Z[x] pomnożonym
+        przez NWD zawartości (z dodatnim współczynnikiem wiodącym), a w pozostałych
+        przypadkach (Fraction, GF(p)) - wielomianem unormowanym.
+
+        Args:
+            other: Drugi wielomian
+            modulus: Liczba pierwsza p - obliczenia w ciele GF(p)
+
+        Returns:
+            Wielomian NWD
+        """
+        return Polynomial._from_list(_gcd(self.coeff, _coefficients(other), modulus))
+
+    def powmod(self, exponent, divisor, modulus=None):
+        """
+        Potęgowanie modularne: self ** exponent mod divisor.
+
+        Args:
+            exponent: Nieujemny wykładnik całkowity
+            divisor: Wielomian, modulo którego liczymy
+            modulus: Liczba pierwsza p - obliczenia w ciele GF(p)
+
+        Returns:
+            Reszta z dzielenia potęgi przez divisor
+        """
+        if not isinstance(exponent, int) or exponent < 0:
+            raise ValueError("Wykładnik musi być nieujemną liczbą całkowitą")
+        reduce = _reducer(_trim(_reduce(_coefficients(divisor), modulus)), modulus)
+        base = reduce(_reduce(self.coeff, modulus))
+        result = reduce([1])
+        while exponent:
+            if exponent & 1:
+                result = reduce(_reduce(_multiply(result, base), modulus))
+            exponent >>= 1
+            if exponent:
+                base = reduce(_reduce(_multiply(base, base), modulus))
+        return Polynomial._from_list(result)
+
+    def __pow__(self, exponent, modulo=None):
+        """Potęgowanie; pow(p, n, m) liczy resztę modulo wielomian m."""
+        if modulo is not None:
+            return self.powmod(exponent, modulo)
+        if not isinstance(exponent, int) or exponent < 0:
+            return NotImplemented
+        result = Polynomial([1])
+        base = self
+        while exponent:
+            if exponent & 1:
+                result = result * base
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        return result
+
+    def freeze(self, intern=False):
+        """
+        Zwraca niezmienną kopię wielomianu (FrozenPolynomial), której można używać
+        jako klucza słownika i w pamięci podręcznej funkcji.
+
+        Args:
+            intern: Czy zwrócić wspólną (internowaną) instancję dla tych współczynników
+        """
+        frozen = FrozenPolynomial._from_tuple(tuple(self.coeff))
+        return frozen.intern() if intern else frozen
+
+    @staticmethod
+    def interpolate(xs, ys, method="auto", modulus=None):
+        """
+        Wielomian interpolacyjny stopnia mniejszego niż liczba punktów.
+
+        Args:
+            xs: Różne węzły
+            ys: Wartości w węzłach
+            method: "newton" (ilorazy różnicowe, O(n^2)), "lagrange" (postać
+                barycentryczna, O(n^2)), "fast" (drzewo podiloczynów, O(M(n) log n)
+                w GF(p); przy liczbach zmiennoprzecinkowych numerycznie niestabilna)
+                albo "auto" (w GF(p) "fast" dla dużych zbiorów punktów, a dla małych
+                "lagrange", która nie odwraca elementów w pętli O(n^2); poza GF(p) "newton")
+            modulus: Liczba pierwsza p - interpolacja w GF(p)
+
+        Returns:
+            Wielomian (dla danych int/Fraction współczynniki są dokładne)
+        """
+        xs = list(xs)
+        ys = list(ys)
+        if len(xs) != len(ys):
+            raise ValueError("Liczba węzłów i wartości musi być równa")
+        if not xs:
+            raise ValueError("Potrzebny jest co najmniej jeden punkt")
+        if method not in INTERPOLATION_METHODS:
+            raise ValueError("Nieznana metoda interpolacji")
+        xs = _reduce(xs, modulus)
+        ys = _reduce(ys, modulus)
+        if len(set(xs)) != len(xs):
+            raise ValueError("Węzły interpolacji muszą być różne")
+        if method == "auto":
+            if modulus is None:
+                method = "newton"
+            else:
+                method = "fast" if len(xs) > FAST_INTERPOLATION_THRESHOLD else "lagrange"
+        if method == "newton":
+            return Polynomial._from_list(_newton_interpolation(xs, ys, modulus))
+        if method == "lagrange":
+            return Polynomial._from_list(_lagrange_interpolation(xs, ys, modulus))
+        return Polynomial._from_list(_fast_interpolation(xs, ys, modulus))
+
+    @staticmethod
+    def fit(xs, ys, degree):
+        """
+        Wielomian stopnia degree najlepiej dopasowany do punktów metodą najmniejszych kwadratów.
+
+        Z NumPy używa np.polynomial.Polynomial.fit (ze skalowaniem dziedziny). Bez NumPy
+        rozwiązuje dokładnie równania normalne na ułamkach - wynik jest wtedy dokładny,
+        a dla danych zmiennoprzecinkowych zamieniany na float.
+
+        Args:
+            xs: Węzły
+            ys: Wartości
+            degree: Stopień wielomianu
+
+        Returns:
+            Wielomian stopnia co najwyżej degree
+        """
+        if not isinstance(degree, int) or degree < 0:
+            raise ValueError("Stopień musi być nieujemną liczbą całkowitą")
+        if np is not None and isinstance(xs, np.ndarray):
+            xs = xs.tolist()
+        if np is not None and isinstance(ys, np.ndarray):
+            ys = ys.tolist()
+        xs = list(xs)
+        ys = list(ys)
+        if len(xs) != len(ys):
+            raise ValueError("Liczba węzłów i wartości musi być równa")
+        if len(set(xs)) <= degree:
+            raise ValueError("Za mało różnych węzłów dla zadanego stopnia")
+        if np is not None:
+            return Polynomial(np.polynomial.Polynomial.fit(xs, ys, degree).convert().coef[::-1].tolist())
+        return Polynomial(_least_squares(xs, ys, degree))
+
+    @staticmethod
+    def from_terms(terms):
+        """
+        Tworzy wielomian z par (wykładnik, współczynnik).
+
+        Wielomian o niewielu niezerowych wyrazach i wysokim stopniu (np. x^1000000 + 1)
+        jest przechowywany w postaci rzadkiej, bez listy zer.
+
+        Args:
+            terms: Słownik {wykładnik: współczynnik} lub iterowalny obiekt par
+
+        Returns:
+            Wielomian (gęsty lub rzadki, zależnie od gęstości wyrazów)
+        """
+        items = terms.items() if hasattr(terms, "items") else terms
+        result = {}
+        for power, c in items:
+            if not isinstance(power, int) or power < 0:
+                raise ValueError("Wykładnik musi być nieujemną liczbą całkowitą")
+            result[power] = result.get(power, 0) + c
+        return _from_terms({power: c for power, c in result.items() if c != 0})
+
+    @classmethod
+    def _from_list(cls, coeff):
+        """Tworzy wielomian z listy, którą przejmuje na własność (bez kopiowania)."""
+        if len(coeff) > SPARSE_MIN_DEGREE and (len(coeff) - coeff.count(0)) * SPARSE_DENSITY < len(coeff):
+            return _from_terms(_terms_of(coeff))
+        p = Polynomial.__new__(Polynomial)
+        p.coeff = coeff if coeff else [0]
+        p._remove_leading_zeros()
+        return p
+
+
+class SparsePolynomial(Polynomial):
+    """
+    Rzadka postać wielomianu: słownik terms {wykładnik: współczynnik} bez zer.
+
+    Ma to samo API co Polynomial; nie tworzy się jej bezpośrednio, tylko przez
+    Polynomial.from_terms lub jako wynik działań. Atrybut coeff jest wyliczany
+    na żądanie (gęsta lista), więc dla bardzo wysokich stopni lepiej go unikać.
+    """
+
+    __slots__ = ("terms",)
+
+    @classmethod
+    def _wrap(cls, terms):
+        p = cls.__new__(cls)
+        p.terms = terms
+        return p
+
+    @property
+    def coeff(self):
+        """Gęsta lista współczynników (od najwyższej potęgi)."""
+        result = [0] * (self.degree() + 1)
+        last = len(result) - 1
+        for power, c in self.terms.items():
+            result[last - power] = c
+        return result
+
+    def degree(self):
+        """Zwraca stopień wielomianu."""
+        return max(self.terms)
+
+    def evaluate(self, x):
+        """Oblicza wartość wielomianu schematem Hornera po niezerowych wyrazach."""
+        result = 0
+        previous = None
+        for power in sorted(self.terms, reverse=True):
+            if previous is not None:
+                result *= x ** (previous - power)
+            result += self.terms[power]
+            previous = power
+        return result * x ** previous
+
+    def compile(self):
+        """
+        Zwraca skompilowaną funkcję wartości (patrz Polynomial.compile) bez zamiany na postać gęstą.
+
+        Tak jak evaluate w postaci rzadkiej, przeskakuje zerowe wyrazy przez x ** k.
+        """
+        terms = tuple(sorted(self.terms.items(), reverse=True))
+        key = (terms, tuple(type(c) for _, c in terms))
+        return _compiled(self, key, lambda: list(terms))
+
+    def derivative(self):
+        """Zwraca pochodną wielomianu bez zamiany na postać gęstą."""
+        return _from_terms({power - 1: c * power for power, c in self.terms.items() if power})
+
+    def evaluate_many(self, xs, method="horner", modulus=None):
+        """Oblicza wartości wielomianu w wielu punktach naraz (patrz Polynomial.evaluate_many)."""
+        if method != "horner" or modulus is not None:
+            return super().evaluate_many(xs, method, modulus)
+        if np is not None and isinstance(xs, np.ndarray):
+            xs = _exact_points(xs, self.terms.values())
+            return sum(c * xs ** power for power, c in self.terms.items())
+        evaluate = self.evaluate
+        return [evaluate(x) for x in xs]
+
+    def __str__(self):
+        """Zwraca czytelną reprezentację wielomianu jako string."""
+        return _format_terms([(self.terms[power], power) for power in sorted(self.terms, reverse=True)])
+
+    def __repr__(self):
+        """Zwraca reprezentację wielomianu do debugowania."""
+        return f"Polynomial.from_terms({dict(sorted(self.terms.items(), reverse=True))!r})"
+
+    def __eq__(self, other):
+        """Porównuje wielomian z innym wielomianem lub liczbą bez zamiany na postać gęstą."""
+        if isinstance(other, SparsePolynomial):
+            return self.terms == other.terms
+        if isinstance(other, Polynomial):
+            return len(other.coeff) - 1 == self.degree() and _terms_of(other.coeff) == self.terms
+        if isinstance(other, Number):
+            # Postać rzadka ma zawsze stopień co najmniej SPARSE_MIN_DEGREE.
+            return False
+        return NotImplemented
+
+    def __add__(self, other):
+        """Dodaje wielomian lub liczbę."""
+        return _from_terms(_combine_terms(self.terms, other, add)) if _is_operand(other) else NotImplemented
+
+    def __radd__(self, other):
+        """Obsługuje dodawanie z liczbą lub gęstym wielomianem po lewej stronie."""
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """Odejmuje wielomian lub liczbę."""
+        return _from_terms(_combine_terms(self.terms, other, sub)) if _is_operand(other) else NotImplemented
+
+    def __rsub__(self, other):
+        """Obsługuje odejmowanie od liczby lub gęstego wielomianu."""
+        return (-self).__add__(other) if _is_operand(other) else NotImplemented
+
+    def __mul__(self, other):
+        """Mnoży przez wielomian lub liczbę - każdy wyraz z każdym, tylko niezerowe."""
+        if isinstance(other, Number):
+            if other == 0:
+                return Polynomial._from_list([0])
+            return SparsePolynomial._wrap({power: c * other for power, c in self.terms.items()})
+        if not isinstance(other, Polynomial):
+            return NotImplemented
+        right = other.terms if isinstance(other, SparsePolynomial) else _terms_of(other.coeff)
+        result = {}
+        get = result.get
+        for p, a in self.terms.items():
+            for q, b in right.items():
+                result[p + q] = get(p + q, 0) + a * b
+        return _from_terms({power: c for power, c in result.items() if c != 0})
+
+    def __rmul__(self, other):
+        """Obsługuje mnożenie z liczbą lub gęstym wielomianem po lewej stronie."""
+        return self.__mul__(other)
+
+    def __pow__(self, exponent, modulo=None):
+        """Potęgowanie; bez modulo mnożenie odbywa się w postaci rzadkiej."""
+        if modulo is not None or not isinstance(exponent, int) or exponent < 0:
+            return super().__pow__(exponent, modulo)
+        result = Polynomial([1])
+        base = self
+        while exponent:
+            if exponent & 1:
+                result = base * result
+            exponent >>= 1
+            if exponent:
+                base = base * base
+        return result
+
+    def __neg__(self):
+        """Zwraca wielomian przeciwny."""
+        return SparsePolynomial._wrap({power: -c for power, c in self.terms.items()})
+
+
+def _freezing(method):
+    """Opakowuje działanie Polynomial tak, by zwracało wyniki niezmienne."""
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        if isinstance(result, tuple):
+            return tuple(r.freeze() for r in result)
+        return result if result is NotImplemented else result.freeze()
+
+    wrapper.__name__ = method.__name__
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+class FrozenPolynomial(Polynomial):
+    """
+    Niezmienny wielomian: współczynniki w krotce coeff, stopień liczony raz,
+    hash i tekst - przy pierwszym użyciu. Działania zwracają FrozenPolynomial,
+    więc wielomiany mogą być kluczami słowników i argumentami funkcji z lru_cache.
+
+    intern() zwraca wspólną instancję dla danych współczynników (słabe referencje -
+    nieużywane wielomiany są zwalniane). Postać zawsze jest gęsta; zamrożenie
+    SparsePolynomial tworzy pełną krotkę współczynników.
+    """
+
+    __slots__ = ("_degree", "_hash", "_str", "__weakref__")
+
+    _interned = weakref.WeakValueDictionary()
+
+    def __init__(self, coefficients):
+        """
+        Inicjalizacja wielomianu z listy współczynników.
+
+        Args:
+            coefficients: Lista współczynników, pierwszy element to współczynnik przy najwyższej potędze
+        """
+        self._init(tuple(_trim(list(coefficients) or [0])))
+
+    @classmethod
+    def _from_tuple(cls, coeff):
+        p = cls.__new__(cls)
+        p._init(_trim(coeff) if coeff else (0,))
+        return p
+
+    def _init(self, coeff):
+        set_slot = object.__setattr__
+        set_slot(self, "coeff", coeff)
+        set_slot(self, "_degree", len(coeff) - 1)
+        set_slot(self, "_hash", None)
+        set_slot(self, "_str", None)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("FrozenPolynomial jest niezmienny")
+
+    def __delattr__(self, name):
+        raise AttributeError("FrozenPolynomial jest niezmienny")
+
+    def __reduce__(self):
+        return FrozenPolynomial, (list(self.coeff),)
+
+    def __hash__(self):
+        """Hash zgodny z __eq__: wielomian stały ma hash swojej wartości."""
+        if self._hash is None:
+            coeff = self.coeff
+            object.__setattr__(self, "_hash", hash(coeff[0]) if len(coeff) == 1 else hash(coeff))
+        return self._hash
+
+    def degree(self):
+        """Zwraca stopień wielomianu."""
+        return self._degree
+
+    def __str__(self):
+        """Zwraca czytelną reprezentację wielomianu jako string."""
+        if self._str is None:
+            object.__setattr__(self, "_str", Polynomial.__str__(self))
+        return self._str
+
+    def __repr__(self):
+        """Zwraca reprezentację wielomianu do debugowania."""
+        return f"FrozenPolynomial({list(self.coeff)!r})"
+
+    def __eq__(self, other):
+        """Porównuje wielomiany; tożsame (np. internowane) instancje bez przeglądania współczynników."""
+        if self is other:
+            return True
+        if isinstance(other, FrozenPolynomial) and hash(self) != hash(other):
+            return False
+        return Polynomial.__eq__(self, other)
+
+    def intern(self):
+        """Zwraca wspólną instancję dla tych współczynników (i ich typów)."""
+        key = (self.coeff, tuple(map(type, self.coeff)))
+        canonical = FrozenPolynomial._interned.get(key)
+        if canonical is None:
+            FrozenPolynomial._interned[key] = canonical = self
+        return canonical
+
+    def freeze(self, intern=False):
+        """Wielomian jest już niezmienny - zwraca siebie (lub instancję internowaną)."""
+        return self.intern() if intern else self
+
+    def thaw(self):
+        """Zwraca zwykły, modyfikowalny Polynomial."""
+        return Polynomial._from_list(list(self.coeff))
+
+    __add__ = _freezing(Polynomial.__add__)
+    __radd__ = _freezing(Polynomial.__radd__)
+    __sub__ = _freezing(Polynomial.__sub__)
+    __rsub__ = _freezing(Polynomial.__rsub__)
+    __mul__ = _freezing(Polynomial.__mul__)
+    __rmul__ = _freezing(Polynomial.__rmul__)
+    __neg__ = _freezing(Polynomial.__neg__)
+    __pow__ = _freezing(Polynomial.__pow__)
+    __divmod__ = _freezing(Polynomial.__divmod__)
+    __floordiv__ = _freezing(Polynomial.__floordiv__)
+    __mod__ = _freezing(Polynomial.__mod__)
+    divide = _freezing(Polynomial.divide)
+    gcd = _freezing(Polynomial.gcd)
+    powmod = _freezing(Polynomial.powmod)
+    derivative = _freezing(Polynomial.derivative)
+
+
+# Tyle kroków Hornera mieści się w jednym zagnieżdżonym wyrażeniu (parser ogranicza
+# głębokość nawiasów); dłuższe wielomiany dzielone są na kolejne instrukcje.
+_NESTED_TERMS_LIMIT = 100
+
+
+def _compiled(p, key, terms):
+    """Zwraca funkcję zapamiętaną w p dla klucza key albo generuje ją z wyrazów terms()."""
+    cached = getattr(p, "_compiled", None)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    function = _generate(terms())
+    object.__setattr__(p, "_compiled", (key, function))
+    return function
+
+
+def _generate(terms):
+    """
+    Generuje kod funkcji z par (potęga, współczynnik) uporządkowanych malejąco.
+
+    Współczynniki int i skończone float wpisywane są jako literały, pozostałe
+    (Fraction, Decimal, ...) przekazywane jako domyślne argumenty (zmienne lokalne).
+    """
+    constants = {}
+
+    def literal(c):
+        if type(c) is int or type(c) is float and math.isfinite(c):
+            return repr(c)
+        name = f"_c{len(constants)}"
+        constants[name] = c
+        return name
+
+    def power(k):
+        return "x" if k == 1 else f"x ** {k}"
+
+    if not terms:
+        body = ["    return x * 0"]
+    elif terms[0][0] == 0:
+        # Wielomian stały: x * 0 + c daje ten sam typ wyniku co evaluate.
+        body = [f"    return x * 0 + {literal(terms[0][1])}"]
+    else:
+        steps = [literal(terms[0][1])]
+        for (previous, _), (k, c) in zip(terms, terms[1:]):
+            steps.append(f" * {power(previous - k)} + {literal(c)}")
+        if terms[-1][0]:
+            steps.append(f" * {power(terms[-1][0])}")
+        chunks = [steps[i:i + _NESTED_TERMS_LIMIT] for i in range(0, len(steps), _NESTED_TERMS_LIMIT)]
+        expressions = ["(" * (len(chunks[0]) - 1) + ")".join(chunks[0])]
+        expressions += ["(" * len(chunk) + ")".join(["r"] + chunk) for chunk in chunks[1:]]
+        if len(expressions) == 1:
+            body = [f"    return {expressions[0]}"]
+        else:
+            body = [f"    r = {expression}" for expression in expressions] + ["    return r"]
+    arguments = "".join(f", {name}={name}" for name in constants)
+    source = "\n".join([f"def polynomial(x{arguments}):"] + body)
+    namespace = dict(constants)
+    exec(compile(source, "<polynomial>", "exec"), namespace)
+    return namespace["polynomial"]
+
+
+def _is_operand(other):
+    return isinstance(other, (Number, Polynomial))
+
+
+def _terms_of(coeff):
+    """Słownik {wykładnik: współczynnik} niezerowych wyrazów gęstej listy."""
+    last = len(coeff) - 1
+    return {last - i: c for i, c in enumerate(coeff) if c != 0}
+
+
+def _combine_terms(terms, other, op):
+    """Dodaje lub odejmuje od słownika wyrazów liczbę albo wielomian (dowolnej postaci)."""
+    if isinstance(other, Number):
+        other = {0: other}
+    elif isinstance(other, SparsePolynomial):
+        other = other.terms
+    else:
+        other = _terms_of(other.coeff)
+    result = dict(terms)
+    for power, c in other.items():
+        value = op(result.get(power, 0), c)
+        if value != 0:
+            result[power] = value
+        else:
+            result.pop(power, None)
+    return result
+
+
+def _from_terms(terms):
+    """Wybiera postać wielomianu (rzadką lub gęstą) dla słownika niezerowych wyrazów."""
+    if not terms:
+        return Polynomial._from_list([0])
+    degree = max(terms)
+    if degree >= SPARSE_MIN_DEGREE and len(terms) * SPARSE_DENSITY <= degree:
+        return SparsePolynomial._wrap(terms)
+    coeff = [0] * (degree + 1)
+    for power, c in terms.items():
+        coeff[degree - power] = c
+    p = Polynomial.__new__(Polynomial)
+    p.coeff = coeff
+    return p
+
+
+def _format_terms(terms):
+    """Tekst wielomianu z par (współczynnik, potęga) uporządkowanych malejąco."""
+    parts = []
+    for c, power in terms:
+        negative = c < 0
+        magnitude = -c if negative else c
+        if power == 0:
+            text = str(magnitude)
+        else:
+            text = "" if magnitude == 1 else str(magnitude)
+            text += "x" if power == 1 else f"x^{power}"
+        if not parts:
+            parts.append("-" + text if negative else text)
+        else:
+            parts.append(("- " if negative else "+ ") + text)
+    return " ".join(parts)
+
+
+def _combine(a, b, op):
+    """Łączy dwie listy współczynników (od najwyższej potęgi) wyrównane do prawej."""
+    offset = len(a) - len(b)
+    if offset >= 0:
+        return [*a[:offset], *map(op, a[offset:], b)]
+    head = b[:-offset] if op is add else [-c for c in b[:-offset]]
+    return [*head, *map(op, a, b[-offset:])]
+
+
+def _schoolbook(a, b):
+    """Mnożenie list współczynników metodą szkolną, O(n*m)."""
+    if len(a) < len(b):
+        a, b = b, a
+    result = [0] * (len(a) + len(b) - 1)
+    for j, y in enumerate(b):
+        if y:
+            window = result[j:j + len(a)]
+            result[j:j + len(a)] = [r + x * y for r, x in zip(window, a)]
+    return result
+
+
+def _exact_points(xs, coeff):
+    """
+    Punkty całkowite jako tablica dtype=object - potęgi i iloczyny liczone są wtedy
+    na liczbach Pythona bez przepełnienia int64, tak jak w evaluate().
+    """
+    dtype = np.result_type(xs, np.asarray(list(coeff)))
+    if dtype == object or np.issubdtype(dtype, np.integer) or dtype == bool:
+        return xs.astype(object)
+    return xs
+
+
+def _evaluate_tree(coeff, xs, modulus=None):
+    """Wartości w wielu punktach przez drzewo podiloczynów i reszty z dzielenia."""
+    if not xs:
+        return []
+    return _evaluate_on_tree(coeff, _subproduct_tree(xs, modulus), modulus)
+
+
+def _subproduct_tree(xs, modulus=None):
+    """Poziomy drzewa podiloczynów: liście (x - x_i), wyżej iloczyny par (nieparzysty węzeł przechodzi wyżej)."""
+    levels = [[_reduce([1, -x], modulus) for x in xs]]
+    while len(levels[-1]) > 1:
+        below = levels[-1]
+        levels.append([_reduce(_multiply(below[i], below[i + 1]), modulus) if i + 1 < len(below) else below[i]
+                       for i in range(0, len(below), 2)])
+    return levels
+
+
+def _evaluate_on_tree(coeff, levels, modulus=None):
+    remainders = [_divmod_lists(coeff, levels[-1][0], modulus)[1]]
+    for level in reversed(levels[:-1]):
+        remainders = [_divmod_lists(remainders[i // 2], node, modulus)[1] for i, node in enumerate(level)]
+    return [r[-1] for r in remainders]
+
+
+def _horner_mod(coeff, x, modulus):
+    result = 0
+    for c in coeff:
+        result = (result * x + c) % modulus
+    return result
+
+
+def _multiply(a, b):
+    """
+    Iloczyn list współczynników z automatycznym wyborem algorytmu.
+
+    Współczynniki całkowite mnożone są dokładnie przez podstawienie Kroneckera
+    (spakowanie do jednej dużej liczby int, którą CPython mnoży sam), liczby
+    zmiennoprzecinkowe przez FFT z NumPy (jeśli jest dostępny), a pozostałe
+    (np. Fraction) metodą Karatsuby, która dla krótkich list przechodzi
+    na metodę szkolną.
+    """
+    n = min(len(a), len(b))
+    if n > KRONECKER_THRESHOLD and _all_ints(a) and _all_ints(b):
+        return _kronecker(a, b)
+    if np is not None and n > FFT_THRESHOLD and _all_floats(a) and _all_floats(b):
+        return _fft(a, b)
+    return _karatsuba(a, b)
+
+
+def _all_ints(values):
+    return all(type(v) is int for v in values)
+
+
+def _all_floats(values):
+    return all(type(v) is float for v in values)
+
+
+def _karatsuba(a, b):
+    """Mnożenie metodą Karatsuby, O(n^1.58)."""
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) <= SCHOOLBOOK_THRESHOLD:
+        return _schoolbook(a, b)
+    result = [0] * (len(a) + len(b) - 1)
+    half = len(a) // 2
+    if len(b) <= half:
+        # Czynniki bardzo różnej długości - dłuższy dzielimy na kawałki długości krótszego.
+        for start in range(0, len(a), len(b)):
+            _add_into(result, start, _karatsuba(a[start:start + len(b)], b))
+        return result
+    a0, a1 = a[:half], a[half:]
+    b0, b1 = b[:half], b[half:]
+    z0 = _karatsuba(a0, b0)
+    z2 = _karatsuba(a1, b1)
+    z1 = _karatsuba(_combine_low(a0, a1), _combine_low(b0, b1))
+    _add_into(result, 0, z0)
+    _add_into(result, 2 * half, z2)
+    _add_into(result, half, [m - x for m, x in zip(z1, _combine_low(z0, z2))] + z1[max(len(z0), len(z2)):])
+    return result
+
+
+def _combine_low(a, b):
+    """Suma list wyrównanych do początku (indeksy to potęgi w tej samej kolejności)."""
+    if len(a) < len(b):
+        a, b = b, a
+    result = [x + y for x, y in zip(a, b)]
+    result.extend(a[len(b):])
+    return result
+
+
+def _add_into(result, offset, values):
+    end = offset + len(values)
+    result[offset:end] = [r + v for r, v in zip(result[offset:end], values)]
+
+
+def _kronecker(a, b):
+    """
+    Dokładne mnożenie list liczb całkowitych przez podstawienie Kroneckera.
+
+    Każdy współczynnik zajmuje pole o szerokości mieszczącej największy możliwy
+    współczynnik iloczynu (ze znakiem), więc po jednym mnożeniu dużych liczb
+    współczynniki odczytuje się bezpośrednio z bajtów wyniku.
+    """
+    bound = min(len(a), len(b)) * max(map(abs, a)) * max(map(abs, b))
+    width = (bound.bit_length() + 2 + 7) // 8
+    half = 1 << (8 * width - 1)
+    product = _pack(a, width) * _pack(b, width)
+    length = len(a) + len(b) - 1
+    # Przesunięcie o half w każdym polu daje liczby nieujemne, które można odczytać bajtami.
+    product += int.from_bytes((bytes(width - 1) + b"\x80") * length, "little")
+    data = product.to_bytes(width * length + 1, "little")
+    return [int.from_bytes(data[i:i + width], "little") - half for i in range(0, width * length, width)]
+
+
+def _pack(values, width):
+    zero = bytes(width)
+    positive = b"".join(v.to_bytes(width, "little") if v > 0 else zero for v in values)
+    negative = b"".join((-v).to_bytes(width, "little") if v < 0 else zero for v in values)
+    return int.from_bytes(positive, "little") - int.from_bytes(negative, "little")
+
+
+def _fft(a, b):
+    """Mnożenie współczynników zmiennoprzecinkowych przez FFT (NumPy)."""
+    length = len(a) + len(b) - 1
+    size = 1 << (length - 1).bit_length()
+    product = np.fft.irfft(np.fft.rfft(a, size) * np.fft.rfft(b, size), size)[:length]
+    return product.tolist()
+
+
+def _coefficients(other):
+    """Lista współczynników wielomianu lub liczby (jako wielomianu stałego)."""
+    if isinstance(other, Polynomial):
+        return other.coeff
+    if isinstance(other, Number):
+        return [other]
+    raise TypeError("Oczekiwano wielomianu lub liczby")
+
+
+def _trim(values):
+    """Usuwa zera wiodące; wielomian zerowy to [0]."""
+    i = 0
+    while i < len(values) - 1 and values[i] == 0:
+        i += 1
+    return values[i:] if i else values
+
+
+def _is_zero(values):
+    return len(values) == 1 and values[0] == 0
+
+
+def _reduce(values, modulus):
+    """Redukcja współczynników modulo p (bez modułu - bez zmian)."""
+    return [v % modulus for v in values] if modulus else values
+
+
+def _divider(modulus):
+    """Funkcja dzielenia współczynników: w GF(p) przez odwrotność, inaczej dokładnie."""
+    if modulus:
+        return lambda x, y: x * pow(y, -1, modulus) % modulus
+    return _exact_div
+
+
+def _exact_div(x, y):
+    if type(x) is int and type(y) is int:
+        q, r = divmod(x, y)
+        return q if not r else Fraction(x, y)
+    return x / y
+
+
+def _uses_newton(b, modulus):
+    """
+    Iteracja Newtona tylko w GF(p). W Z[x] i Q[x] współczynniki odwrotności szeregu
+    rosną tak szybko, że dzielenie pisemne jest w praktyce szybsze.
+    """
+    return modulus is not None and len(b) > DIVISION_THRESHOLD
+
+
+def _divmod_lists(a, b, modulus=None):
+    """Iloraz i reszta z dzielenia list współczynników (od najwyższej potęgi)."""
+    a = _trim(_reduce(a, modulus))
+    b = _trim(_reduce(b, modulus))
+    if _is_zero(b):
+        raise ZeroDivisionError("Dzielenie przez wielomian zerowy")
+    if len(a) < len(b):
+        return [0], list(a)
+    if _uses_newton(b, modulus) and len(a) - len(b) >= DIVISION_THRESHOLD:
+        inverse = _series_inverse(b, len(a) - len(b) + 1, modulus)
+        return _divmod_newton(a, b, inverse, modulus)
+    return _divmod_schoolbook(a, b, modulus)
+
+
+def _divmod_schoolbook(a, b, modulus):
+    """Dzielenie pisemne, O(n*m)."""
+    divide = _divider(modulus)
+    n = len(b) - 1
+    lead = b[0]
+    tail = b[1:]
+    r = list(a)
+    q = []
+    for i in range(len(a) - n):
+        c = r[i] if lead == 1 else divide(r[i], lead)
+        q.append(c)
+        if c:
+            window = zip(r[i + 1:i + 1 + n], tail)
+            if modulus:
+                r[i + 1:i + 1 + n] = [(x - c * y) % modulus for x, y in window]
+            else:
+                r[i + 1:i + 1 + n] = [x - c * y for x, y in window]
+    return q, r[len(a) - n:] or [0]
+
+
+def _series_inverse(b, length, modulus):
+    """
+    Odwrotność szeregu potęgowego o współczynnikach b (lista b czytana od najniższej
+    potęgi to odwrócony wielomian b) modulo x^length, iteracją Newtona g <- g(2 - bg).
+    """
+    g = [_divider(modulus)(1, b[0])]
+    k = 1
+    while k < length:
+        k = min(2 * k, length)
+        e = [-v for v in _reduce(_multiply(b[:k], g), modulus)[:k]]
+        e[0] += 2
+        g = _reduce(_multiply(g, e)[:k], modulus)
+    return g
+
+
+def _divmod_newton(a, b, inverse, modulus):
+    """
+    Dzielenie przez mnożenie przez odwrotność: odwrócony iloraz to odwrócone a
+    razy odwrotność odwróconego b, modulo x^(deg a - deg b + 1).
+    """
+    k = len(a) - len(b) + 1
+    q = _reduce(_multiply(a[:k], inverse[:k])[:k], modulus)
+    q += [0] * (k - len(q))
+    n = len(b) - 1
+    if not n:
+        return q, [0]
+    product = _multiply(q, b)
+    r = [x - y for x, y in zip(a[-n:], product[-n:])]
+    return q, _reduce(r, modulus)
+
+
+def _reducer(b, modulus):
+    """Funkcja reszty modulo stały dzielnik b; odwrotność Newtona liczona jest raz."""
+    if _is_zero(b):
+        raise ZeroDivisionError("Dzielenie przez wielomian zerowy")
+    if not _uses_newton(b, modulus):
+        return lambda a: _divmod_lists(a, b, modulus)[1]
+    inverse = _series_inverse(b, len(b) - 1, modulus)
+
+    def reduce(a):
+        a = _trim(a)
+        if len(a) < len(b):
+            return list(a)
+        if len(a) - len(b) + 1 > len(inverse):
+            return _divmod_lists(a, b, modulus)[1]
+        return _trim(_divmod_newton(a, b, inverse, modulus)[1])
+
+    return reduce
+
+
+def _gcd(a, b, modulus):
+    """NWD list współczynników (patrz Polynomial.gcd)."""
+    a = _trim(_reduce(a, modulus))
+    b = _trim(_reduce(b, modulus))
+    if modulus is None and _all_ints(a) and _all_ints(b):
+        return _integer_gcd(a, b)
+    g = _euclid(a, b, modulus)
+    if _is_zero(g):
+        return list(g)
+    divide = _divider(modulus)
+    lead = g[0]
+    return [divide(c, lead) for c in g]
+
+
+def _integer_gcd(a, b):
+    """NWD w Z[x]: NWD zawartości razy część prymitywna NWD w Q[x] (lemat Gaussa)."""
+    if _is_zero(a) and _is_zero(b):
+        return [0]
+    content = gcd(gcd(*a), gcd(*b))
+    g = _euclid([Fraction(c) for c in a], [Fraction(c) for c in b], None)
+    scale = lcm(*(c.denominator for c in g))
+    g = [int(c * scale) for c in g]
+    divisor = gcd(*g) * (1 if g[0] > 0 else -1)
+    return [c // divisor * content for c in g]
+
+
+def _euclid(a, b, modulus):
+    """Algorytm Euklidesa; dla wysokich stopni kroki half-GCD redukują stopień o połowę."""
+    if len(a) < len(b):
+        a, b = b, a
+    while not _is_zero(b):
+        a, b = b, _trim(_divmod_lists(a, b, modulus)[1])
+        # Teraz deg a > deg b, czego wymaga half-GCD.
+        if len(a) > HGCD_THRESHOLD and not _is_zero(b):
+            a, b = _apply(_hgcd(a, b, modulus), a, b, modulus)
+    return a
+
+
+def _degree(values):
+    return -1 if _is_zero(values) else len(values) - 1
+
+
+def _shift(values, k):
+    """Iloraz z dzielenia przez x^k (odrzucenie k najniższych współczynników)."""
+    return values[:len(values) - k] if len(values) > k else [0]
+
+
+def _pmul(a, b, modulus):
+    return _trim(_reduce(_multiply(a, b), modulus))
+
+
+def _psub(a, b, modulus):
+    return _trim(_reduce(_combine(a, b, sub), modulus))
+
+
+def _padd(a, b, modulus):
+    return _trim(_reduce(_combine(a, b, add), modulus))
+
+
+_IDENTITY = ([1], [0], [0], [1])
+
+
+def _apply(matrix, a, b, modulus):
+    """Mnoży macierz 2x2 wielomianów przez wektor (a, b)."""
+    m00, m01, m10, m11 = matrix
+    return (_padd(_pmul(m00, a, modulus), _pmul(m01, b, modulus), modulus),
+            _padd(_pmul(m10, a, modulus), _pmul(m11, b, modulus), modulus))
+
+
+def _matmul(x, y, modulus):
+    x00, x01, x10, x11 = x
+    y00, y01, y10, y11 = y
+    return (_padd(_pmul(x00, y00, modulus), _pmul(x01, y10, modulus), modulus),
+            _padd(_pmul(x00, y01, modulus), _pmul(x01, y11, modulus), modulus),
+            _padd(_pmul(x10, y00, modulus), _pmul(x11, y10, modulus), modulus),
+            _padd(_pmul(x10, y01, modulus), _pmul(x11, y11, modulus), modulus))
+
+
+def _hgcd(a, b, modulus):
+    """
+    Half-GCD: macierz M taka, że M (a, b) = (c, d) to kolejne reszty ciągu Euklidesa
+    z deg c >= m > deg d, gdzie m = ceil(deg a / 2). Zakłada deg a > deg b.
+    """
+    m = (_degree(a) + 1) // 2
+    if _degree(b) < m:
+        return _IDENTITY
+    if _degree(a) <= HGCD_THRESHOLD:
+        # Małe stopnie - zwykłe kroki Euklidesa z akumulacją macierzy.
+        matrix = _IDENTITY
+        while _degree(b) >= m:
+            q, r = _divmod_lists(a, b, modulus)
+            matrix = _matmul(([0], [1], [1], _psub([0], q, modulus)), matrix, modulus)
+            a, b = b, _trim(r)
+        return matrix
+    first = _hgcd(_shift(a, m), _shift(b, m), modulus)
+    a, b = _apply(first, a, b, modulus)
+    if _degree(b) < m:
+        return first
+    q, r = _divmod_lists(a, b, modulus)
+    step = _matmul(([0], [1], [1], _psub([0], q, modulus)), first, modulus)
+    a, b = b, _trim(r)
+    if _degree(b) < m:
+        return step
+    k = 2 * m - _degree(a)
+    return _matmul(_hgcd(_shift(a, k), _shift(b, k), modulus), step, modulus)
+
+
+def _newton_interpolation(xs, ys, modulus):
+    """Ilorazy różnicowe, a potem rozwinięcie postaci Newtona schematem Hornera."""
+    divide = _divider(modulus)
+    n = len(xs)
+    differences = list(ys)
+    for j in range(1, n):
+        differences[j:] = [divide(differences[i] - differences[i - 1], xs[i] - xs[i - j]) for i in range(j, n)]
+    result = [differences[-1]]
+    for k in range(n - 2, -1, -1):
+        # result * (x - x_k) + d_k
+        xk = xs[k]
+        result = [a - xk * b for a, b in zip(result + [0], [0] + result)]
+        result[-1] += differences[k]
+        result = _reduce(result, modulus)
+    return result
+
+
+def _lagrange_interpolation(xs, ys, modulus):
+    """Postać barycentryczna: suma y_i w_i M(x) / (x - x_i), gdzie w_i = 1 / M'(x_i)."""
+    divide = _divider(modulus)
+    product = _subproduct_tree(xs, modulus)[-1][0]
+    n = len(xs)
+    result = [0] * n
+    for x, y in zip(xs, ys):
+        # Dzielenie syntetyczne M przez (x - x_i); M'(x_i) to wartość ilorazu w x_i.
+        quotient = []
+        acc = 0
+        for c in product[:-1]:
+            acc = acc * x + c
+            if modulus:
+                acc %= modulus
+            quotient.append(acc)
+        weight = divide(y, _horner_mod(quotient, x, modulus) if modulus else _horner(quotient, x))
+        result = [r + weight * q for r, q in zip(result, quotient)]
+        result = _reduce(result, modulus)
+    return result
+
+
+def _horner(coeff, x):
+    result = 0
+    for c in coeff:
+        result = result * x + c
+    return result
+
+
+def _fast_interpolation(xs, ys, modulus):
+    """
+    Szybka interpolacja: wagi y_i / M'(x_i) z wielopunktowego obliczenia M' na drzewie
+    podiloczynów, a potem łączenie w górę drzewa: r = r_lewy * M_prawy + r_prawy * M_lewy.
+    """
+    levels = _subproduct_tree(xs, modulus)
+    root = levels[-1][0]
+    last = len(root) - 1
+    derivative = _reduce([c * (last - i) for i, c in enumerate(root[:-1])], modulus)
+    divide = _divider(modulus)
+    current = [[divide(y, v)] for y, v in zip(ys, _evaluate_on_tree(derivative, levels, modulus))]
+    for level in levels[:-1]:
+        current = [_reduce(_combine(_multiply(current[i], level[i + 1]), _multiply(current[i + 1], level[i]), add),
+                           modulus) if i + 1 < len(level) else current[i]
+                   for i in range(0, len(level), 2)]
+    return current[0]
+
+
+def _least_squares(xs, ys, degree):
+    """
+    Dokładne rozwiązanie równań normalnych (sum x^(j+k)) c = sum y x^j na ułamkach.
+
+    Węzły i wartości sprowadzane są do wspólnych mianowników, więc sumy potęg
+    liczone są na liczbach całkowitych.
+    """
+    floating = any(isinstance(v, float) for v in xs) or any(isinstance(v, float) for v in ys)
+    xs = [Fraction(x) for x in xs]
+    ys_fractions = [Fraction(y) for y in ys]
+    x_scale = lcm(*(x.denominator for x in xs))
+    y_scale = lcm(*(y.denominator for y in ys_fractions))
+    xs_int = [int(x * x_scale) for x in xs]
+    ys_int = [int(y * y_scale) for y in ys_fractions]
+    powers = [0] * (2 * degree + 1)
+    moments = [0] * (degree + 1)
+    for x, y in zip(xs_int, ys_int):
+        power = 1
+        for k in range(2 * degree + 1):
+            powers[k] += power
+            if k <= degree:
+                moments[k] += y * power
+            power *= x
+    # Niewiadome to c_k / x_scale^k, co usuwa mianowniki z macierzy.
+    matrix = [[Fraction(powers[j + k]) for k in range(degree + 1)] + [Fraction(moments[j], y_scale)]
+              for j in range(degree + 1)]
+    solution = _solve(matrix)
+    coefficients = [c * x_scale ** k for k, c in enumerate(solution)]
+    if floating:
+        coefficients = [float(c) for c in coefficients]
+    else:
+        coefficients = [int(c) if c.denominator == 1 else c for c in coefficients]
+    return coefficients[::-1]
+
+
+def _solve(matrix):
+    """Eliminacja Gaussa na ułamkach dla macierzy rozszerzonej n x (n + 1)."""
+    n = len(matrix)
+    for col in range(n):
+        pivot = next(row for row in range(col, n) if matrix[row][col] != 0)
+        matrix[col], matrix[pivot] = matrix[pivot], matrix[col]
+        pivot_row = matrix[col]
+        for row in range(n):
+            if row != col and matrix[row][col] != 0:
+                factor = matrix[row][col] / pivot_row[col]
+                matrix[row] = [a - factor * b for a, b in zip(matrix[row], pivot_row)]
+    return [matrix[i][n] / matrix[i][i] for i in range(n)]
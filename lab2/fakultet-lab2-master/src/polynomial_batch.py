@@ -0,0 +1,243 @@
+"""
+PolynomialBatch - wiele wielomianów jako jedna dwuwymiarowa tablica NumPy.
+
+Wiersz i to współczynniki i-tego wielomianu od najwyższej potęgi, wyrównane
+do prawej (dopełnione zerami z lewej), więc kolumna j odpowiada potędze
+n - 1 - j we wszystkich wierszach naraz. Działania wykonywane są wektorowo
+na całej tablicy zamiast w pętli po obiektach Polynomial.
+"""
+from numbers import Number
+
+from src.polynomial import Polynomial, _multiply, np
+
+
+class PolynomialBatch:
+    """
+    Partia wielomianów w tablicy coefficients o kształcie (liczba wielomianów, szerokość).
+
+    Dodawanie, odejmowanie i mnożenie działają element po elemencie między partiami
+    tej samej długości, a także z pojedynczym wielomianem lub liczbą (rozgłaszane na
+    wszystkie wiersze). Mnożenie używa wsadowego FFT; dla liczb całkowitych wynik jest
+    zaokrąglany, jeśli mieści się w zakresie dokładności float, a w przeciwnym razie
+    (i dla tablic dtype=object, np. Fraction) liczony dokładnie wiersz po wierszu.
+    """
+
+    __slots__ = ("coefficients",)
+
+    def __init__(self, coefficients):
+        """
+        Args:
+            coefficients: Tablica dwuwymiarowa (lub lista list równej długości)
+
+        Raises:
+            ImportError: Gdy NumPy nie jest zainstalowany
+        """
+        if np is None:
+            raise ImportError("PolynomialBatch wymaga biblioteki NumPy")
+        coefficients = np.asarray(coefficients)
+        if coefficients.ndim != 2 or coefficients.shape[1] == 0:
+            raise ValueError("Oczekiwano niepustej tablicy dwuwymiarowej współczynników")
+        self.coefficients = coefficients
+
+    @classmethod
+    def from_polynomials(cls, polynomials, dtype=None):
+        """Tworzy partię z listy wielomianów, dopełniając krótsze zerami z lewej."""
+        if np is None:
+            raise ImportError("PolynomialBatch wymaga biblioteki NumPy")
+        rows = [p.coeff for p in polynomials]
+        if not rows:
+            raise ValueError("Partia musi zawierać co najmniej jeden wielomian")
+        width = max(map(len, rows))
+        return cls(np.array([[0] * (width - len(row)) + list(row) for row in rows], dtype=dtype))
+
+    def to_polynomials(self):
+        """Zwraca listę wielomianów (zera wiodące są usuwane)."""
+        return [Polynomial(row) for row in self.coefficients.tolist()]
+
+    def __len__(self):
+        return self.coefficients.shape[0]
+
+    def __getitem__(self, index):
+        """Wielomian o danym indeksie albo partia dla wycinka."""
+        if isinstance(index, slice):
+            return PolynomialBatch(self.coefficients[index])
+        return Polynomial(self.coefficients[index].tolist())
+
+    def __repr__(self):
+        return f"PolynomialBatch({self.coefficients.tolist()!r})"
+
+    def degrees(self):
+        """Tablica stopni wielomianów (wielomian zerowy ma stopień 0)."""
+        nonzero = self.coefficients != 0
+        first = np.argmax(nonzero, axis=1)
+        return np.where(nonzero.any(axis=1), self.coefficients.shape[1] - 1 - first, 0)
+
+    def trim(self):
+        """Usuwa kolumny zer wiodących wspólne dla wszystkich wierszy."""
+        width = int(self.degrees().max()) + 1
+        return PolynomialBatch(self.coefficients[:, self.coefficients.shape[1] - width:])
+
+    def evaluate(self, x):
+        """
+        Wartości wszystkich wielomianów schematem Hornera po kolumnach.
+
+        Args:
+            x: Jeden punkt dla wszystkich wielomianów albo tablica punktów,
+                po jednym na wielomian
+
+        Returns:
+            Tablica wartości o długości len(self)
+        """
+        x = np.asarray(x)
+        coefficients = self.coefficients
+        if _is_int(coefficients) and _is_int(x):
+            # |wynik| <= max|c| * szerokość * max(1, |x|)^(szerokość - 1); gdy może
+            # przekroczyć int64, liczymy na liczbach Pythona (tak jak evaluate()).
+            width = coefficients.shape[1]
+            bound = _magnitude(coefficients) * width * max(1, _magnitude(x)) ** (width - 1)
+            if bound >= _INT64_LIMIT:
+                coefficients, x = coefficients.astype(object), x.astype(object)
+        result = np.zeros(len(self), dtype=np.result_type(coefficients, x))
+        for column in coefficients.T:
+            result = result * x + column
+        return result
+
+    def __eq__(self, other):
+        """Partie są równe, gdy mają te same wielomiany (niezależnie od dopełnienia zerami)."""
+        if not isinstance(other, PolynomialBatch):
+            return NotImplemented
+        if len(self) != len(other):
+            return False
+        a, b = _aligned(self.coefficients, other.coefficients)
+        return bool(np.array_equal(a, b))
+
+    __hash__ = None
+
+    def __add__(self, other):
+        """Suma element po elemencie (z partią, wielomianem lub liczbą)."""
+        if isinstance(other, Number):
+            result = _widened(self.coefficients, abs(other) if isinstance(other, int) else 0)
+            result = result.astype(np.result_type(result, other))
+            result[:, -1] += other
+            return PolynomialBatch(result)
+        other = _operand(other)
+        if other is None:
+            return NotImplemented
+        a, b = _widened_pair(*_aligned(self.coefficients, other))
+        return PolynomialBatch(a + b)
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        """Różnica element po elemencie (z partią, wielomianem lub liczbą)."""
+        if isinstance(other, Number):
+            return self + (-other)
+        other = _operand(other)
+        if other is None:
+            return NotImplemented
+        a, b = _widened_pair(*_aligned(self.coefficients, other))
+        return PolynomialBatch(a - b)
+
+    def __rsub__(self, other):
+        return (-self) + other
+
+    def __neg__(self):
+        return PolynomialBatch(-_widened(self.coefficients, 0))
+
+    def __mul__(self, other):
+        """Iloczyn element po elemencie (z partią, wielomianem lub liczbą)."""
+        if isinstance(other, Number):
+            if isinstance(other, int) and _is_int(self.coefficients) \
+                    and _magnitude(self.coefficients) * abs(other) >= _INT64_LIMIT:
+                return PolynomialBatch(self.coefficients.astype(object) * other)
+            return PolynomialBatch(self.coefficients * other)
+        other = _operand(other)
+        if other is None:
+            return NotImplemented
+        return PolynomialBatch(_convolve(self.coefficients, other))
+
+    __rmul__ = __mul__
+
+
+# Tablice całkowite NumPy mają 64 bity i przepełniają się bez ostrzeżenia, więc gdy
+# wynik może wyjść poza int64, działania wykonywane są na tablicach dtype=object.
+_INT64_LIMIT = 2 ** 63
+
+
+def _is_int(a):
+    return a.dtype.kind in "iu"
+
+
+def _magnitude(a):
+    """Największa wartość bezwzględna elementów tablicy całkowitej (jako int Pythona)."""
+    return max(-int(a.min()), int(a.max()), 0) if a.size else 0
+
+
+def _widened(a, other_magnitude):
+    """a jako dtype=object, jeśli suma z liczbą o module other_magnitude może przepełnić int64."""
+    if _is_int(a) and _magnitude(a) + other_magnitude >= _INT64_LIMIT:
+        return a.astype(object)
+    return a
+
+
+def _widened_pair(a, b):
+    if _is_int(a) and _is_int(b) and _magnitude(a) + _magnitude(b) >= _INT64_LIMIT:
+        return a.astype(object), b.astype(object)
+    return a, b
+
+
+def _operand(other):
+    """Tablica współczynników drugiego argumentu (wielomian to jeden wiersz rozgłaszany na wszystkie)."""
+    if isinstance(other, PolynomialBatch):
+        return other.coefficients
+    if isinstance(other, Polynomial):
+        return np.array([other.coeff])
+    return None
+
+
+def _aligned(a, b):
+    """Dopełnia zerami z lewej węższą z dwóch tablic, by kolumny odpowiadały tym samym potęgom."""
+    if a.shape[0] != b.shape[0] and 1 not in (a.shape[0], b.shape[0]):
+        raise ValueError("Partie muszą mieć tę samą liczbę wielomianów")
+    width = max(a.shape[1], b.shape[1])
+    return _pad(a, width), _pad(b, width)
+
+
+def _pad(a, width):
+    if a.shape[1] == width:
+        return a
+    return np.concatenate([np.zeros((a.shape[0], width - a.shape[1]), dtype=a.dtype), a], axis=1)
+
+
+# Błąd zaokrągleń FFT w float64 rośnie jak max|a| * max|b| * n * log2(N) * 2^-53;
+# wynik dla liczb całkowitych jest dokładny po zaokrągleniu, gdy ta wielkość jest
+# mniejsza od 1/2 z zapasem (współczynnik 2^4 poniżej 2^52).
+_EXACT_FFT_LIMIT = 2 ** 48
+
+
+def _convolve(a, b):
+    """Wsadowe mnożenie wielomianów (splot każdego wiersza a z odpowiadającym wierszem b)."""
+    if a.shape[0] != b.shape[0] and 1 not in (a.shape[0], b.shape[0]):
+        raise ValueError("Partie muszą mieć tę samą liczbę wielomianów")
+    length = a.shape[1] + b.shape[1] - 1
+    if a.dtype == object or b.dtype == object:
+        rows = np.broadcast_arrays(a[:, :1], b[:, :1])[0].shape[0]
+        a = np.broadcast_to(a, (rows, a.shape[1]))
+        b = np.broadcast_to(b, (rows, b.shape[1]))
+        result = np.empty((rows, length), dtype=object)
+        for i in range(rows):
+            result[i] = _multiply(a[i].tolist(), b[i].tolist())
+        return result
+    size = 1 << (length - 1).bit_length()
+    integer = np.issubdtype(a.dtype, np.integer) and np.issubdtype(b.dtype, np.integer)
+    if integer:
+        bound = int(np.abs(a).max()) * int(np.abs(b).max()) * max(a.shape[1], b.shape[1]) * size.bit_length()
+        if bound >= _EXACT_FFT_LIMIT:
+            return _convolve(a.astype(object), b.astype(object))
+    if np.iscomplexobj(a) or np.iscomplexobj(b):
+        result = np.fft.ifft(np.fft.fft(a, size, axis=1) * np.fft.fft(b, size, axis=1), axis=1)[:, :length]
+    else:
+        result = np.fft.irfft(np.fft.rfft(a, size, axis=1) * np.fft.rfft(b, size, axis=1), size, axis=1)[:, :length]
+    if integer:
+        return np.rint(result).astype(np.result_type(a.dtype, b.dtype))
+    return result
@@ -0,0 +1,367 @@
+"""
+Wyznaczanie pierwiastków wielomianów.
+
+- roots: pierwiastki zespolone (macierz towarzysząca przez NumPy albo iteracja
+  Abertha-Ehrlicha, która nie wymaga NumPy i dobrze radzi sobie z wysokimi stopniami)
+- roots_many: wiele wielomianów naraz; wielomiany tego samego stopnia rozwiązywane
+  są jednym wektorowym wywołaniem np.linalg.eigvals
+- rational_roots: dokładne pierwiastki wymierne wielomianów o współczynnikach
+  całkowitych lub Fraction
+- sturm_sequence, count_real_roots: ciąg Sturma i liczba pierwiastków rzeczywistych
+"""
+import cmath
+import math
+from fractions import Fraction
+
+from src.polynomial import Polynomial
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Do tego stopnia metoda "auto" używa macierzy towarzyszącej (koszt O(n^3)),
+# powyżej - iteracji Abertha-Ehrlicha (O(n^2) na iterację).
+COMPANION_MAX_DEGREE = 50
+
+METHODS = ("auto", "companion", "aberth")
+
+
+def sturm_sequence(p):
+    """
+    Ciąg Sturma: p, p', a dalej minus reszty z dzielenia dwóch poprzednich wyrazów.
+
+    Dla współczynników całkowitych obliczenia są dokładne (Fraction).
+    """
+    sequence = [p, p.derivative()]
+    while sequence[-1] != 0:
+        remainder = sequence[-2] % sequence[-1]
+        if remainder == 0:
+            break
+        sequence.append(-remainder)
+    if sequence[-1] == 0:
+        sequence.pop()
+    return sequence
+
+
+def count_real_roots(p, low=None, high=None):
+    """
+    Liczba różnych pierwiastków rzeczywistych w przedziale (low, high] (twierdzenie Sturma).
+
+    Args:
+        p: Niezerowy wielomian
+        low, high: Końce przedziału; None oznacza odpowiednio -oo i +oo
+
+    Returns:
+        Liczba różnych pierwiastków rzeczywistych
+    """
+    if p == 0:
+        raise ValueError("Wielomian zerowy ma nieskończenie wiele pierwiastków")
+    sequence = sturm_sequence(p)
+    return _sign_changes(sequence, low, -1) - _sign_changes(sequence, high, 1)
+
+
+def _sign_changes(sequence, x, infinity_sign):
+    if x is None:
+        # Znak w nieskończoności to znak współczynnika wiodącego (z uwzględnieniem parzystości stopnia).
+        values = [q.coeff[0] * (infinity_sign if q.degree() % 2 else 1) for q in sequence]
+    else:
+        values = [q.evaluate(x) for q in sequence]
+    signs = [v > 0 for v in values if v != 0]
+    return sum(a != b for a, b in zip(signs, signs[1:]))
+
+
+def rational_roots(p):
+    """
+    Dokładne różne pierwiastki wymierne.
+
+    Z twierdzenia o pierwiastkach wymiernych mianownik pierwiastka u/v dzieli
+    współczynnik wiodący L, więc dwa różne kandydaty są odległe o co najmniej 1/L^2.
+    Najpierw sprawdzane są redukty ułamka łańcuchowego przybliżeń numerycznych
+    pierwiastków rzeczywistych, a znalezione pierwiastki są dzielone z wielomianu.
+    Pozostałe pierwiastki rzeczywiste izolowane są dokładną bisekcją Sturma do
+    przedziałów węższych niż 1/(2 L^2), w których jest co najwyżej jeden kandydat -
+    dzięki temu wynik jest pełny bez rozkładania wyrazu wolnego na czynniki.
+
+    Args:
+        p: Niezerowy wielomian o współczynnikach int lub Fraction
+
+    Returns:
+        Posortowana lista pierwiastków (int lub Fraction)
+    """
+    if p == 0:
+        raise ValueError("Wielomian zerowy ma nieskończenie wiele pierwiastków")
+    if not all(isinstance(c, (int, Fraction)) for c in p.coeff):
+        raise TypeError("Pierwiastki wymierne wymagają współczynników całkowitych lub Fraction")
+    coeff = _primitive(p.coeff)
+    found = []
+    if coeff[-1] == 0:
+        found.append(Fraction(0))
+        while coeff[-1] == 0:
+            coeff.pop()
+    current = Polynomial(coeff)
+    if current.degree() > 1:
+        # Część bezkwadratowa: każdy pierwiastek jednokrotny.
+        current = Polynomial(_primitive((current // current.gcd(current.derivative())).coeff))
+    lead = abs(current.coeff[0])
+
+    def accept(candidate):
+        nonlocal current
+        if current.degree() >= 1 and current.evaluate(candidate) == 0:
+            found.append(candidate)
+            current = Polynomial(_primitive((current // Polynomial([candidate.denominator, -candidate.numerator])).coeff))
+
+    if current.degree() >= 1 and _fits_float(current.coeff):
+        for z in roots(current):
+            if cmath.isfinite(z) and abs(z.imag) <= 1e-6 * max(1.0, abs(z)):
+                for candidate in _convergents(Fraction(z.real), lead):
+                    if lead % candidate.denominator == 0 and current.evaluate(candidate) == 0:
+                        accept(candidate)
+                        break
+    if current.degree() >= 1:
+        width = Fraction(1, 2 * lead * lead)
+        for low, high in _isolate(current, width):
+            accept(((low + high) / 2).limit_denominator(lead))
+    return sorted(int(r) if r.denominator == 1 else r for r in found)
+
+
+def _fits_float(coeff):
+    """Czy współczynniki mieszczą się w zakresie float (inaczej pomijamy przybliżenia numeryczne)."""
+    try:
+        return all(math.isfinite(float(c)) for c in coeff)
+    except OverflowError:
+        return False
+
+
+def _convergents(x, max_denominator):
+    """Redukty ułamka łańcuchowego x o mianownikach nie większych niż max_denominator."""
+    h, h_prev = 1, 0
+    k, k_prev = 0, 1
+    while True:
+        a = math.floor(x)
+        h, h_prev = a * h + h_prev, h
+        k, k_prev = a * k + k_prev, k
+        if k > max_denominator:
+            return
+        yield Fraction(h, k)
+        if x == a:
+            return
+        x = 1 / (x - a)
+
+
+def _primitive(coeff):
+    """Współczynniki całkowite bez wspólnego dzielnika (dla Fraction - po sprowadzeniu do wspólnego mianownika)."""
+    scale = math.lcm(*(Fraction(c).denominator for c in coeff))
+    values = [int(c * scale) for c in coeff]
+    divisor = math.gcd(*values) or 1
+    return [v // divisor for v in values]
+
+
+def _isolate(p, width):
+    """
+    Przedziały (low, high] szerokości mniejszej niż width, z których każdy zawiera
+    dokładnie jeden pierwiastek rzeczywisty bezkwadratowego wielomianu p.
+
+    Dopóki przedział zawiera kilka pierwiastków, dzielony jest według liczby Sturma;
+    przedział z jednym pierwiastkiem zawężany jest już tylko po znaku p.
+    Wartości liczone są w liczbach całkowitych (patrz _sign).
+    """
+    sequence = [_primitive(q.coeff) for q in sturm_sequence(p)]
+    coeff = sequence[0]
+    bound = 1 + max(abs(Fraction(c, coeff[0])) for c in coeff[1:])
+
+    def changes(x):
+        signs = [s for s in (_sign(q, x) for q in sequence) if s]
+        return sum(a != b for a, b in zip(signs, signs[1:]))
+
+    stack = [(-bound, bound, changes(-bound), changes(bound))]
+    while stack:
+        low, high, low_changes, high_changes = stack.pop()
+        count = low_changes - high_changes
+        if count > 1:
+            middle = (low + high) / 2
+            middle_changes = changes(middle)
+            stack.append((low, middle, low_changes, middle_changes))
+            stack.append((middle, high, middle_changes, high_changes))
+        elif count == 1:
+            high_sign = _sign(coeff, high)
+            if not high_sign:
+                yield high, high
+                continue
+            while high - low >= width:
+                middle = (low + high) / 2
+                middle_sign = _sign(coeff, middle)
+                if not middle_sign:
+                    low = high = middle
+                    break
+                if middle_sign == high_sign:
+                    high = middle
+                else:
+                    low = middle
+            yield low, high
+
+
+def _sign(coeff, x):
+    """Znak wartości wielomianu o współczynnikach całkowitych w punkcie wymiernym x = a/b (b > 0)."""
+    a, b = x.numerator, x.denominator
+    # Horner dla b^n p(a/b) = sum c_i a^(n-i) b^i, bez ułamków.
+    value = 0
+    power = 1
+    for c in coeff:
+        value = value * a + c * power
+        power *= b
+    return (value > 0) - (value < 0)
+
+
+def roots(p, method="auto", tol=1e-12, max_iterations=500):
+    """
+    Pierwiastki zespolone wielomianu (z krotnościami).
+
+    Args:
+        p: Wielomian stopnia co najmniej 0
+        method: "companion" (wartości własne macierzy towarzyszącej, wymaga NumPy),
+            "aberth" (iteracja Abertha-Ehrlicha) albo "auto"
+        tol: Względna dokładność kroku, po której iteracja Abertha się zatrzymuje
+        max_iterations: Limit iteracji Abertha; po jego przekroczeniu zwracane są
+            bieżące przybliżenia (tak bywa przy pierwiastkach wielokrotnych)
+
+    Returns:
+        Lista liczb zespolonych posortowana po części rzeczywistej i urojonej
+    """
+    method = _choose(method, p.degree())
+    if p.degree() < 1:
+        return []
+    if method == "companion":
+        result = np.linalg.eigvals(_companion(np.array([complex(c) for c in p.coeff]))).tolist()
+    elif np is not None and p.degree() > COMPANION_MAX_DEGREE:
+        # Dla małych stopni narzut NumPy przeważa nad zyskiem z wektoryzacji.
+        result = _aberth_numpy(p.coeff, tol, max_iterations)
+    else:
+        result = _aberth(p.coeff, tol, max_iterations)
+    return sorted(result, key=lambda z: (z.real, z.imag))
+
+
+def roots_many(polynomials, method="auto", tol=1e-12, max_iterations=500):
+    """
+    Pierwiastki wielu wielomianów.
+
+    Wielomiany tego samego stopnia łączone są w jedną partię macierzy towarzyszących
+    i rozwiązywane jednym wywołaniem np.linalg.eigvals. Tablica NumPy kształtu (k, n + 1)
+    jest traktowana jako k wielomianów stopnia n (współczynniki od najwyższej potęgi)
+    i daje tablicę pierwiastków kształtu (k, n).
+
+    Returns:
+        Lista list pierwiastków w kolejności wejścia albo tablica NumPy
+    """
+    if np is not None and isinstance(polynomials, np.ndarray):
+        if polynomials.ndim != 2:
+            raise ValueError("Oczekiwano tablicy dwuwymiarowej współczynników")
+        if np.any(polynomials[:, 0] == 0):
+            raise ValueError("Współczynnik wiodący musi być niezerowy")
+        if polynomials.shape[1] < 2:
+            return np.empty((polynomials.shape[0], 0), dtype=complex)
+        return np.linalg.eigvals(_companion(polynomials.astype(complex)))
+    polynomials = list(polynomials)
+    by_degree = {}
+    for i, p in enumerate(polynomials):
+        by_degree.setdefault(p.degree(), []).append(i)
+    result = [None] * len(polynomials)
+    for degree, indices in by_degree.items():
+        if degree < 1:
+            for i in indices:
+                result[i] = []
+        elif _choose(method, degree) == "companion":
+            batch = np.array([[complex(c) for c in polynomials[i].coeff] for i in indices])
+            for i, values in zip(indices, np.linalg.eigvals(_companion(batch)).tolist()):
+                result[i] = sorted(values, key=lambda z: (z.real, z.imag))
+        else:
+            for i in indices:
+                result[i] = roots(polynomials[i], method, tol, max_iterations)
+    return result
+
+
+def _choose(method, degree):
+    if method not in METHODS:
+        raise ValueError("Nieznana metoda wyznaczania pierwiastków")
+    if method == "companion" and np is None:
+        raise ImportError("Metoda companion wymaga biblioteki NumPy")
+    if method == "auto":
+        return "companion" if np is not None and degree <= COMPANION_MAX_DEGREE else "aberth"
+    return method
+
+
+def _companion(coeff):
+    """
+    Macierze towarzyszące dla tablicy współczynników (..., n + 1): pierwszy wiersz
+    to -a_i / a_0, pod przekątną jedynki. Wartości własne to pierwiastki.
+    """
+    n = coeff.shape[-1] - 1
+    matrix = np.zeros(coeff.shape[:-1] + (n, n), dtype=coeff.dtype)
+    matrix[..., 0, :] = -coeff[..., 1:] / coeff[..., :1]
+    matrix[..., np.arange(1, n), np.arange(n - 1)] = 1
+    return matrix
+
+
+def _initial_guesses(coeff):
+    """Punkty startowe na okręgu o promieniu równym średniej geometrycznej modułów pierwiastków."""
+    n = len(coeff) - 1
+    last = next((abs(c) for c in reversed(coeff) if c != 0), 1)
+    zeros = len(coeff) - 1 - max(i for i, c in enumerate(coeff) if c != 0)
+    radius = (last / abs(coeff[0])) ** (1 / (n - zeros)) if n > zeros else 1
+    return [radius * cmath.exp(1j * (2 * math.pi * k / n + 0.4)) for k in range(n)]
+
+
+def _aberth(coeff, tol, max_iterations):
+    """Iteracja Abertha-Ehrlicha (wersja Gaussa-Seidla) w czystym Pythonie."""
+    coeff = [complex(c) for c in coeff]
+    z = _initial_guesses(coeff)
+    n = len(z)
+    for _ in range(max_iterations):
+        converged = True
+        for k in range(n):
+            zk = z[k]
+            value, slope = _horner_with_derivative(coeff, zk)
+            if value == 0:
+                continue
+            ratio = value / slope if slope != 0 else value
+            repulsion = sum(1 / (zk - z[j]) for j in range(n) if j != k and zk != z[j])
+            step = ratio / (1 - ratio * repulsion)
+            z[k] = zk - step
+            if abs(step) > tol * max(1.0, abs(zk)):
+                converged = False
+        if converged:
+            break
+    return z
+
+
+def _horner_with_derivative(coeff, x):
+    value = 0j
+    slope = 0j
+    for c in coeff:
+        slope = slope * x + value
+        value = value * x + c
+    return value, slope
+
+
+def _aberth_numpy(coeff, tol, max_iterations):
+    """Iteracja Abertha-Ehrlicha (wersja Jacobiego) z wektorowymi obliczeniami NumPy."""
+    coeff = np.array([complex(c) for c in coeff])
+    z = np.array(_initial_guesses(coeff.tolist()))
+    n = len(z)
+    off_diagonal = ~np.eye(n, dtype=bool)
+    for _ in range(max_iterations):
+        value = np.zeros(n, dtype=complex)
+        slope = np.zeros(n, dtype=complex)
+        for c in coeff:
+            slope = slope * z + value
+            value = value * z + c
+        differences = z[:, None] - z[None, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = np.where(slope != 0, value / slope, value)
+            inverse = np.where(off_diagonal & (differences != 0), 1 / differences, 0)
+            step = ratio / (1 - ratio * inverse.sum(axis=1))
+        step = np.where(value == 0, 0, step)
+        z = z - step
+        if np.all(np.abs(step) <= tol * np.maximum(1.0, np.abs(z))):
+            break
+    return z.tolist()
@@ -1,5 +1,7 @@
 import unittest
-from src.polynomial import Polynomial
+from unittest import mock
+from fractions import Fraction
+from src.polynomial import FrozenPolynomial, Polynomial, SparsePolynomial, _karatsuba, _kronecker, _schoolbook, np
 
 
 class TestPolynomial(unittest.TestCase):
@@ -218,6 +220,247 @@ class TestPolynomial(unittest.TestCase):
         # Dla x = -1: (-1)^5 - 3*(-1)^3 + 2 = -1 + 3 + 2 = 4
         self.assertEqual(p.evaluate(-1), 4)
 
+    def test_negation(self):
+        """Test wielomianu przeciwnego i odejmowania od liczby wielomianu wyższego stopnia."""
+        p = Polynomial([1, -2, 0, 3])  # x^3 - 2x^2 + 3
+        self.assertEqual(-p, Polynomial([-1, 2, 0, -3]))
+        self.assertEqual(str(-p), "-x^3 + 2x^2 - 3")
+        self.assertEqual(Polynomial([1, 2]) - p, Polynomial([-1, 2, 1, -1]))
+
+    def test_evaluate_many(self):
+        """Test obliczania wartości w wielu punktach obiema metodami."""
+        p = Polynomial([1, 0, -3, 0, 0, 2])  # x^5 - 3x^3 + 2
+        xs = list(range(-10, 11))
+        expected = [p.evaluate(x) for x in xs]
+        self.assertEqual(p.evaluate_many(xs), expected)
+        self.assertEqual(p.evaluate_many(iter(xs), method="tree"), expected)
+        self.assertEqual(p.evaluate_many([], method="tree"), [])
+        self.assertEqual(Polynomial([7]).evaluate_many([1, 2], method="tree"), [7, 7])
+
+    @unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+    def test_evaluate_many_numpy(self):
+        """Test wektorowego obliczania wartości na tablicach NumPy."""
+        p = Polynomial([1] + [0] * 19 + [1])  # x^20 + 1
+        xs = np.array([-100, 3, 100])
+        self.assertEqual(p.evaluate_many(xs).tolist(), [p.evaluate(int(x)) for x in xs])
+        sparse = Polynomial.from_terms({200: 1, 0: 1})
+        self.assertEqual(sparse.evaluate_many(xs).tolist(), [sparse.evaluate(int(x)) for x in xs])
+        floats = np.array([0.5, -1.5])
+        values = p.evaluate_many(floats)
+        self.assertEqual(values.dtype, np.float64)
+        for value, x in zip(values, floats):
+            self.assertAlmostEqual(value, p.evaluate(float(x)))
+
+    def test_evaluate_many_fractions(self):
+        """Test dokładnych obliczeń na ułamkach."""
+        p = Polynomial([Fraction(1, 3), 0, -1])
+        xs = [Fraction(i, 7) for i in range(-5, 6)]
+        self.assertEqual(p.evaluate_many(xs, method="tree"), [p.evaluate(x) for x in xs])
+        with self.assertRaises(ValueError):
+            p.evaluate_many(xs, method="fft")
+
+    def test_fast_multiplication(self):
+        """Test szybkich algorytmów mnożenia względem metody szkolnej."""
+        a = [(-1) ** i * (i * 7919 % 1000) ** 3 for i in range(1, 151)]
+        b = [(i * 104729 % 201) - 100 for i in range(90)]
+        expected = _schoolbook(a, b)
+        self.assertEqual(_karatsuba(a, b), expected)
+        self.assertEqual(_kronecker(a, b), expected)
+        self.assertEqual((Polynomial(a) * Polynomial(b)).coeff, expected)
+        fractions = [Fraction(i, i % 5 + 1) for i in range(-40, 40)]
+        self.assertEqual(_karatsuba(fractions, fractions), _schoolbook(fractions, fractions))
+
+    def test_sparse_representation(self):
+        """Test automatycznego wyboru postaci rzadkiej."""
+        p = Polynomial.from_terms({1_000_000: 1, 0: 1})
+        self.assertIsInstance(p, SparsePolynomial)
+        self.assertEqual(p.degree(), 1_000_000)
+        self.assertEqual(str(p), "x^1000000 + 1")
+        self.assertEqual(repr(p), "Polynomial.from_terms({1000000: 1, 0: 1})")
+        self.assertEqual(p.evaluate(-1), 2)
+        self.assertNotIsInstance(Polynomial.from_terms({2: 1, 0: 1}), SparsePolynomial)
+        self.assertEqual(Polynomial.from_terms({2: 1, 0: 1}).coeff, [1, 0, 1])
+        self.assertEqual(Polynomial([1] + [0] * 99) + 1, Polynomial.from_terms({99: 1, 0: 1}))
+        with self.assertRaises(ValueError):
+            Polynomial.from_terms({-1: 1})
+
+    def test_sparse_arithmetic(self):
+        """Test działań na postaci rzadkiej i mieszanej."""
+        p = Polynomial.from_terms({1_000_000: 1, 0: 1})
+        q = Polynomial.from_terms({1_000_000: 1, 0: -1})
+        self.assertEqual(p * q, Polynomial.from_terms({2_000_000: 1, 0: -1}))
+        self.assertEqual(p - q, 2)
+        self.assertEqual(p - p, 0)
+        self.assertIsInstance(p + Polynomial([1, 2, 3]), SparsePolynomial)
+        self.assertEqual(Polynomial([1, 2, 3]) - p, Polynomial.from_terms({1_000_000: -1, 2: 1, 1: 2, 0: 2}))
+        self.assertEqual(3 * p, Polynomial.from_terms({1_000_000: 3, 0: 3}))
+        dense = Polynomial([2, 0, 0, 1])
+        sparse = Polynomial.from_terms({100: 1, 3: 1})
+        self.assertEqual((sparse * dense).coeff, (Polynomial(sparse.coeff) * dense).coeff)
+
+    def test_division(self):
+        """Test dzielenia z resztą."""
+        p = Polynomial([1, 0, -1])
+        self.assertEqual(divmod(p, Polynomial([1, -1])), (Polynomial([1, 1]), 0))
+        q, r = divmod(p, Polynomial([2, 2]))
+        self.assertEqual(q.coeff, [Fraction(1, 2), Fraction(-1, 2)])
+        self.assertEqual(r, 0)
+        self.assertEqual(Polynomial([1, 2, 3]) % Polynomial([1, 1]), 2)
+        self.assertEqual(Polynomial([1, 2]) // Polynomial([1, 0, 0]), 0)
+        self.assertEqual((Polynomial([4, 2]) // 2).coeff, [2, 1])
+        self.assertEqual(Polynomial([3, 0, 1]).divide(Polynomial([2, 1]), modulus=5),
+                         (Polynomial([4, 3]), Polynomial([3])))
+        with self.assertRaises(ZeroDivisionError):
+            Polynomial([1, 2]) // Polynomial([0])
+
+    def test_fast_division(self):
+        """Test dzielenia metodą Newtona w GF(p) względem dzielenia pisemnego."""
+        m = 998244353
+        a = Polynomial([(i * 7919) % m for i in range(1, 400)])
+        b = Polynomial([3] + [(i * 104729) % m for i in range(150)])
+        q, r = a.divide(b, modulus=m)
+        with mock.patch("src.polynomial.DIVISION_THRESHOLD", 10 ** 9):
+            self.assertEqual(a.divide(b, modulus=m), (q, r))
+        self.assertEqual((q * b + r - a).divide(1, modulus=m)[0], 0)
+        self.assertLess(r.degree(), b.degree())
+        q, r = divmod(a, b)
+        self.assertEqual(q * b + r, a)
+
+    def test_gcd(self):
+        """Test NWD w Z[x], Q[x] i GF(p), także algorytmem half-GCD."""
+        self.assertEqual(Polynomial([2, 4, 2]).gcd(Polynomial([4, 4])), Polynomial([2, 2]))
+        self.assertEqual(Polynomial([Fraction(1, 2), 1]).gcd(Polynomial([1, 2])), Polynomial([1, 2]))
+        self.assertEqual(Polynomial([1, 0, 1]).gcd(Polynomial([1, 1])), 1)
+        self.assertEqual(Polynomial([1, 0, 1]).gcd(Polynomial([1, 1]), modulus=2), Polynomial([1, 1]))
+        m = 998244353
+        g = Polynomial([(i * 31337) % m for i in range(1, 60)])
+        a = g * Polynomial([(i * 7919) % m for i in range(1, 200)])
+        b = g * Polynomial([(i * 104729) % m for i in range(1, 180)])
+        expected = g.divide(g.coeff[0], modulus=m)[0]
+        with mock.patch("src.polynomial.HGCD_THRESHOLD", 4):
+            self.assertEqual(a.gcd(b, modulus=m), expected)
+        with mock.patch("src.polynomial.HGCD_THRESHOLD", 10 ** 9):
+            self.assertEqual(a.gcd(b, modulus=m), expected)
+
+    def test_powmod(self):
+        """Test potęgowania modularnego."""
+        m = Polynomial([1, 0, 0, 1])
+        self.assertEqual(pow(Polynomial([1, 1]), 10, m), Polynomial([1, 1]) ** 10 % m)
+        f = Polynomial([1, 0, 0, -1, -1])
+        x = Polynomial([1, 0])
+        self.assertEqual(x.powmod(1000, f, modulus=7), (x ** 1000).divide(f, modulus=7)[1])
+        self.assertEqual(Polynomial.from_terms({100: 1, 0: 1}) ** 2, Polynomial.from_terms({200: 1, 100: 2, 0: 1}))
+        with self.assertRaises(ValueError):
+            Polynomial([1, 1]).powmod(-1, m)
+
+    def test_interpolation(self):
+        """Test interpolacji wszystkimi metodami."""
+        p = Polynomial([3, -2, 0, 5, Fraction(1, 2)])
+        xs = list(range(-3, 6))
+        ys = [p.evaluate(x) for x in xs]
+        for method in ("newton", "lagrange", "fast", "auto"):
+            self.assertEqual(Polynomial.interpolate(xs, ys, method=method), p)
+        self.assertEqual(Polynomial.interpolate([2], [7]), 7)
+        with self.assertRaises(ValueError):
+            Polynomial.interpolate([1, 1], [2, 3])
+        with self.assertRaises(ValueError):
+            Polynomial.interpolate([1, 2], [2])
+        with self.assertRaises(ValueError):
+            Polynomial.interpolate([1, 2], [2, 3], method="spline")
+
+    def test_interpolation_modular(self):
+        """Test interpolacji w GF(p) i wartości modulo p."""
+        m = 998244353
+        p = Polynomial([(i * 7919) % m for i in range(1, 301)])
+        xs = [(i * 104729) % m for i in range(300)]
+        ys = p.evaluate_many(xs, modulus=m)
+        self.assertEqual(ys, p.evaluate_many(xs, method="tree", modulus=m))
+        self.assertEqual(ys[:5], [p.evaluate(x) % m for x in xs[:5]])
+        for method in ("newton", "lagrange", "fast"):
+            self.assertEqual(Polynomial.interpolate(xs, ys, method=method, modulus=m), p)
+
+    def test_fit(self):
+        """Test dopasowania metodą najmniejszych kwadratów."""
+        for actual, expected in zip(Polynomial.fit([0, 1, 2], [1, 2, 5], 2).coeff, [1, 0, 1]):
+            self.assertAlmostEqual(actual, expected)
+        line = Polynomial.fit([0, 1, 2, 3], [1.0, 3.1, 4.9, 7.2], 1)
+        self.assertAlmostEqual(line.coeff[0], 2.04)
+        self.assertAlmostEqual(line.coeff[1], 0.99)
+        with self.assertRaises(ValueError):
+            Polynomial.fit([0, 1], [1, 2], 2)
+
+    def test_frozen(self):
+        """Test niezmiennego wielomianu."""
+        p = FrozenPolynomial([0, 1, 2])
+        q = Polynomial([1, 2]).freeze()
+        self.assertEqual(p, q)
+        self.assertEqual(hash(p), hash(q))
+        self.assertEqual({p: "x + 2"}[q], "x + 2")
+        self.assertEqual(hash(FrozenPolynomial([5])), hash(5))
+        self.assertEqual(p.coeff, (1, 2))
+        self.assertEqual(p.degree(), 1)
+        self.assertEqual(str(p), "x + 2")
+        self.assertEqual(repr(p), "FrozenPolynomial([1, 2])")
+        with self.assertRaises(AttributeError):
+            p.coeff = [3]
+        for result in (p * q, p + 1, 1 - p, Polynomial([1, 0]) * p, -p, p ** 2, p // 2, p.derivative()):
+            self.assertIsInstance(result, FrozenPolynomial)
+        self.assertEqual(p * q, Polynomial([1, 4, 4]))
+        self.assertEqual(divmod(Polynomial([1, 3, 2]).freeze(), p), (Polynomial([1, 1]), 0))
+        thawed = p.thaw()
+        thawed.coeff.append(0)
+        self.assertEqual(p, Polynomial([1, 2]))
+
+    def test_interning(self):
+        """Test internowania wielomianów."""
+        p = Polynomial([1, 2]).freeze(intern=True)
+        self.assertIs(FrozenPolynomial([1, 2]).intern(), p)
+        self.assertIs(p.freeze(intern=True), p)
+        # Te same wartości innego typu nie są utożsamiane.
+        self.assertIsNot(FrozenPolynomial([1.0, 2.0]).intern(), p)
+
+    def test_compile(self):
+        """Test skompilowanej funkcji wartości."""
+        polynomials = [
+            Polynomial([3, 0, -2, 5]),
+            Polynomial([0]),
+            Polynomial([5]),
+            Polynomial([1.5, 0, 0, 2]),
+            Polynomial([1, 0, 0, 0, 0, 0]),
+            Polynomial([Fraction(1, 3), 2, 0]),
+            Polynomial(list(range(1, 300))),
+            Polynomial.from_terms({1000: 2, 3: 1}),
+            FrozenPolynomial([1, -1, 2]),
+        ]
+        for p in polynomials:
+            f = p.compile()
+            # -0.73: x * x * x * x * x i x ** 5 różnią się zaokrągleniem.
+            for x in (0, 2, -1.5, -0.73, Fraction(1, 2)):
+                self.assertEqual(f(x), p.evaluate(x))
+                self.assertIs(type(f(x)), type(p.evaluate(x)))
+
+    def test_compile_cache(self):
+        """Test zapamiętywania skompilowanej funkcji."""
+        p = Polynomial([3, 0, -2, 5])
+        f = p.compile()
+        self.assertIs(p.compile(), f)
+        p.coeff[0] = 4
+        self.assertIsNot(p.compile(), f)
+        self.assertEqual(p.compile()(1), 7)
+        q = FrozenPolynomial([1, 2, 3])
+        self.assertIs(q.compile(), q.compile())
+        # Zmiana typu przy równej wartości też unieważnia funkcję.
+        r = Polynomial([1, 2])
+        r.compile()
+        r.coeff[0] = 1.0
+        self.assertIs(type(r.compile()(3)), float)
+        r.coeff[0] = Fraction(1)
+        self.assertIs(type(r.compile()(3)), Fraction)
+        s = Polynomial.from_terms({100: 1, 0: 1})
+        s.compile()
+        s.terms[100] = 1.0
+        self.assertIs(type(s.compile()(1)), float)
+
     def test_repr(self):
         """Test metody __repr__."""
         p = Polynomial([3, 2, 1])
@@ -0,0 +1,83 @@
+import random
+import unittest
+from fractions import Fraction
+from src.polynomial import Polynomial, np
+from src.polynomial_batch import PolynomialBatch
+
+
+@unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+class TestPolynomialBatch(unittest.TestCase):
+    def setUp(self):
+        random.seed(0)
+        self.ps = [Polynomial([random.randint(-9, 9) for _ in range(random.randint(1, 12))]) for _ in range(40)]
+        self.qs = [Polynomial([random.randint(-9, 9) for _ in range(random.randint(1, 12))]) for _ in range(40)]
+        self.a = PolynomialBatch.from_polynomials(self.ps)
+        self.b = PolynomialBatch.from_polynomials(self.qs)
+
+    def test_conversion(self):
+        """Test konwersji z listy wielomianów i z powrotem."""
+        self.assertEqual(self.a.to_polynomials(), self.ps)
+        self.assertEqual(len(self.a), 40)
+        self.assertEqual(self.a[3], self.ps[3])
+        self.assertEqual(self.a[:2].to_polynomials(), self.ps[:2])
+        self.assertEqual(self.a.degrees().tolist(), [p.degree() for p in self.ps])
+        with self.assertRaises(ValueError):
+            PolynomialBatch([1, 2, 3])
+
+    def test_arithmetic(self):
+        """Test wektorowego dodawania, odejmowania i mnożenia."""
+        self.assertEqual((self.a + self.b).to_polynomials(), [p + q for p, q in zip(self.ps, self.qs)])
+        self.assertEqual((self.a - self.b).to_polynomials(), [p - q for p, q in zip(self.ps, self.qs)])
+        self.assertEqual((self.a * self.b).to_polynomials(), [p * q for p, q in zip(self.ps, self.qs)])
+        r = Polynomial([1, -1])
+        self.assertEqual((self.a * r).to_polynomials(), [p * r for p in self.ps])
+        self.assertEqual((r - self.a).to_polynomials(), [r - p for p in self.ps])
+        self.assertEqual((2 * self.a + 1).to_polynomials(), [p * 2 + 1 for p in self.ps])
+        with self.assertRaises(ValueError):
+            self.a + self.b[:3]
+
+    def test_exact_multiplication(self):
+        """Test dokładnego mnożenia dużych liczb całkowitych i ułamków."""
+        big = PolynomialBatch([[10 ** 9, 1], [1, 2]])
+        self.assertEqual((big * big).to_polynomials(),
+                         [Polynomial([10 ** 18, 2 * 10 ** 9, 1]), Polynomial([1, 4, 4])])
+        half = PolynomialBatch.from_polynomials([Polynomial([Fraction(1, 2), 1])], dtype=object)
+        self.assertEqual((half * half)[0], Polynomial([Fraction(1, 4), 1, 1]))
+
+    def test_long_integer_multiplication(self):
+        """Test dokładności mnożenia długich wielomianów o dużych współczynnikach."""
+        for n in (4000, 16000):
+            p = Polynomial([530541] * n)
+            batch = PolynomialBatch.from_polynomials([p])
+            self.assertEqual((batch * batch)[0], p * p)
+
+    def test_int64_overflow(self):
+        """Test dokładnych wyników, gdy wartości wychodzą poza int64."""
+        p = Polynomial([1] + [0] * 19 + [1])  # x^20 + 1
+        batch = PolynomialBatch.from_polynomials([p, Polynomial([2, 1])])
+        self.assertEqual(batch.evaluate(100).tolist(), [p.evaluate(100), 201])
+        self.assertEqual(batch.evaluate(2).dtype, np.int64)
+        big = PolynomialBatch([[2 ** 62, 1]])
+        self.assertEqual((big + big)[0], Polynomial([2 ** 63, 2]))
+        self.assertEqual((big - (-big))[0], Polynomial([2 ** 63, 2]))
+        self.assertEqual((big * 4)[0], Polynomial([2 ** 64, 4]))
+        self.assertEqual((big + 10 ** 30)[0], Polynomial([2 ** 62, 10 ** 30 + 1]))
+        self.assertEqual((-PolynomialBatch(np.array([[-2 ** 63, 1]])))[0], Polynomial([2 ** 63, -1]))
+
+    def test_mixed_types(self):
+        """Test dodawania liczby zmiennoprzecinkowej do partii liczb całkowitych."""
+        self.assertEqual((self.a + 0.5).to_polynomials(), [p + 0.5 for p in self.ps])
+        self.assertEqual((self.a - 0.5)[0], self.ps[0] - 0.5)
+
+    def test_evaluate_and_trim(self):
+        """Test wartości w punkcie i usuwania wspólnych zer wiodących."""
+        self.assertEqual(self.a.evaluate(2).tolist(), [p.evaluate(2) for p in self.ps])
+        xs = np.arange(40)
+        self.assertEqual(self.a.evaluate(xs).tolist(), [p.evaluate(int(x)) for p, x in zip(self.ps, xs)])
+        padded = PolynomialBatch([[0, 0, 1, 2], [0, 0, 0, 3]])
+        self.assertEqual(padded.trim().coefficients.tolist(), [[1, 2], [0, 3]])
+        self.assertEqual(padded.trim(), padded)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+from fractions import Fraction
+from src.polynomial import Polynomial
+from src import roots as roots_module
+from src.roots import count_real_roots, rational_roots, roots, roots_many, sturm_sequence
+
+
+class TestRoots(unittest.TestCase):
+    def assertRootsAlmostEqual(self, actual, expected, places=7):
+        self.assertEqual(len(actual), len(expected))
+        for a, e in zip(actual, expected):
+            self.assertAlmostEqual(a, e, places=places)
+
+    def test_derivative(self):
+        """Test pochodnej w postaci gęstej i rzadkiej."""
+        self.assertEqual(Polynomial([1, 2, 3, 4]).derivative(), Polynomial([3, 4, 3]))
+        self.assertEqual(Polynomial([5]).derivative(), 0)
+        self.assertEqual(Polynomial.from_terms({100: 3, 0: 1}).derivative(), Polynomial.from_terms({99: 300}))
+
+    def test_sturm_sequence(self):
+        """Test ciągu Sturma i liczenia pierwiastków rzeczywistych."""
+        p = Polynomial([1, 0, -2])
+        self.assertEqual(sturm_sequence(p), [p, Polynomial([2, 0]), Polynomial([2])])
+        self.assertEqual(count_real_roots(p), 2)
+        self.assertEqual(count_real_roots(p, 0, 2), 1)
+        self.assertEqual(count_real_roots(Polynomial([1, 0, 1])), 0)
+        # Pierwiastek podwójny liczony jest raz.
+        self.assertEqual(count_real_roots(Polynomial([1, -2, 1]) * Polynomial([1, 3])), 2)
+        with self.assertRaises(ValueError):
+            count_real_roots(Polynomial([0]))
+
+    def test_rational_roots(self):
+        """Test dokładnych pierwiastków wymiernych."""
+        p = Polynomial([6, -5, 1]) * Polynomial([1, -2]) ** 2 * Polynomial([1, 0, 0]) * Polynomial([1, 0, 1])
+        self.assertEqual(rational_roots(p), [0, Fraction(1, 3), Fraction(1, 2), 2])
+        self.assertEqual(rational_roots(Polynomial([Fraction(1, 2), Fraction(-1, 4)])), [Fraction(1, 2)])
+        self.assertEqual(rational_roots(Polynomial([1, 0, -2])), [])
+        self.assertEqual(rational_roots(Polynomial([1, 0, -2]) * Polynomial([3, -1])), [Fraction(1, 3)])
+        # Skupione pierwiastki (2k + 1)/k, których przybliżenia zmiennoprzecinkowe są niedokładne.
+        clustered = Polynomial([1])
+        for k in range(1, 13):
+            clustered = clustered * Polynomial([k, -(2 * k + 1)])
+        self.assertEqual(rational_roots(clustered), sorted(Fraction(2 * k + 1, k) for k in range(1, 13)))
+        # Współczynniki poza zakresem float - tylko dokładna izolacja Sturma.
+        self.assertEqual(rational_roots(Polynomial([1, -10 ** 400])), [10 ** 400])
+        self.assertEqual(rational_roots(Polynomial([10 ** 400, -1]) * Polynomial([1, -3])), [Fraction(1, 10 ** 400), 3])
+        with self.assertRaises(TypeError):
+            rational_roots(Polynomial([1.5, 1]))
+
+    def test_aberth(self):
+        """Test iteracji Abertha-Ehrlicha."""
+        self.assertRootsAlmostEqual(roots(Polynomial([1, 0, -2]), method="aberth"), [-2 ** 0.5, 2 ** 0.5])
+        self.assertRootsAlmostEqual(roots(Polynomial([1, 0, 1]), method="aberth"), [-1j, 1j])
+        p = Polynomial([1])
+        for r in range(1, 11):
+            p = p * Polynomial([1, -r])
+        self.assertRootsAlmostEqual(roots(p, method="aberth"), list(range(1, 11)), places=5)
+        self.assertEqual(roots(Polynomial([3])), [])
+        with self.assertRaises(ValueError):
+            roots(p, method="bisection")
+
+    def test_roots_many(self):
+        """Test rozwiązywania wielu wielomianów naraz."""
+        result = roots_many([Polynomial([1, -3, 2]), Polynomial([1, 1]), Polynomial([5]), Polynomial([1, -5, 6])])
+        self.assertRootsAlmostEqual(result[0], [1, 2])
+        self.assertRootsAlmostEqual(result[1], [-1])
+        self.assertEqual(result[2], [])
+        self.assertRootsAlmostEqual(result[3], [2, 3])
+
+    @unittest.skipIf(roots_module.np is None, "NumPy nie jest zainstalowany")
+    def test_companion(self):
+        """Test metody macierzy towarzyszącej i partii w tablicy NumPy."""
+        np = roots_module.np
+        self.assertRootsAlmostEqual(roots(Polynomial([1, -3, 2]), method="companion"), [1, 2])
+        batch = np.array([[1.0, -3.0, 2.0], [1.0, -5.0, 6.0]])
+        result = np.sort_complex(roots_many(batch))
+        np.testing.assert_allclose(result, [[1, 2], [2, 3]])
+        with self.assertRaises(ValueError):
+            roots_many(np.array([[0.0, 1.0]]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import random
+import sys
+import time
+import tracemalloc
+
+from src.authors import AuthorRegistry
+from src.book import Book
+from src.catalog import BookCatalog
+
+
+class _ListBook:
+    # Dotychczasowy układ: słownik atrybutów i lista napisów w każdej książce.
+    def __init__(self, title, page_count):
+        self.title = title
+        self.page_count = page_count
+        self.authors = []
+
+    def add_author(self, author):
+        if not author:
+            raise ValueError("Author name cannot be empty")
+        self.authors.append(author)
+
+
+def _measure(label, build):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"{label}: {size / 2 ** 20:8.1f} MiB, {elapsed:.2f} s")
+    return result
+
+
+def main(count=10 ** 6, authors=10_000):
+    random.seed(0)
+    records = [(f"Book {i}", random.randint(20, 1500), random.sample(range(authors), random.randint(1, 3)))
+               for i in range(count)]
+
+    def names(numbers):
+        # Nazwiska jak po wczytaniu z pliku: osobny obiekt str przy każdym wystąpieniu.
+        return [f"Author {number}" for number in numbers]
+
+    def build(cls, *args):
+        books = []
+        for title, pages, numbers in records:
+            book = cls(title, pages, *args)
+            for name in names(numbers):
+                book.add_author(name)
+            books.append(book)
+        return books
+
+    def build_catalog():
+        catalog = BookCatalog(registry=AuthorRegistry())
+        catalog.extend((title, pages, names(numbers)) for title, pages, numbers in records)
+        return catalog
+
+    _measure("list-of-strings books", lambda: build(_ListBook))
+    _measure("interned-id books", lambda: build(Book, AuthorRegistry()))
+    _measure("columnar catalog", build_catalog)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
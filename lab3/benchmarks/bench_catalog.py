@@ -0,0 +1,45 @@
+import random
+import sys
+import time
+
+from src.catalog import BookCatalog
+
+_WORDS = ["Animal", "Farm", "Pride", "Prejudice", "Good", "Omens", "War", "Peace", "Night",
+          "Day", "Red", "Black", "House", "Sea", "Old", "Man", "River", "Stone", "Glass", "Garden"]
+
+
+def _records(count, authors):
+    for i in range(count):
+        yield (f"{random.choice(_WORDS)} {random.choice(_WORDS)} {i}",
+               random.randint(20, 1500),
+               (f"Author {random.randrange(authors)}",))
+
+
+def _timed(label, function, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{label}: {elapsed * 1e3:.3f} ms")
+    return result
+
+
+def main(count=10 ** 7, authors=100_000):
+    random.seed(0)
+    catalog = BookCatalog()
+    _timed(f"bulk load {count} records", lambda: catalog.extend(_records(count, authors)))
+    title = catalog.titles[count // 2]
+
+    _timed("exact title (index)", lambda: catalog.find_title(title), 1000)
+    _timed("exact title (scan)", lambda: [i for i, t in enumerate(catalog.titles) if t == title])
+    _timed("author (index)", lambda: catalog.find_author("Author 42"), 1000)
+    _timed("build title index", lambda: catalog.find_title_prefix("Red Sea 1"))
+    _timed("title prefix (index)", lambda: catalog.find_title_prefix("Red Sea 1"), 100)
+    _timed("title prefix (scan)", lambda: [i for i, t in enumerate(catalog.titles) if t.startswith("Red Sea 1")])
+    _timed("build page index", lambda: catalog.find_page_range(500, 500))
+    _timed("page range (index)", lambda: catalog.find_page_range(500, 501), 100)
+    _timed("page range (scan)", lambda: [i for i, p in enumerate(catalog.page_counts) if 500 <= p <= 501])
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
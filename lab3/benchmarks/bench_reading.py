@@ -0,0 +1,46 @@
+import random
+import sys
+import time
+
+from src.catalog import BookCatalog
+from src.reading import np, reading_time_by_author, reading_times, schedule
+
+
+def _timed(label, function):
+    start = time.perf_counter()
+    result = function()
+    print(f"{label}: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    return result
+
+
+def _loop_by_author(catalog):
+    totals = {}
+    for book in catalog:
+        for author in book.authors:
+            totals[author] = totals.get(author, 0) + book.calculate_reading_time()
+    return totals
+
+
+def main(count=10 ** 6, authors=10_000):
+    if np is None:
+        print("NumPy is required - skipping")
+        return
+    random.seed(0)
+    catalog = BookCatalog()
+    catalog.extend((f"Book {i}", random.randint(20, 1500), (f"Author {random.randrange(authors)}",))
+                   for i in range(count))
+    books = list(catalog)
+
+    _timed(f"reading time, {count} Book calls", lambda: [book.calculate_reading_time() for book in books])
+    _timed("reading time, vectorized", lambda: reading_times(catalog))
+    _timed("reading time, 100 readers vectorized", lambda: reading_times(catalog, np.linspace(10, 60, 100)))
+    _timed("by author, loop", lambda: _loop_by_author(catalog))
+    _timed("by author, vectorized", lambda: reading_time_by_author(catalog))
+    _timed("most books in 1000 h", lambda: schedule(catalog, 1000))
+    values = [random.randint(1, 10) for _ in range(2000)]
+    pages = [book.page_count for book in books[:2000]]
+    _timed("knapsack, 2000 rated books in 1000 h", lambda: schedule(pages, 1000, values=values))
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
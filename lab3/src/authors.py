@@ -0,0 +1,70 @@
+import unicodedata
+from array import array
+
+
+class AuthorRegistry:
+    # Każde nazwisko autora przechowywane jest raz, a książki trzymają tylko
+    # identyfikatory (indeksy w names). Normalizacja i walidacja wykonywane są
+    # raz na każdy odrębny napis - kolejne wystąpienia to jedno trafienie w słowniku.
+    __slots__ = ("names", "_ids", "_raw")
+
+    def __init__(self):
+        self.names = []
+        self._ids = {}
+        self._raw = {}
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return self.get(name) is not None
+
+    def intern(self, name):
+        """Zwraca identyfikator autora, rejestrując go przy pierwszym wystąpieniu."""
+        author_id = self._raw.get(name)
+        if author_id is None:
+            normalized = normalize(name)
+            author_id = self._ids.get(normalized)
+            if author_id is None:
+                author_id = self._ids[normalized] = len(self.names)
+                self.names.append(normalized)
+            self._raw[name] = author_id
+        return author_id
+
+    def get(self, name):
+        """Identyfikator zarejestrowanego autora albo None (bez rejestrowania)."""
+        author_id = self._raw.get(name)
+        if author_id is None and isinstance(name, str):
+            author_id = self._ids.get(_canonical(name))
+        return author_id
+
+    def ids(self, names):
+        """Tablica identyfikatorów dla listy nazwisk."""
+        return array("i", map(self.intern, names))
+
+    def name(self, author_id):
+        return self.names[author_id]
+
+
+def normalize(name):
+    """
+    Postać kanoniczna nazwiska: Unicode NFC i pojedyncze spacje.
+
+    Raises:
+        TypeError: Gdy nazwisko nie jest napisem
+        ValueError: Gdy nazwisko jest puste
+    """
+    if not isinstance(name, str):
+        raise TypeError("Author name must be a string")
+    normalized = _canonical(name)
+    if not normalized:
+        raise ValueError("Author name cannot be empty")
+    return normalized
+
+
+def _canonical(name):
+    return " ".join(unicodedata.normalize("NFC", name).split())
+
+
+# Rejestr współdzielony przez książki i katalogi, które nie dostały własnego.
+default_registry = AuthorRegistry()
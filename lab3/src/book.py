@@ -1,8 +1,23 @@
+from array import array
+
+from src.authors import default_registry
+
+
 class Book:
-    def __init__(self, title, page_count):
+    # Autorzy przechowywani są jako zwarta tablica identyfikatorów z rejestru
+    # zamiast listy napisów powtarzanych w każdej książce.
+    __slots__ = ("title", "page_count", "author_ids", "registry")
+
+    def __init__(self, title, page_count, registry=None):
         self.title = title
         self.page_count = page_count
-        self.authors = []
+        self.author_ids = array("i")
+        self.registry = default_registry if registry is None else registry
+
+    @property
+    def authors(self):
+        names = self.registry.names
+        return [names[author_id] for author_id in self.author_ids]
 
     def calculate_reading_time(self):
 
@@ -12,4 +27,8 @@ class Book:
 
         if not author:
             raise ValueError("Author name cannot be empty")
-        self.authors.append(author)
+        author_id = self.registry.intern(author)
+        # Książka ma zwykle kilku autorów, więc sprawdzenie to przegląd kilku liczb w C.
+        if author_id in self.author_ids:
+            raise ValueError("Author already added to this book")
+        self.author_ids.append(author_id)
@@ -0,0 +1,146 @@
+import csv
+import json
+from array import array
+from bisect import bisect_left, bisect_right
+
+from src.authors import default_registry
+from src.book import Book
+
+# Znak większy od każdego innego - górna granica przedziału tytułów o danym prefiksie.
+_MAX_CHAR = chr(0x10FFFF)
+
+
+class BookCatalog:
+    # Książki w kolumnach (tytuły, liczby stron, identyfikatory autorów) zamiast
+    # milionów obiektów Book; autorzy i-tej książki to
+    # author_ids[author_offsets[i]:author_offsets[i + 1]]. Indeksy haszujące
+    # (tytuł, autor) są aktualizowane przy dodawaniu, a posortowane (prefiks tytułu,
+    # przedział stron) budowane leniwie przy pierwszym zapytaniu po zmianie, więc
+    # ładowanie hurtowe sortuje tylko raz.
+    __slots__ = ("titles", "page_counts", "author_ids", "author_offsets", "registry", "_by_title", "_by_author",
+                 "_title_order", "_sorted_titles", "_page_order", "_sorted_pages")
+
+    def __init__(self, books=(), registry=None):
+        self.titles = []
+        self.page_counts = array("q")
+        self.author_ids = array("i")
+        self.author_offsets = array("q", [0])
+        self.registry = default_registry if registry is None else registry
+        self._by_title = {}
+        self._by_author = {}
+        self._invalidate()
+        self.extend((book.title, book.page_count, book.authors) for book in books)
+
+    def _invalidate(self):
+        self._title_order = self._sorted_titles = None
+        self._page_order = self._sorted_pages = None
+
+    def __len__(self):
+        return len(self.titles)
+
+    def __getitem__(self, book_id):
+        book = Book(self.titles[book_id], self.page_counts[book_id], self.registry)
+        book.author_ids = self._author_ids(book_id)
+        return book
+
+    def authors(self, book_id):
+        """Nazwiska autorów książki."""
+        names = self.registry.names
+        return [names[author_id] for author_id in self._author_ids(book_id)]
+
+    def _author_ids(self, book_id):
+        book_id = range(len(self))[book_id]
+        return self.author_ids[self.author_offsets[book_id]:self.author_offsets[book_id + 1]]
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+
+    def add(self, book):
+        """Dodaje książkę i zwraca jej identyfikator (pozycję w katalogu)."""
+        return self.add_record(book.title, book.page_count, book.authors)
+
+    def add_record(self, title, page_count, authors=()):
+        book_id = len(self.titles)
+        self.extend([(title, page_count, authors)])
+        return book_id
+
+    def extend(self, records):
+        """Dodaje hurtowo krotki (tytuł, liczba stron, autorzy)."""
+        titles, page_counts = self.titles, self.page_counts
+        author_ids, author_offsets = self.author_ids, self.author_offsets
+        by_title, by_author, intern = self._by_title, self._by_author, self.registry.intern
+        book_id = len(titles)
+        self._invalidate()
+        for title, page_count, authors in records:
+            ids = [intern(author) for author in authors]
+            if len(ids) > 1 and len(set(ids)) < len(ids):
+                raise ValueError("Author already added to this book")
+            page_counts.append(page_count)
+            titles.append(title)
+            author_ids.extend(ids)
+            author_offsets.append(len(author_ids))
+            # Tytuły są zwykle unikalne: pojedynczy identyfikator zamiast listy na każdą książkę.
+            same_title = by_title.get(title)
+            if same_title is None:
+                by_title[title] = book_id
+            elif type(same_title) is int:
+                by_title[title] = [same_title, book_id]
+            else:
+                same_title.append(book_id)
+            for author_id in ids:
+                by_author.setdefault(author_id, []).append(book_id)
+            book_id += 1
+
+    @classmethod
+    def from_csv(cls, path, delimiter=",", author_separator=";"):
+        """Wczytuje plik CSV z kolumnami title, page_count, authors (autorzy rozdzieleni author_separator)."""
+        catalog = cls()
+        with open(path, newline="", encoding="utf-8") as file:
+            catalog.extend(
+                (row["title"], int(row["page_count"]),
+                 row["authors"].split(author_separator) if row.get("authors") else ())
+                for row in csv.DictReader(file, delimiter=delimiter)
+            )
+        return catalog
+
+    @classmethod
+    def from_json(cls, path):
+        """Wczytuje plik JSON z listą obiektów {"title", "page_count", "authors"}."""
+        catalog = cls()
+        with open(path, encoding="utf-8") as file:
+            catalog.extend((item["title"], item["page_count"], item.get("authors", ()))
+                           for item in json.load(file))
+        return catalog
+
+    def find_title(self, title):
+        """Identyfikatory książek o dokładnie takim tytule."""
+        book_ids = self._by_title.get(title, ())
+        return [book_ids] if type(book_ids) is int else list(book_ids)
+
+    def find_title_prefix(self, prefix):
+        """Identyfikatory książek, których tytuł zaczyna się od prefix, w kolejności alfabetycznej."""
+        if self._sorted_titles is None:
+            order = sorted(range(len(self.titles)), key=self.titles.__getitem__)
+            self._title_order = array("q", order)
+            self._sorted_titles = [self.titles[i] for i in order]
+        low = bisect_left(self._sorted_titles, prefix)
+        high = bisect_left(self._sorted_titles, prefix + _MAX_CHAR, low)
+        return self._title_order[low:high].tolist()
+
+    def find_author(self, author):
+        """Identyfikatory książek danego autora (nazwisko porównywane po normalizacji)."""
+        return list(self._by_author.get(self.registry.get(author), ()))
+
+    def find_page_range(self, low=None, high=None):
+        """Identyfikatory książek o liczbie stron w przedziale domkniętym [low, high], rosnąco po stronach."""
+        if self._sorted_pages is None:
+            order = sorted(range(len(self.page_counts)), key=self.page_counts.__getitem__)
+            self._page_order = array("q", order)
+            self._sorted_pages = array("q", (self.page_counts[i] for i in order))
+        start = 0 if low is None else bisect_left(self._sorted_pages, low)
+        stop = len(self._sorted_pages) if high is None else bisect_right(self._sorted_pages, high)
+        return self._page_order[start:stop].tolist()
+
+    def books(self, book_ids):
+        """Obiekty Book dla listy identyfikatorów."""
+        return [self[book_id] for book_id in book_ids]
@@ -0,0 +1,131 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Tempo zgodne z Book.calculate_reading_time (page_count / 2).
+DEFAULT_PAGES_PER_HOUR = 2
+
+# Największa tablica decyzji (książki x pojemność w stronach) dla plecaka z wartościami.
+KNAPSACK_MAX_CELLS = 10 ** 8
+
+
+def page_counts(books):
+    """
+    Liczby stron jako tablica NumPy.
+
+    Args:
+        books: BookCatalog (kopia kolumny stron przez protokół bufora), lista Book
+            albo liczby stron
+    """
+    if np is None:
+        raise ImportError("Analiza czasu czytania wymaga biblioteki NumPy")
+    columns = getattr(books, "page_counts", None)
+    if columns is not None:
+        return np.array(columns, dtype=np.int64)
+    books = list(books)
+    return np.array([getattr(book, "page_count", book) for book in books], dtype=np.int64)
+
+
+def reading_times(books, pages_per_hour=DEFAULT_PAGES_PER_HOUR):
+    """
+    Czasy czytania wszystkich książek naraz.
+
+    Args:
+        books: Jak w page_counts
+        pages_per_hour: Tempo czytelnika albo tablica temp wielu czytelników
+
+    Returns:
+        Tablica (książki,) dla jednego tempa albo (czytelnicy, książki) dla tablicy temp
+    """
+    rates = _rates(pages_per_hour)
+    pages = page_counts(books)
+    return pages / rates[:, None] if rates.ndim else pages / rates
+
+
+def reading_time_by_author(catalog, pages_per_hour=DEFAULT_PAGES_PER_HOUR):
+    """
+    Łączny czas czytania książek każdego autora.
+
+    Książka kilku autorów liczy się w całości do każdego z nich.
+
+    Returns:
+        Słownik autor -> czas (liczba albo tablica po czytelnikach)
+    """
+    rates = _rates(pages_per_hour)
+    pages = page_counts(catalog)
+    author_ids = np.array(catalog.author_ids, dtype=np.int64)
+    authors_per_book = np.diff(np.array(catalog.author_offsets, dtype=np.int64))
+    totals = np.bincount(author_ids, weights=np.repeat(pages, authors_per_book), minlength=len(catalog.registry))
+    # Rejestr może być współdzielony z innymi katalogami - pomijamy autorów spoza tego.
+    present = np.flatnonzero(np.bincount(author_ids, minlength=len(catalog.registry)))
+    names = [catalog.registry.names[author_id] for author_id in present.tolist()]
+    totals = totals[present]
+    if rates.ndim:
+        return dict(zip(names, totals[:, None] / rates))
+    return dict(zip(names, (totals / rates).tolist()))
+
+
+def schedule(books, budget_hours, pages_per_hour=DEFAULT_PAGES_PER_HOUR, values=None):
+    """
+    Wybiera książki mieszczące się w budżecie czasu (problem plecakowy 0/1).
+
+    Bez values maksymalizuje liczbę przeczytanych książek - wtedy optymalne jest
+    branie najkrótszych, więc wystarczy sortowanie i suma prefiksowa. Z values
+    maksymalizuje sumę wartości programowaniem dynamicznym po pojemności w stronach,
+    wektoryzowanym po całym wierszu tablicy dla każdej książki.
+
+    Args:
+        books: Jak w page_counts
+        budget_hours: Dostępny czas
+        pages_per_hour: Tempo czytelnika
+        values: Opcjonalne wartości (np. oceny) książek
+
+    Returns:
+        Posortowana tablica indeksów wybranych książek
+    """
+    if budget_hours < 0:
+        raise ValueError("Budżet czasu nie może być ujemny")
+    rate = _rates(pages_per_hour)
+    if rate.ndim:
+        raise ValueError("Plan układany jest dla jednego tempa czytania")
+    pages = page_counts(books)
+    capacity = int(budget_hours * rate)
+    if values is None:
+        order = np.argsort(pages, kind="stable")
+        taken = np.searchsorted(np.cumsum(pages[order]), capacity, side="right")
+        return np.sort(order[:taken])
+
+    values = np.asarray(values, dtype=float)
+    if values.shape != pages.shape:
+        raise ValueError("Liczba wartości musi odpowiadać liczbie książek")
+    # Książki bez wartości lub dłuższe niż cały budżet nigdy nie są wybierane.
+    candidates = np.flatnonzero((pages <= capacity) & (values > 0))
+    if len(candidates) * (capacity + 1) > KNAPSACK_MAX_CELLS:
+        raise ValueError("Problem zbyt duży dla dokładnego plecaka")
+    best = np.zeros(capacity + 1)
+    chosen = np.zeros((len(candidates), capacity + 1), dtype=bool)
+    for row, book in enumerate(candidates):
+        weight = pages[book]
+        with_book = best[:capacity + 1 - weight] + values[book]
+        take = with_book > best[weight:]
+        chosen[row, weight:] = take
+        best[weight:] = np.where(take, with_book, best[weight:])
+
+    selected = []
+    remaining = capacity
+    for row in range(len(candidates) - 1, -1, -1):
+        if chosen[row, remaining]:
+            book = candidates[row]
+            selected.append(book)
+            remaining -= pages[book]
+    return np.sort(np.array(selected, dtype=np.int64))
+
+
+def _rates(pages_per_hour):
+    if np is None:
+        raise ImportError("Analiza czasu czytania wymaga biblioteki NumPy")
+    rates = np.asarray(pages_per_hour, dtype=float)
+    if rates.ndim > 1 or np.any(rates <= 0):
+        raise ValueError("Tempo czytania musi być dodatnie")
+    return rates
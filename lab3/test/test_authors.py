@@ -0,0 +1,60 @@
+import unittest
+from src.authors import AuthorRegistry, normalize
+from src.book import Book
+from src.catalog import BookCatalog
+
+
+class TestAuthorRegistry(unittest.TestCase):
+    def test_intern(self):
+        """Sprawdza, czy to samo nazwisko dostaje ten sam identyfikator"""
+        registry = AuthorRegistry()
+        first = registry.intern("Jane Austen")
+        self.assertEqual(registry.intern("  Jane   Austen "), first)
+        self.assertEqual(registry.intern("George Orwell"), first + 1)
+        self.assertEqual(registry.name(first), "Jane Austen")
+        self.assertEqual(len(registry), 2)
+        self.assertEqual(registry.ids(["George Orwell", "Jane Austen"]).tolist(), [1, 0])
+        self.assertIn("Jane  Austen", registry)
+        self.assertNotIn("Ray Bradbury", registry)
+        self.assertEqual(len(registry), 2)
+
+    def test_normalize(self):
+        """Sprawdza normalizację Unicode i walidację nazwisk"""
+        self.assertEqual(normalize("Stanisla\u0301w\tLem"), "Stanisl\u00e1w Lem")
+        with self.assertRaises(ValueError):
+            AuthorRegistry().intern("   ")
+        with self.assertRaises(TypeError):
+            AuthorRegistry().intern(42)
+
+    def test_book_uses_ids(self):
+        """Sprawdza, czy książki współdzielą nazwiska i odrzucają duplikaty"""
+        registry = AuthorRegistry()
+        book1 = Book("Good Omens", 412, registry)
+        book1.add_author("Terry Pratchett")
+        book1.add_author("Neil Gaiman")
+        book2 = Book("Coraline", 162, registry)
+        book2.add_author("Neil  Gaiman")
+        self.assertEqual(book1.author_ids.tolist(), [0, 1])
+        self.assertEqual(book2.author_ids.tolist(), [1])
+        self.assertIs(book1.authors[1], book2.authors[0])
+        with self.assertRaises(ValueError) as context:
+            book1.add_author("Neil Gaiman ")
+        self.assertEqual(str(context.exception), "Author already added to this book")
+
+    def test_catalog_uses_ids(self):
+        """Sprawdza kolumny identyfikatorów autorów w katalogu"""
+        catalog = BookCatalog(registry=AuthorRegistry())
+        catalog.extend([("Good Omens", 412, ["Terry Pratchett", "Neil Gaiman"]),
+                        ("Coraline", 162, ["Neil Gaiman"])])
+        self.assertEqual(catalog.author_ids.tolist(), [0, 1, 1])
+        self.assertEqual(catalog.author_offsets.tolist(), [0, 2, 3])
+        self.assertEqual(catalog.authors(0), ["Terry Pratchett", "Neil Gaiman"])
+        self.assertEqual(catalog[-1].authors, ["Neil Gaiman"])
+        self.assertEqual(catalog.find_author(" Neil Gaiman"), [0, 1])
+        with self.assertRaises(ValueError):
+            catalog.add_record("Twice", 10, ["Neil Gaiman", "Neil  Gaiman"])
+        self.assertEqual(len(catalog), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
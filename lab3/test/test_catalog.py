@@ -0,0 +1,82 @@
+import json
+import os
+import tempfile
+import unittest
+from src.book import Book
+from src.catalog import BookCatalog
+
+
+class TestBookCatalog(unittest.TestCase):
+    def setUp(self):
+        self.catalog = BookCatalog()
+        for title, pages, authors in [
+            ("Animal Farm", 112, ["George Orwell"]),
+            ("Nineteen Eighty-Four", 328, ["George Orwell"]),
+            ("Pride and Prejudice", 432, ["Jane Austen"]),
+            ("Good Omens", 412, ["Terry Pratchett", "Neil Gaiman"]),
+            ("Animal Farm", 95, ["George Orwell"]),
+        ]:
+            book = Book(title, pages)
+            for author in authors:
+                book.add_author(author)
+            self.catalog.add(book)
+
+    def test_add_and_get(self):
+        """Sprawdza, czy książki są zapisywane i odtwarzane z kolumn"""
+        self.assertEqual(len(self.catalog), 5)
+        book = self.catalog[3]
+        self.assertEqual((book.title, book.page_count, book.authors),
+                         ("Good Omens", 412, ["Terry Pratchett", "Neil Gaiman"]))
+        self.assertEqual(self.catalog.add_record("Emma", 474, ["Jane Austen"]), 5)
+        self.assertEqual([b.title for b in self.catalog][-1], "Emma")
+
+    def test_title_lookup(self):
+        """Sprawdza wyszukiwanie po pełnym tytule i po prefiksie"""
+        self.assertEqual(self.catalog.find_title("Animal Farm"), [0, 4])
+        self.assertEqual(self.catalog.find_title("Emma"), [])
+        self.assertEqual(self.catalog.find_title_prefix("Animal"), [0, 4])
+        self.assertEqual(self.catalog.find_title_prefix("N"), [1])
+        self.assertEqual(len(self.catalog.find_title_prefix("")), 5)
+        # Indeks posortowany jest przebudowywany po dodaniu książki.
+        self.catalog.add_record("Anna Karenina", 864)
+        self.assertEqual(self.catalog.find_title_prefix("An"), [0, 4, 5])
+
+    def test_author_lookup(self):
+        """Sprawdza indeks autor -> książki"""
+        self.assertEqual(self.catalog.find_author("George Orwell"), [0, 1, 4])
+        self.assertEqual(self.catalog.find_author("Neil Gaiman"), [3])
+        self.assertEqual(self.catalog.find_author("Unknown"), [])
+        with self.assertRaises(ValueError):
+            self.catalog.add_record("Nameless", 10, [""])
+
+    def test_page_range(self):
+        """Sprawdza zapytania o przedział liczby stron"""
+        self.assertEqual(self.catalog.find_page_range(100, 420), [0, 1, 3])
+        self.assertEqual(self.catalog.find_page_range(high=112), [4, 0])
+        self.assertEqual(self.catalog.find_page_range(low=413), [2])
+        self.assertEqual(self.catalog.find_page_range(500, 600), [])
+        self.assertEqual([b.page_count for b in self.catalog.books(self.catalog.find_page_range(300, 420))],
+                         [328, 412])
+
+    def test_bulk_load(self):
+        """Sprawdza ładowanie z plików CSV i JSON"""
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "books.csv")
+            with open(csv_path, "w", encoding="utf-8") as file:
+                file.write("title,page_count,authors\n"
+                           "Good Omens,412,Terry Pratchett;Neil Gaiman\n"
+                           "Anonymous,50,\n")
+            catalog = BookCatalog.from_csv(csv_path)
+            self.assertEqual(catalog[0].authors, ["Terry Pratchett", "Neil Gaiman"])
+            self.assertEqual(catalog[1].authors, [])
+            self.assertEqual(catalog.find_page_range(0, 100), [1])
+
+            json_path = os.path.join(directory, "books.json")
+            with open(json_path, "w", encoding="utf-8") as file:
+                json.dump([{"title": "Emma", "page_count": 474, "authors": ["Jane Austen"]}], file)
+            catalog = BookCatalog.from_json(json_path)
+            self.assertEqual(catalog.find_author("Jane Austen"), [0])
+
+
+if __name__ == '__main__':
+    unittest.main()
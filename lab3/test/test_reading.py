@@ -0,0 +1,49 @@
+import unittest
+from src.book import Book
+from src.catalog import BookCatalog
+from src.reading import np, reading_time_by_author, reading_times, schedule
+
+
+@unittest.skipIf(np is None, "NumPy nie jest zainstalowany")
+class TestReading(unittest.TestCase):
+    def setUp(self):
+        self.catalog = BookCatalog()
+        self.catalog.extend([
+            ("Animal Farm", 112, ["George Orwell"]),
+            ("Nineteen Eighty-Four", 328, ["George Orwell"]),
+            ("Pride and Prejudice", 432, ["Jane Austen"]),
+            ("Good Omens", 412, ["Terry Pratchett", "Neil Gaiman"]),
+        ])
+
+    def test_reading_times(self):
+        """Sprawdza zgodność z Book.calculate_reading_time i tempo wielu czytelników"""
+        self.assertEqual(reading_times(self.catalog).tolist(),
+                         [book.calculate_reading_time() for book in self.catalog])
+        self.assertEqual(reading_times([Book("Animal Farm", 112), 40]).tolist(), [56, 20])
+        per_reader = reading_times(self.catalog, [4, 8])
+        self.assertEqual(per_reader.shape, (2, 4))
+        self.assertEqual(per_reader[1].tolist(), [14, 41, 54, 51.5])
+        with self.assertRaises(ValueError):
+            reading_times(self.catalog, 0)
+
+    def test_by_author(self):
+        """Sprawdza sumowanie czasu czytania po autorach"""
+        totals = reading_time_by_author(self.catalog)
+        self.assertEqual(totals, {"George Orwell": 220, "Jane Austen": 216,
+                                  "Neil Gaiman": 206, "Terry Pratchett": 206})
+        self.assertEqual(reading_time_by_author(self.catalog, [2, 4])["Jane Austen"].tolist(), [216, 108])
+
+    def test_schedule(self):
+        """Sprawdza układanie planu czytania w budżecie czasu"""
+        # Najwięcej książek: najkrótsze, 112 + 328 stron w 250 godzin przy 2 str./h.
+        self.assertEqual(schedule(self.catalog, 250).tolist(), [0, 1])
+        self.assertEqual(schedule(self.catalog, 10).tolist(), [])
+        # Z ocenami plecak wybiera najcenniejszy zestaw mieszczący się w budżecie.
+        self.assertEqual(schedule(self.catalog, 450, values=[1, 1, 5, 4]).tolist(), [2, 3])
+        self.assertEqual(schedule(self.catalog, 300, values=[3, 1, 5, 4]).tolist(), [0, 2])
+        with self.assertRaises(ValueError):
+            schedule(self.catalog, -1)
+
+
+if __name__ == '__main__':
+    unittest.main()